@@ -0,0 +1,50 @@
+"""
+Benchmark: directory batch analysis in a process pool vs one process.
+
+Usage:
+    python bench_batch.py                  # 16 sheets of 20k rows
+    python bench_batch.py 32 50000         # sheets, rows per sheet
+
+Writes that many synthetic match sheets (.xlsx, since workbook parsing is
+where the time goes) to a temporary folder, then times analyze_directory
+with 1, 2, 4 workers and one per available core. Each run must give the
+same ranking as the one-worker run, which is the speedup's baseline.
+More workers than cores only adds process overhead.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from common import print_table, synthetic_frame, timed
+from fielding_batch import analyze_directory, available_cores
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+def main():
+    sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    cores = available_cores()
+    counts = sorted({1, 2, 4, cores})
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(sheets):
+            synthetic_frame(rows, players=50, seed=i).to_excel(Path(tmp) / f'match_{i:03d}.xlsx', index=False)
+
+        # Warm-up, so the baseline does not pay for first imports and a cold page cache.
+        analyze_directory(tmp, IPLFieldingAnalyzer.WEIGHTS, 1)
+        serial = None
+        for workers in counts:
+            report, secs = timed(analyze_directory, tmp, IPLFieldingAnalyzer.WEIGHTS, workers)
+            if serial is None:
+                serial, serial_secs = report, secs
+            assert report.ranking.equals(serial.ranking), f"{workers} workers ranked differently"
+            results.append((workers, f'{secs:.2f}', f'{sheets * rows / secs:,.0f}', f'{serial_secs / secs:.2f}x'))
+
+    print(f"{sheets} sheets x {rows:,} rows, {cores} core(s) available")
+    print_table(['workers', 'seconds', 'rows/s', 'speedup'], results)
+
+
+if __name__ == '__main__':
+    main()
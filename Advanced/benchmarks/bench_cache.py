@@ -0,0 +1,41 @@
+"""
+Benchmark: cold Excel parse vs warm memory-mapped cache load.
+
+Usage:
+    python bench_cache.py                # 10k and 100k rows
+    python bench_cache.py 10000 200000
+"""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_cache import ParsedFrameCache
+
+
+def parse(filepath, sheet_name):
+    return pd.read_excel(filepath, sheet_name=sheet_name)
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParsedFrameCache(Path(tmp) / 'cache')
+        for rows in parse_sizes([10_000, 100_000]):
+            workbook = Path(tmp) / f'fielding_{rows}.xlsx'
+            synthetic_frame(rows).to_excel(workbook, index=False)
+
+            cold, cold_secs = timed(cache.load, workbook, 0, parse)
+            warm, warm_secs = timed(cache.load, workbook, 0, parse)
+            assert cold.equals(warm), "cached frame differs from parsed frame"
+
+            results.append((f'{rows:,}', f'{cold_secs:.3f}', f'{warm_secs:.4f}',
+                            f'{cold_secs / warm_secs:,.0f}x'))
+
+    print_table(['rows', 'cold parse s', 'warm cache s', 'speedup'], results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: tallying ball-by-ball events into the Performance Matrix.
+
+Usage:
+    python bench_events.py                  # 50M events
+    python bench_events.py 1000000 10000000
+
+The log is generated and fed to EventTallies in CHUNK_EVENTS blocks (as
+it would arrive from Parquet row groups or per-match files), so the run
+also exercises incremental appends. Compared against a pandas groupby /
+unstack per event column and a plain Python loop over events (timed on
+LOOP_EVENTS and extrapolated).
+"""
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, print_table, run_isolated, timed
+from fielding_events import PICK_EVENTS, THROW_EVENTS, EventTallies
+from fielding_scoring import METRIC_COLUMNS
+
+CHUNK_EVENTS = 5_000_000
+PLAYERS = 10_000
+LOOP_EVENTS = 200_000
+
+PICK_LABELS = ['clean pick', 'fumble', 'catch', 'drop catch', 'stumping', 'good throw']
+THROW_LABELS = ['good throw', 'bad throw', 'direct hit', 'run out', 'missed run out', 'missed stumping']
+NAMES = [f'Player {i:05d}' for i in range(PLAYERS)]
+
+
+def make_events(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Player_Name': pd.Categorical.from_codes(rng.integers(0, PLAYERS, n, dtype=np.int32), NAMES),
+        # About a third of balls have no pick/throw outcome (code -1 = blank cell).
+        'Pick': pd.Categorical.from_codes(rng.integers(-1, len(PICK_LABELS), n, dtype=np.int8), PICK_LABELS),
+        'Throw': pd.Categorical.from_codes(rng.integers(-2, len(THROW_LABELS), n, dtype=np.int8).clip(-1),
+                                           THROW_LABELS),
+        'Runs': rng.integers(-2, 3, n, dtype=np.int8)
+    })
+
+
+def _chunks(total):
+    for seed, start in enumerate(range(0, total, CHUNK_EVENTS)):
+        yield make_events(min(CHUNK_EVENTS, total - start), seed)
+
+
+def with_tallies(total):
+    tallies = EventTallies()
+    secs = 0.0
+    for events in _chunks(total):
+        _, took = timed(tallies.add, events)
+        secs += took
+    return tallies.to_frame(), secs
+
+
+def with_groupby(total):
+    frame = None
+    secs = 0.0
+    for events in _chunks(total):
+        part, took = timed(_groupby_tally, events)
+        secs += took
+        frame = part if frame is None else frame.add(part, fill_value=0)
+    return frame, secs
+
+
+def _groupby_tally(events):
+    parts = []
+    for col, vocab in (('Pick', PICK_EVENTS), ('Throw', THROW_EVENTS)):
+        metric = events[col].map({k: v for k, v in vocab.items() if v}).astype(object)
+        counts = events.groupby([events['Player_Name'], metric], observed=True).size().unstack(fill_value=0)
+        parts.append(counts)
+    parts.append(events.groupby('Player_Name', observed=True)['Runs'].sum().rename('RS').to_frame())
+    out = pd.concat(parts, axis=1).T.groupby(level=0).sum().T
+    return out.reindex(columns=list(METRIC_COLUMNS), fill_value=0)
+
+
+def python_loop(events):
+    totals = {}
+    for name, pick, throw, runs in zip(events['Player_Name'], events['Pick'], events['Throw'], events['Runs']):
+        row = totals.setdefault(name, dict.fromkeys(METRIC_COLUMNS, 0))
+        for label, vocab in ((pick, PICK_EVENTS), (throw, THROW_EVENTS)):
+            if isinstance(label, str) and vocab[label]:
+                row[vocab[label]] += 1
+        row['RS'] += int(runs)
+    return totals
+
+
+def run(method, total):
+    frame, secs = method(total)
+    return frame.set_index('Player_Name') if 'Player_Name' in frame else frame, secs
+
+
+def main():
+    rows = []
+    for total in parse_sizes([50_000_000]):
+        (ours, tally_secs), _, tally_mb = run_isolated(run, with_tallies, total)
+        (theirs, groupby_secs), _, groupby_mb = run_isolated(run, with_groupby, total)
+        theirs.index = theirs.index.astype(str)
+        assert (ours.loc[theirs.index, list(METRIC_COLUMNS)].to_numpy() == theirs.to_numpy()).all(), \
+            "tallies differ"
+
+        sample = make_events(min(total, LOOP_EVENTS), 0)
+        _, loop_secs = timed(python_loop, sample)
+        loop_secs *= total / len(sample)
+
+        rows.append((f'{total:,}', f'{loop_secs:.1f}', f'{groupby_secs:.1f}', f'{groupby_mb:,.0f}',
+                     f'{tally_secs:.1f}', f'{tally_mb:,.0f}', f'{total / tally_secs / 1e6:.0f}M',
+                     f'{loop_secs / tally_secs:,.0f}x'))
+
+    print_table(['events', 'python loop s (est.)', 'groupby s', 'groupby peak MB', 'bincount s',
+                 'bincount peak MB', 'events/s', 'speedup vs loop'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: export time and peak memory per format.
+
+Usage:
+    python bench_export.py                  # 1M rows, every format
+    python bench_export.py 100000
+
+Each format is written in a fresh process so the reported peak RSS
+belongs to that writer alone. The 'baseline' row builds the frame without
+writing anything. 'legacy json' is the old df.to_dict('records') +
+json.dump(indent=2) path.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from common import parse_sizes, print_table, run_isolated, synthetic_frame
+from fielding_export import FORMATS, build_metadata, export_frame
+from fielding_schema import enforce_schema
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+def _frame(rows):
+    df = enforce_schema(synthetic_frame(rows))
+    df['PS'] = 0
+    return df
+
+
+def baseline(rows, folder):
+    _frame(rows)
+    return 0
+
+
+def legacy_json(rows, folder):
+    df = _frame(rows)
+    path = Path(folder) / 'legacy.json'
+    results = dict(build_metadata(IPLFieldingAnalyzer.WEIGHTS), players=df.to_dict('records'))
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    return path.stat().st_size
+
+
+def export_one(rows, folder, fmt):
+    df = _frame(rows)
+    paths = export_frame(df, IPLFieldingAnalyzer.WEIGHTS, Path(folder) / f'bench_{fmt}', (fmt,))
+    return paths[fmt].stat().st_size
+
+
+def main():
+    results = []
+    for rows in parse_sizes([1_000_000]):
+        with tempfile.TemporaryDirectory() as folder:
+            _, base_secs, base_peak = run_isolated(baseline, rows, folder)
+            results.append((f'{rows:,}', 'baseline', f'{base_secs:.2f}', '-', f'{base_peak:,.0f}', '-'))
+
+            runs = [('legacy json', legacy_json, (rows, folder))]
+            runs += [(fmt, export_one, (rows, folder, fmt)) for fmt in FORMATS]
+            for name, func, args in runs:
+                size, secs, peak = run_isolated(func, *args)
+                results.append((f'{rows:,}', name, f'{secs:.2f}', f'{secs - base_secs:.2f}',
+                                f'{peak:,.0f}', f'{size / 2**20:,.1f}'))
+
+    print_table(['rows', 'format', 'total s', 'write s', 'peak MB', 'file MB'], results)
+
+
+if __name__ == '__main__':
+    main()
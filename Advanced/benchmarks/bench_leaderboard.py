@@ -0,0 +1,67 @@
+"""
+Benchmark: incremental Leaderboard vs full recompute after every match.
+
+Usage:
+    python bench_leaderboard.py                 # 10k players
+    python bench_leaderboard.py 1000 100000
+
+Each "match" touches 22 random players; the full-recompute path re-sums
+and re-sorts every player's totals after each match, as analyze_players
+does today.
+"""
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, print_table, timed
+from fielding_leaderboard import Leaderboard
+from fielding_stream import rank_players
+
+MATCHES = 200
+PLAYERS_PER_MATCH = 22
+
+
+def make_matches(players, seed=7):
+    rng = np.random.default_rng(seed)
+    names = np.array([f'Player {i:06d}' for i in range(players)])
+    season = pd.DataFrame({'Player_Name': names, 'PS': rng.integers(-5, 30, players)})
+    matches = [
+        pd.DataFrame({'Player_Name': names[rng.choice(players, PLAYERS_PER_MATCH, replace=False)],
+                      'PS': rng.integers(-5, 15, PLAYERS_PER_MATCH)})
+        for _ in range(MATCHES)
+    ]
+    return season, matches
+
+
+def full_recompute(season, matches):
+    history = season
+    for match in matches:
+        history = pd.concat([history, match], ignore_index=True)
+        ranking = rank_players(history.groupby('Player_Name', sort=False)[['PS']].sum())
+    return ranking
+
+
+def main():
+    results = []
+    for players in parse_sizes([10_000]):
+        season, matches = make_matches(players)
+        expected, full_secs = timed(full_recompute, season, matches)
+        board = Leaderboard()
+        _, build_secs = timed(board.apply_match, season)
+        _, update_secs = timed(lambda: [board.apply_match(m) for m in matches])
+
+        got = board.to_frame()
+        assert got['Player_Name'].tolist() == expected['Player_Name'].tolist(), "rankings differ"
+        for player in expected['Player_Name'].sample(100, random_state=1):
+            assert board.rank(player) == expected.index[expected['Player_Name'] == player][0] + 1
+
+        results.append((f'{players:,}', MATCHES, f'{full_secs / MATCHES * 1000:.2f}',
+                        f'{build_secs:.3f}', f'{update_secs / MATCHES * 1000:.3f}',
+                        f'{full_secs / update_secs:,.0f}x'))
+
+    print_table(['players', 'matches', 'recompute ms/match', 'initial build s',
+                 'incremental ms/match', 'speedup'], results)
+
+
+if __name__ == '__main__':
+    main()
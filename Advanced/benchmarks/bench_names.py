@@ -0,0 +1,102 @@
+"""
+Benchmark: player-name resolution on 100k distinct names.
+
+Usage:
+    python bench_names.py                   # 100,000 names
+    python bench_names.py 10000 1000000
+
+Registers N synthetic distinct names, then resolves VARIANTS misspelled
+or re-cased copies of them (one edit or a case/spacing change each).
+Reports registration and lookup throughput, how many variants land on
+their original player, and how many distinct names were merged by
+mistake. Near matches are merged (merge_fuzzy=True), so the variant
+lookups are measured; by default they would only be suggested. The
+quadratic alternative (edit distance against every known name) is timed
+on QUADRATIC_QUERIES lookups and extrapolated.
+"""
+
+import random
+import string
+
+from common import parse_sizes, print_table, timed
+from fielding_names import PlayerRegistry, edit_distance, normalize_name
+
+VARIANTS = 20_000
+QUADRATIC_QUERIES = 20
+
+SYLLABLES = ['ka', 'ra', 'li', 'sh', 'an', 'de', 'vi', 'mo', 'ta', 'ne', 'ja', 'pu', 'ro', 'sa', 'hi', 'ku',
+             'ma', 'go', 'ba', 'el', 'in', 'ya', 'dh', 'ru', 'th', 'ol', 've', 'ch', 'ni', 'po']
+
+
+def make_names(n, seed=5):
+    rng = random.Random(seed)
+    names, keys = [], set()
+    while len(names) < n:
+        first = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        last = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))).capitalize()
+        name = f'{first} {last}'
+        if normalize_name(name) not in keys:
+            keys.add(normalize_name(name))
+            names.append(name)
+    return names
+
+
+def make_variants(names, n, seed=6):
+    rng = random.Random(seed)
+    variants = []
+    for _ in range(n):
+        index = rng.randrange(len(names))
+        name = names[index]
+        kind = rng.random()
+        if kind < 0.3:
+            variant = f'  {name.upper()} '
+        elif kind < 0.5:
+            variant = name.replace(' ', '   ').lower()
+        else:
+            pos = rng.randrange(len(name))
+            edit = rng.choice(('sub', 'del', 'ins'))
+            ch = rng.choice(string.ascii_lowercase)
+            if edit == 'sub':
+                variant = name[:pos] + ch + name[pos + 1:]
+            elif edit == 'del':
+                variant = name[:pos] + name[pos + 1:]
+            else:
+                variant = name[:pos] + ch + name[pos:]
+        variants.append((variant, index))
+    return variants
+
+
+def quadratic_lookup(keys, query):
+    key = normalize_name(query)
+    return min(keys, key=lambda known: edit_distance(key, known, 1))
+
+
+def main():
+    sizes = parse_sizes([100_000])
+    rows = []
+    for n in sizes:
+        names = make_names(n)
+        variants = make_variants(names, VARIANTS)
+
+        registry = PlayerRegistry(merge_fuzzy=True)
+        ids, register_secs = timed(lambda: [registry.resolve(name) for name in names])
+        merged = n - len(set(ids))
+
+        resolved, lookup_secs = timed(lambda: [registry.resolve(v) for v, _ in variants])
+        correct = sum(got == ids[index] for got, (_, index) in zip(resolved, variants))
+
+        keys = [normalize_name(name) for name in names]
+        _, quad_secs = timed(lambda: [quadratic_lookup(keys, v) for v, _ in variants[:QUADRATIC_QUERIES]])
+        quad_ms = quad_secs / QUADRATIC_QUERIES * 1000
+
+        rows.append((f'{n:,}', f'{n / register_secs:,.0f}', f'{merged:,}',
+                     f'{VARIANTS / lookup_secs:,.0f}', f'{correct / VARIANTS:.1%}',
+                     f'{lookup_secs / VARIANTS * 1000:.3f}', f'{quad_ms:,.0f}',
+                     f'{quad_ms / (lookup_secs / VARIANTS * 1000):,.0f}x'))
+
+    print_table(['names', 'register/s', 'merged by mistake', 'variant lookups/s', 'variants matched',
+                 'index ms/lookup', 'pairwise ms/lookup', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: column-wise report rendering vs the old iterrows writer.
+
+Usage:
+    python bench_report.py                  # 10k, 100k and 1M players
+    python bench_report.py 10000
+"""
+
+import tempfile
+from pathlib import Path
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_report import write_report
+from fielding_scoring import ScoringEngine
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+def legacy_report(df, path):
+    """Player section and insights as generate_report wrote them with iterrows."""
+    with open(path, 'w') as f:
+        for idx, row in df.iterrows():
+            f.write(f"{idx + 1}. {row['Player_Name']}\n")
+            f.write(f"   Performance Score: {row['PS']:.0f}\n")
+            f.write(f"   Catches: {row['C']}, Run Outs: {row['RO']}, Direct Hits: {row['DH']}\n")
+            f.write(f"   Runs Impact: {row['RS']:+.0f}\n\n")
+        best = df.iloc[0]
+        f.write(f"• Best Performer: {best['Player_Name']} (PS: {best['PS']:.0f})\n")
+        most_catches = df.loc[df['C'].idxmax()]
+        f.write(f"• Most Catches: {most_catches['Player_Name']} ({most_catches['C']:.0f} catches)\n")
+        if df['RO'].max() > 0:
+            most_runouts = df.loc[df['RO'].idxmax()]
+            f.write(f"• Most Run Outs: {most_runouts['Player_Name']} ({most_runouts['RO']:.0f} run outs)\n")
+
+
+def main():
+    weights = IPLFieldingAnalyzer.WEIGHTS
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for players in parse_sizes([10_000, 100_000, 1_000_000]):
+            df = synthetic_frame(players, players=players)
+            df['PS'] = ScoringEngine(weights).score(df)
+            df = df.sort_values('PS', ascending=False).reset_index(drop=True)
+
+            _, new_secs = timed(write_report, df, weights, Path(folder) / 'new.txt')
+            _, old_secs = timed(legacy_report, df, Path(folder) / 'old.txt')
+            results.append((f'{players:,}', f'{old_secs:.2f}', f'{new_secs:.2f}',
+                            f'{old_secs / new_secs:,.1f}x'))
+
+    print_table(['players', 'iterrows s', 'renderer s', 'speedup'], results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmark: memory of the default int64/object layout vs the fielding schema.
+
+Usage:
+    python bench_schema.py              # 10M rows
+    python bench_schema.py 1000000
+"""
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_schema import enforce_schema, memory_usage
+
+
+def main():
+    results = []
+    for rows in parse_sizes([10_000_000]):
+        df = synthetic_frame(rows)
+        before = memory_usage(df)
+        _, secs = timed(enforce_schema, df)
+        after = memory_usage(df)
+        results.append((f'{rows:,}', f'{before / 2**20:,.0f}', f'{after / 2**20:,.0f}',
+                        f'{1 - after / before:.1%}', f'{secs:.2f}'))
+        del df
+
+    print_table(['rows', 'default MB', 'schema MB', 'saved', 'enforce s'], results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: vectorized ScoringEngine vs the old row-wise df.apply path.
+
+Usage:
+    python bench_scoring.py                 # 10k, 1M and 10M rows
+    python bench_scoring.py 10000 1000000   # custom sizes
+
+The row-wise path runs at roughly the same rate at every size, so it is
+timed on at most ROWWISE_CAP rows and its throughput extrapolated.
+"""
+
+import numpy as np
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_scoring import ScoringEngine
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+ROWWISE_CAP = 50_000
+
+
+def rowwise_scores(df, weights):
+    """The pre-engine per-row formula, as it was applied via df.apply."""
+    def calculate(row):
+        return (
+            row['CP'] * weights['WCP'] + row['GT'] * weights['WGT'] +
+            row['C'] * weights['WC'] + row['DC'] * weights['WDC'] +
+            row['ST'] * weights['WST'] + row['RO'] * weights['WRO'] +
+            row['MRO'] * weights['WMRO'] + row['DH'] * weights['WDH'] +
+            row['RS']
+        )
+    return df.apply(calculate, axis=1).to_numpy()
+
+
+def main():
+    weights = IPLFieldingAnalyzer.WEIGHTS
+    engine = ScoringEngine(weights)
+    results = []
+
+    for rows in parse_sizes([10_000, 1_000_000, 10_000_000]):
+        df = synthetic_frame(rows)
+
+        scores, vec_secs = timed(engine.score, df)
+
+        sample = df.iloc[:min(rows, ROWWISE_CAP)]
+        slow, row_secs = timed(rowwise_scores, sample, weights)
+        assert np.array_equal(slow, scores[:len(sample)]), "row-wise and vectorized PS differ"
+        row_rate = len(sample) / row_secs
+
+        vec_rate = rows / vec_secs
+        results.append((f'{rows:,}', f'{vec_secs:.3f}', f'{vec_rate:,.0f}',
+                        f'{rows / row_rate:.1f}', f'{row_rate:,.0f}', f'{vec_rate / row_rate:,.0f}x'))
+        del df, scores
+
+    print_table(['rows', 'vector s', 'vector rows/s', 'row-wise s*', 'row-wise rows/s', 'speedup'], results)
+    print(f'* row-wise timed on up to {ROWWISE_CAP:,} rows and extrapolated')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Load test for the local HTTP scoring service.
+
+Usage:
+    python bench_server.py                  # 64 connections for 10 s
+    python bench_server.py 16 5             # connections, seconds
+
+Starts `ipl_fielding_analyzer.py serve` on a free port with a 10k-player
+season, then drives it with keep-alive clients sending a mix of /score
+(ROWS_PER_SCORE rows each), /top and /rank requests. Reports p50/p99
+latency, requests/sec and how many score requests shared each batch, and
+compares against shelling out to the CLI once per request.
+"""
+
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from common import parse_sizes, print_table, synthetic_frame
+from fielding_scoring import METRIC_COLUMNS
+from fielding_stream import player_totals, rank_players
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+ANALYZER = Path(__file__).resolve().parent.parent / 'ipl_fielding_analyzer.py'
+SEASON_PLAYERS = 10_000
+ROWS_PER_SCORE = 20
+SHELL_RUNS = 3
+
+
+def make_season(folder):
+    analyzer = IPLFieldingAnalyzer(quiet=True)
+    season = rank_players(player_totals(analyzer.score(synthetic_frame(SEASON_PLAYERS * 5, SEASON_PLAYERS))))
+    path = folder / 'season.csv'
+    season.drop(columns='PS').to_csv(path, index=False)
+    return path, season['Player_Name'].astype(str).tolist()
+
+
+def start_server(season_path, batch_delay):
+    proc = subprocess.Popen(
+        [sys.executable, str(ANALYZER), 'serve', str(season_path), '--no-cache', '--port', '0',
+         '--batch-delay', str(batch_delay), '--output-dir', str(season_path.parent)],
+        stdout=subprocess.PIPE, text=True
+    )
+    for line in proc.stdout:
+        if line.startswith('[OK] Serving'):
+            return proc, int(line.rsplit(':', 1)[1])
+    raise RuntimeError('server did not start')
+
+
+async def request(reader, writer, method, target, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(f'{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n'.encode()
+                 + body)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+    data = await reader.readexactly(length)
+    if not head.startswith(b'HTTP/1.1 200'):
+        raise RuntimeError(data.decode())
+    return json.loads(data)
+
+
+async def client(port, deadline, names, latencies, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    rows = [{col: rng.randint(0, 3) for col in METRIC_COLUMNS} for _ in range(ROWS_PER_SCORE)]
+    while time.perf_counter() < deadline:
+        kind = rng.random()
+        start = time.perf_counter()
+        if kind < 0.7:
+            await request(reader, writer, 'POST', '/score', {'rows': rows})
+        elif kind < 0.9:
+            await request(reader, writer, 'GET', '/top?k=10')
+        else:
+            await request(reader, writer, 'GET', '/rank?player=' + rng.choice(names).replace(' ', '%20'))
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(port, connections, seconds, names):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, deadline, names, latencies, i) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    stats = await request(reader, writer, 'GET', '/stats')
+    writer.close()
+    return np.array(latencies), elapsed, stats
+
+
+def shell_out(season_path):
+    start = time.perf_counter()
+    for _ in range(SHELL_RUNS):
+        subprocess.run([sys.executable, str(ANALYZER), '-q', 'rank', str(season_path), '--no-cache', '--top', '10',
+                        '--output-dir', str(season_path.parent)], check=True, capture_output=True)
+    return (time.perf_counter() - start) / SHELL_RUNS
+
+
+def main():
+    sizes = parse_sizes([64, 10])
+    connections, seconds = sizes[0], sizes[1] if len(sizes) > 1 else 10
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        season_path, names = make_season(Path(tmp))
+        for batch_delay in (0.0, 0.001):
+            proc, port = start_server(season_path, batch_delay)
+            try:
+                latencies, elapsed, stats = asyncio.run(load(port, connections, seconds, names))
+            finally:
+                proc.terminate()
+                proc.wait()
+            rows.append((f'server (batch delay {batch_delay * 1000:g} ms)', connections, f'{len(latencies):,}',
+                         f'{np.percentile(latencies, 50) * 1000:.2f}', f'{np.percentile(latencies, 99) * 1000:.2f}',
+                         f'{len(latencies) / elapsed:,.0f}', f"{stats['mean_batch']:.1f}"))
+        shell_secs = shell_out(season_path)
+        rows.append(('shell out per request', 1, SHELL_RUNS, f'{shell_secs * 1000:.0f}', '-',
+                     f'{1 / shell_secs:.1f}', '-'))
+
+    print_table(['mode', 'connections', 'requests', 'p50 ms', 'p99 ms', 'req/s', 'score reqs per batch'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: import time and cold-start latency of the fielding analyzer.
+
+Usage:
+    python bench_startup.py            # exits 1 if a budget is exceeded
+
+Every measurement starts a fresh interpreter, so it includes Python
+start-up. The import check also fails if pandas, NumPy, openpyxl or
+pyarrow get pulled in by a plain 'import ipl_fielding_analyzer'.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from common import print_table
+
+ADVANCED = Path(__file__).resolve().parent.parent
+ANALYZER = ADVANCED / 'ipl_fielding_analyzer.py'
+SAMPLE = ADVANCED / 'sample_ipl_data.xlsx'
+
+REPEATS = 5
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'pyarrow')
+
+# Median wall-clock budgets in milliseconds; raise deliberately, never silently.
+BUDGETS_MS = {
+    'python -c pass': None,
+    'import analyzer': 150,
+    '--help': 250,
+    'score (cold)': None
+}
+
+IMPORT_CHECK = (
+    "import sys; import ipl_fielding_analyzer; "
+    f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+
+
+def median_ms(cmd):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ADVANCED, check=True, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    cases = {
+        'python -c pass': [sys.executable, '-c', 'pass'],
+        'import analyzer': [sys.executable, '-c', 'import ipl_fielding_analyzer'],
+        '--help': [sys.executable, str(ANALYZER), '--help'],
+        'score (cold)': [sys.executable, str(ANALYZER), '-q', '--no-cache', 'score', str(SAMPLE)]
+    }
+
+    failed = False
+    rows = []
+    for name, cmd in cases.items():
+        ms = median_ms(cmd)
+        budget = BUDGETS_MS[name]
+        status = '-' if budget is None else ('OK' if ms <= budget else 'OVER BUDGET')
+        failed |= status == 'OVER BUDGET'
+        rows.append((name, f'{ms:.0f}', budget or '-', status))
+    print_table(['case', 'median ms', 'budget ms', 'status'], rows)
+
+    heavy = subprocess.run([sys.executable, '-c', IMPORT_CHECK], cwd=ADVANCED,
+                           check=True, capture_output=True, text=True).stdout.strip()
+    if heavy:
+        print(f'\nFAIL: importing the analyzer loaded {heavy}')
+        failed = True
+    else:
+        print('\nImporting the analyzer loads none of: ' + ', '.join(HEAVY_MODULES))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
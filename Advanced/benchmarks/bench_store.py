@@ -0,0 +1,85 @@
+"""
+Benchmark: player history from the results store vs re-reading JSON exports.
+
+Usage:
+    python bench_store.py                   # 500 runs of 2,000 players
+    python bench_store.py 100 1000
+
+Writes RUNS JSON exports (the current export layout) to a temp folder,
+then answers "PS of one player across all runs" by parsing every file,
+and again from the SQLite store after a one-off import.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_export import build_metadata, write_json
+from fielding_store import ResultsStore
+from fielding_stream import player_totals, rank_players
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+QUERIES = 20
+
+
+def write_exports(folder, runs, players):
+    analyzer = IPLFieldingAnalyzer(quiet=True)
+    ranking = rank_players(player_totals(analyzer.score(synthetic_frame(players * 5, players))))
+    rng = np.random.default_rng(0)
+    paths = []
+    for run in range(runs):
+        ranking['PS'] = ranking['PS'] + rng.integers(-2, 3, len(ranking))
+        path = folder / f'ipl_fielding_analysis_{run:05d}.json'
+        metadata = build_metadata(analyzer.weights)
+        metadata['analysis_date'] = f'2026-01-01T00:00:00.{run:06d}'
+        write_json(ranking, path, metadata)
+        paths.append(path)
+    return paths, ranking['Player_Name'].astype(str).sample(QUERIES, random_state=1).tolist()
+
+
+def history_from_files(paths, player):
+    history = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        for record in data['players']:
+            if record['Player_Name'] == player:
+                history.append((data['analysis_date'], record['PS']))
+    return history
+
+
+def main():
+    sizes = parse_sizes([500, 2000])
+    runs, players = sizes[0], sizes[1] if len(sizes) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        paths, names = write_exports(folder, runs, players)
+        export_mb = sum(p.stat().st_size for p in paths) / 2**20
+
+        _, file_secs = timed(lambda: [history_from_files(paths, name) for name in names[:2]])
+        file_secs /= 2
+
+        with ResultsStore(folder / 'results.sqlite') as store:
+            _, import_secs = timed(store.import_json_exports, paths)
+            _, query_secs = timed(lambda: [store.player_history(name) for name in names])
+            query_secs /= len(names)
+            got = store.player_history(names[0])
+            expected = history_from_files(paths, names[0])
+            assert got['PS'].tolist() == [ps for _, ps in expected], "histories differ"
+            plan = store.conn.execute('EXPLAIN QUERY PLAN SELECT * FROM results WHERE player = ? '
+                                      'ORDER BY run_at', (names[0],)).fetchall()
+        db_mb = (folder / 'results.sqlite').stat().st_size / 2**20
+
+    print(f"query plan: {plan[-1][-1]}")
+    print_table(['runs', 'players', 'exports MB', 'store MB', 'one-off import s',
+                 're-read exports ms/query', 'store ms/query', 'speedup'],
+                [(f'{runs:,}', f'{players:,}', f'{export_mb:.0f}', f'{db_mb:.0f}', f'{import_secs:.1f}',
+                  f'{file_secs * 1000:,.0f}', f'{query_secs * 1000:.2f}', f'{file_secs / query_secs:,.0f}x')])
+
+
+if __name__ == '__main__':
+    main()
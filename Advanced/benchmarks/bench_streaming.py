@@ -0,0 +1,53 @@
+"""
+Benchmark: peak memory of streaming ingest vs loading the whole file.
+
+Usage:
+    python bench_streaming.py                  # 100k, 1M and 5M rows
+    python bench_streaming.py 100000 1000000
+
+Each measurement runs in a fresh process so ru_maxrss reflects only that
+load. Inputs are written as CSV to a temporary folder.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from common import parse_sizes, print_table, run_isolated, synthetic_frame
+from fielding_scoring import ScoringEngine
+from fielding_stream import player_totals, rank_players, stream_rankings
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+def in_memory(path):
+    df = pd.read_csv(path)
+    df['PS'] = ScoringEngine(IPLFieldingAnalyzer.WEIGHTS).score(df)
+    return rank_players(player_totals(df))['Player_Name'].tolist()
+
+
+def streaming(path):
+    ranking, _ = stream_rankings(path, ScoringEngine(IPLFieldingAnalyzer.WEIGHTS))
+    return ranking['Player_Name'].tolist()
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in parse_sizes([100_000, 1_000_000, 5_000_000]):
+            path = Path(tmp) / f'events_{rows}.csv'
+            synthetic_frame(rows).to_csv(path, index=False)
+
+            mem_order, mem_secs, mem_peak = run_isolated(in_memory, path)
+            str_order, str_secs, str_peak = run_isolated(streaming, path)
+            assert mem_order == str_order, "streaming ranking differs from in-memory ranking"
+
+            results.append((f'{rows:,}', f'{mem_secs:.2f}', f'{mem_peak:,.0f}',
+                            f'{str_secs:.2f}', f'{str_peak:,.0f}'))
+            path.unlink()
+
+    print_table(['rows', 'in-memory s', 'in-memory MB', 'streaming s', 'streaming MB'], results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: weight sensitivity sweep vs scoring one configuration at a time.
+
+Usage:
+    python bench_sweep.py                   # 10k players × 10k configurations
+    python bench_sweep.py 1000 5000
+
+The sweep scores every configuration with chunked matrix-matrix products
+and keeps only running per-player statistics; the baseline loops over
+configurations, scoring and ranking with one matrix-vector product each
+and updating the same per-player statistics (Kendall tau is extra work
+only the sweep does, reported in its own row).
+The loop is timed on at most LOOP_CONFIGS configurations and extrapolated.
+"""
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, print_table, run_isolated, timed
+from fielding_scoring import METRIC_COLUMNS
+from fielding_sweep import random_configs, sweep, weight_matrix
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+LOOP_CONFIGS = 500
+
+
+def make_players(players, seed=3):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({col: rng.integers(0, 40, players) for col in METRIC_COLUMNS})
+    df['RS'] = rng.integers(-60, 60, players)
+    df.insert(0, 'Player_Name', [f'Player {i:06d}' for i in range(players)])
+    return df
+
+
+def one_at_a_time(df, configs):
+    X = df[list(METRIC_COLUMNS)].to_numpy(dtype=np.float64)
+    W = weight_matrix(configs)
+    top = np.zeros(len(X), dtype=np.int64)
+    rank_sum = np.zeros(len(X))
+    best = np.full(len(X), len(X))
+    for j in range(W.shape[1]):
+        ranks = pd.Series(X @ W[:, j]).rank(method='min', ascending=False).to_numpy()
+        top += ranks <= 10
+        rank_sum += ranks
+        best = np.minimum(best, ranks)
+    return top
+
+
+def run_sweep(players, configs, kendall):
+    df = make_players(players)
+    grid = random_configs(IPLFieldingAnalyzer.WEIGHTS, configs, seed=11)
+    _, secs = timed(sweep, df, IPLFieldingAnalyzer.WEIGHTS, grid, 10, kendall)
+    return secs
+
+
+def main():
+    sizes = parse_sizes([10_000, 10_000])
+    players, configs = sizes[0], sizes[1] if len(sizes) > 1 else sizes[0]
+
+    df = make_players(players)
+    grid = random_configs(IPLFieldingAnalyzer.WEIGHTS, configs, seed=11)
+    result = sweep(df, IPLFieldingAnalyzer.WEIGHTS, grid.head(LOOP_CONFIGS), top_k=10, kendall=False)
+    expected = one_at_a_time(df, grid.head(LOOP_CONFIGS))
+    got = result.players.set_index('Player_Name').loc[df['Player_Name'], 'Top10_Freq'].to_numpy()
+    assert np.allclose(got * min(configs, LOOP_CONFIGS), expected), "top-K frequencies differ"
+
+    loop_n = min(configs, LOOP_CONFIGS)
+    _, loop_secs = timed(one_at_a_time, df, grid.head(loop_n))
+    loop_secs *= configs / loop_n
+
+    rows = []
+    for kendall in (False, True):
+        secs, _, peak_mb = run_isolated(run_sweep, players, configs, kendall)
+        rows.append((f'{players:,}', f'{configs:,}', 'yes' if kendall else 'no', f'{loop_secs:.1f}',
+                     f'{secs:.1f}', f'{peak_mb:,.0f}', f'{loop_secs / secs:.1f}x'))
+
+    print_table(['players', 'configs', 'kendall', 'one-at-a-time s (est.)', 'sweep s',
+                 'sweep peak MB', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: cost of the stage tracer per traced call.
+
+Usage:
+    python bench_trace.py                   # best of 5 x 200,000 calls
+    python bench_trace.py 1000000
+
+The tracer's own cost is measured on a traced no-op method (so pandas
+noise does not hide it) and set against one IPLFieldingAnalyzer.score()
+call on a 100-row frame, the cheapest stage the analyzer traces.
+"""
+
+import tempfile
+
+from common import parse_sizes, print_table, synthetic_frame, timed
+from fielding_trace import Tracer, traced
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+REPEATS = 5
+FRAME_ROWS = 100
+PROFILE_CALLS = 20_000
+
+
+class Probe:
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    @traced('noop')
+    def noop(self):
+        return None
+
+
+def best_of(func, n):
+    """Fastest of REPEATS runs of n calls, in microseconds per call."""
+    def run():
+        for _ in range(n):
+            func()
+    return min(timed(run)[1] for _ in range(REPEATS)) / n * 1e6
+
+
+def main():
+    n = parse_sizes([200_000])[0]
+
+    analyzer = IPLFieldingAnalyzer(quiet=True)
+    df = synthetic_frame(FRAME_ROWS, players=20)
+    score_us = best_of(lambda: analyzer.score(df), 2_000)
+
+    raw = Probe.noop.__wrapped__
+    probe = Probe(Tracer())
+    base_us = best_of(lambda: raw(probe), n)
+    off_us = best_of(probe.noop, n)
+    probe.tracer = Tracer(enabled=True)
+    on_us = best_of(probe.noop, n)
+    with tempfile.TemporaryDirectory() as tmp:
+        probe.tracer = Tracer(profile_dir=tmp)
+        prof_us = best_of(probe.noop, PROFILE_CALLS // REPEATS)
+
+    rows = [(label, f'{us - base_us:.2f}', f'{(us - base_us) / score_us * 100:.3f}%')
+            for label, us in (('tracing off', off_us), ('tracing on', on_us), ('tracing + cProfile', prof_us))]
+    print(f"score() on {FRAME_ROWS} rows: {score_us:.0f} us/call")
+    print_table(['mode', 'overhead us/call', 'of one score() call'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Shared helpers for the fielding analyzer benchmarks.
+
+Each benchmark is a plain script run from this folder, e.g.:
+    python bench_scoring.py 10000 1000000
+"""
+
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Make the analyzer modules in Advanced/ importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fielding_scoring import METRIC_COLUMNS  # noqa: E402
+from fielding_trace import peak_rss_mb  # noqa: E402
+
+
+def synthetic_frame(rows, players=1000, seed=42):
+    """Build a Performance Matrix-shaped frame with random per-event counts."""
+    rng = np.random.default_rng(seed)
+    data = {'Player_Name': pd.Categorical.from_codes(
+        rng.integers(0, players, rows), [f'Player {i}' for i in range(players)]
+    ).astype(object)}
+    for col in METRIC_COLUMNS[:-1]:
+        data[col] = rng.integers(0, 3, rows)
+    data['RS'] = rng.integers(-3, 4, rows)
+    return pd.DataFrame(data)
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _isolated_child(func, args, queue):
+    result, secs = timed(func, *args)
+    peak_mb = peak_rss_mb()
+    queue.put((result, secs, peak_mb))
+
+
+def run_isolated(func, *args):
+    """
+    Run func(*args) in a fresh process and return (result, seconds, peak RSS MB).
+    
+    func and its result must be picklable; the peak covers only this call.
+    """
+    queue = mp.Queue()
+    proc = mp.Process(target=_isolated_child, args=(func, args, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def parse_sizes(default):
+    """Read row counts from argv, falling back to the given defaults."""
+    return [int(arg) for arg in sys.argv[1:]] or default
+
+
+def print_table(headers, rows):
+    """Print a fixed-width results table."""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = '  '.join(str(h).rjust(w) for h, w in zip(headers, widths))
+    print(line)
+    print('-' * len(line))
+    for r in rows:
+        print('  '.join(str(v).rjust(w) for v, w in zip(r, widths)))
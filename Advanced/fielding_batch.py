@@ -0,0 +1,178 @@
+"""
+Parallel batch analysis of a directory of per-match fielding sheets.
+
+Every workbook under a directory is parsed and scored in its own worker
+process; each worker sends back only its per-player totals, which are
+merged into one season ranking. Files that are not Performance Matrix
+sheets but ball-by-ball event logs (see fielding_events) are tallied into
+a matrix first.
+"""
+
+import fnmatch
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from fielding_events import EventTallies, read_events
+from fielding_export import PARQUET_METADATA_KEY, WEIGHTS_SHEET
+from fielding_schema import SchemaError, enforce_schema
+from fielding_scoring import ScoringEngine
+from fielding_stream import TOTAL_COLUMNS, player_totals, rank_players, stream_rankings
+
+INPUT_PATTERNS = ('*.xlsx', '*.xlsm', '*.csv', '*.parquet')
+
+# Folders never scanned: the analyzer's own output (exports are already ranked).
+EXCLUDED_DIRS = ('cricket_analysis',)
+
+# Exports saved elsewhere, by their default file names; renamed Excel and
+# Parquet exports are recognised by the weights they carry (see is_export).
+EXPORT_PATTERNS = ('ipl_fielding_analysis_*', 'fielding_analysis_*')
+
+
+def available_cores():
+    """Number of CPU cores this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def discover_inputs(directory):
+    """Return every match sheet under directory, sorted by path."""
+    files = set()
+    for pattern in INPUT_PATTERNS:
+        for path in Path(directory).rglob(pattern):
+            if path.name.startswith('~$') or any(part in EXCLUDED_DIRS for part in path.parts):
+                continue
+            if any(fnmatch.fnmatch(path.name, export) for export in EXPORT_PATTERNS):
+                continue
+            files.add(path)
+    return sorted(files)
+
+
+def is_export(filepath):
+    """True for a file written by the analyzer: its rankings are totals already, not match rows."""
+    suffix = Path(filepath).suffix.lower()
+    if suffix == '.parquet':
+        import pyarrow.parquet as pq
+
+        return PARQUET_METADATA_KEY in (pq.read_schema(filepath).metadata or {})
+    if suffix not in ('.xlsx', '.xlsm'):
+        return False
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filepath, read_only=True)
+    try:
+        return WEIGHTS_SHEET in wb.sheetnames
+    finally:
+        wb.close()
+
+
+def score_events(filepath, engine):
+    """Tally an event log into a Performance Matrix; returns (per-player totals, events)."""
+    tallies = EventTallies().add(read_events(filepath))
+    df = enforce_schema(tallies.to_frame())
+    df['PS'] = engine.score(df)
+    return player_totals(df), tallies.events
+
+
+def score_file(filepath, weights):
+    """
+    Worker: score one file and return its per-player totals.
+
+    Returns (filepath, kind, totals or None, rows, seconds, error message or
+    None); kind is 'sheet' or 'events' (rows are then events). A file
+    that is not a Performance Matrix is tried as an event log. Any failure
+    (a schema error, a corrupt workbook, ...) skips just this file, so one
+    bad sheet cannot stop the batch.
+    """
+    start = time.perf_counter()
+    engine = ScoringEngine(weights)
+    try:
+        if is_export(filepath):
+            return filepath, 'sheet', None, 0, time.perf_counter() - start, 'analyzer export, already ranked'
+        try:
+            _, running = stream_rankings(filepath, engine)
+        except SchemaError as e:
+            try:
+                totals, events = score_events(filepath, engine)
+            except SchemaError:
+                # Neither layout: report why it is not a match sheet.
+                raise e from None
+            return filepath, 'events', totals, events, time.perf_counter() - start, None
+    except SchemaError as e:
+        return filepath, 'sheet', None, 0, time.perf_counter() - start, str(e)
+    except Exception as e:
+        return filepath, 'sheet', None, 0, time.perf_counter() - start, f'{type(e).__name__}: {e}'
+    return filepath, 'sheet', running.totals, running.rows, time.perf_counter() - start, None
+
+
+class BatchReport:
+    """Outcome of a batch run: season ranking plus per-file timings."""
+
+    def __init__(self, ranking, files, wall_seconds, workers):
+        self.ranking = ranking
+        self.files = files            # [(path, kind, rows, seconds, error)]
+        self.wall_seconds = wall_seconds
+        self.workers = workers
+        self.serial_seconds = None
+
+    @property
+    def speedup(self):
+        if self.serial_seconds is None:
+            return None
+        return self.serial_seconds / self.wall_seconds
+
+    def summary(self):
+        """Return a printable per-file timing table."""
+        lines = [f"{'File':<50} {'Rows':>10} {'Seconds':>9}  Status", '-' * 80]
+        for path, kind, rows, secs, error in self.files:
+            if error is not None:
+                status = f'SKIPPED ({error})'
+            else:
+                status = 'OK (event log)' if kind == 'events' else 'OK'
+            lines.append(f"{str(path)[-50:]:<50} {rows:>10} {secs:>9.3f}  {status}")
+        lines.append('-' * 80)
+        lines.append(f"{len(self.files)} files, {self.workers} workers, {self.wall_seconds:.3f}s wall")
+        if self.serial_seconds is not None:
+            lines.append(f"Serial run: {self.serial_seconds:.3f}s  (speedup {self.speedup:.2f}x)")
+        return '\n'.join(lines)
+
+
+def merge_totals(partials):
+    """Merge per-file player totals into one season ranking."""
+    partials = [p for p in partials if p is not None]
+    if not partials:
+        return pd.DataFrame(columns=['Player_Name'] + TOTAL_COLUMNS)
+    merged = pd.concat(partials)
+    merged.index = merged.index.astype(str)
+    return rank_players(merged.groupby(level=0, sort=False).sum())
+
+
+def _run(files, weights, workers):
+    start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(score_file, files, [weights] * len(files)))
+    else:
+        results = [score_file(path, weights) for path in files]
+    return results, time.perf_counter() - start
+
+
+def analyze_directory(directory, weights, workers=None, compare_serial=False):
+    """Score every sheet under directory in a process pool and return a BatchReport."""
+    files = discover_inputs(directory)
+    workers = min(workers or available_cores(), max(len(files), 1))
+
+    results, wall = _run(files, weights, workers)
+    report = BatchReport(
+        merge_totals([totals for _, _, totals, _, _, _ in results]),
+        [(path, kind, rows, secs, error) for path, kind, _, rows, secs, error in results],
+        wall,
+        workers
+    )
+    if compare_serial:
+        _, report.serial_seconds = _run(files, weights, 1)
+    return report
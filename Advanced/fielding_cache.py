@@ -0,0 +1,184 @@
+"""
+On-disk columnar cache of parsed fielding inputs.
+
+Parsing a workbook with pd.read_excel is the slowest step of a run. The
+parsed frame is stored once as an Arrow IPC file keyed by the SHA-256 of
+the source file plus the sheet name; warm runs memory-map that file
+instead of opening the workbook again.
+
+The cached frame is the parser's output, so it goes stale when the
+parser or the schema it enforces changes, not just when the file does.
+`version` names the parser: entries written under another version are
+misses, and are replaced when the file is parsed again.
+
+    cache = ParsedFrameCache('cricket_analysis/cache', max_bytes=512 * 2**20, version='schema-2')
+    df = cache.load('IPL sample data.xlsx', 0, pd.read_excel)
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# pyarrow is optional; without it the analyzer simply parses every time.
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+DEFAULT_MAX_BYTES = 1024 * 2**20   # 1 GiB
+HASH_CHUNK = 8 * 2**20
+
+
+def file_digest(filepath):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _as_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return None if pd.isna(value) else str(value)
+
+
+def coerce_for_arrow(df):
+    """Arrow-friendly copy of df: mixed cells in object columns become strings (df is left as is)."""
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(_as_text)
+    df.columns = [str(c) for c in df.columns]
+    return df
+
+
+class ParsedFrameCache:
+    """
+    Content-addressed Arrow IPC cache with LRU eviction.
+
+    index.json tracks each entry's source path, sheet, parser version,
+    size on disk, last access time and the source file's (size, mtime) so
+    an unchanged file does not even need re-hashing.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, version=''):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.version = str(version)
+        self.index_file = self.cache_dir / 'index.json'
+        self.hits = 0
+        self.misses = 0
+
+    def _read_index(self):
+        try:
+            with open(self.index_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_file.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_file)
+
+    def _key(self, filepath, sheet_name, index):
+        """Return the cache key, reusing the stored hash if the file is untouched."""
+        stat = os.stat(filepath)
+        source = str(Path(filepath).resolve())
+        for key, entry in index.items():
+            if (entry['source'] == source and entry['sheet'] == str(sheet_name)
+                    and entry.get('version', '') == self.version
+                    and entry['source_size'] == stat.st_size
+                    and entry['source_mtime'] == stat.st_mtime_ns):
+                return key, source, stat
+        sheet_tag = hashlib.sha1(f'{sheet_name}\0{self.version}'.encode()).hexdigest()[:12]
+        return f'{file_digest(filepath)}-{sheet_tag}', source, stat
+
+    def load(self, filepath, sheet_name, parse):
+        """Return the cached frame for (filepath, sheet_name), calling parse(filepath, sheet_name) on a miss."""
+        index = self._read_index()
+        key, source, stat = self._key(filepath, sheet_name, index)
+        entry_file = self.cache_dir / f'{key}.arrow'
+
+        if key in index and entry_file.exists():
+            self.hits += 1
+            # A touched or copied file with the same content: remember its stat so it is not hashed again.
+            index[key].update(source=source, source_size=stat.st_size, source_mtime=stat.st_mtime_ns,
+                              last_used=time.time())
+            self._write_index(index)
+            return self._read_arrow(entry_file)
+
+        self.misses += 1
+        parsed = parse(filepath, sheet_name)
+        # Return the coerced frame, so a cold run gives what warm runs will read back.
+        df = coerce_for_arrow(parsed)
+        try:
+            self._write_arrow(df, entry_file)
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            print(f"[WARN] Not caching {filepath}: {e}")
+            return parsed
+
+        # A changed source or parser version replaces the old entry instead of waiting for eviction.
+        stale = [k for k, e in index.items()
+                 if k != key and e['source'] == source and e['sheet'] == str(sheet_name)]
+        for old_key in stale:
+            self._remove(old_key, index)
+
+        index[key] = {
+            'source': source,
+            'sheet': str(sheet_name),
+            'version': self.version,
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime_ns,
+            'bytes': entry_file.stat().st_size,
+            'last_used': time.time()
+        }
+        self._evict(index, keep=key)
+        self._write_index(index)
+        return df
+
+    def _write_arrow(self, df, entry_file):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp = entry_file.with_suffix('.tmp')
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, entry_file)
+
+    def _read_arrow(self, entry_file):
+        """Memory-map an IPC file; numeric columns are used without copying."""
+        source = pa.memory_map(str(entry_file), 'r')
+        table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def _remove(self, key, index):
+        (self.cache_dir / f'{key}.arrow').unlink(missing_ok=True)
+        index.pop(key, None)
+
+    def _evict(self, index, keep=None):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        total = sum(e['bytes'] for e in index.values())
+        for key in sorted(index, key=lambda k: index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index[key]['bytes']
+            self._remove(key, index)
+
+    def clear(self):
+        """Remove every cached entry."""
+        index = self._read_index()
+        for key in list(index):
+            self._remove(key, index)
+        self._write_index(index)
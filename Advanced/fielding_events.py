@@ -0,0 +1,205 @@
+"""
+Ball-by-ball event ingestion: event logs -> Performance Matrix.
+
+Each event row names a fielder and what happened on the ball (a Pick
+and/or Throw outcome, or a single Event label) plus the runs saved or
+conceded. Tallying is one np.bincount over player_code * n_metrics +
+metric_code, so no Python loop runs per event; only the handful of
+distinct labels and player names are looked at individually.
+
+    tallies = EventTallies()
+    tallies.add(first_innings)          # any number of appends
+    tallies.add(second_innings)
+    matrix = tallies.to_frame()         # Player_Name + CP, GT, C, ... RS
+
+Both event sheets in this folder are understood: the coded raw sheet
+(Y/N/C/DC/S picks, Y/N/DH/RO/MR throws) and the labelled one ('clean
+pick', 'run out', ...).
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fielding_schema import MAX_REPORTED_ROWS, SchemaError
+from fielding_scoring import METRIC_COLUMNS
+
+COUNT_COLUMNS = METRIC_COLUMNS[:-1]          # everything tallied by counting events
+METRIC_INDEX = {col: i for i, col in enumerate(COUNT_COLUMNS)}
+
+# Outcome labels (lower-cased) per event column -> metric, or None for
+# outcomes that exist but do not score (fumbles, bad throws, ...).
+PICK_EVENTS = {
+    'y': 'CP', 'clean pick': 'CP',
+    'n': None, 'fumble': None,
+    'c': 'C', 'catch': 'C',
+    'dc': 'DC', 'drop catch': 'DC', 'dropped catch': 'DC',
+    's': 'ST', 'stumping': 'ST',
+    'good throw': 'GT'
+}
+THROW_EVENTS = {
+    'y': 'GT', 'good throw': 'GT',
+    'n': None, 'bad throw': None,
+    'dh': 'DH', 'direct hit': 'DH',
+    'ro': 'RO', 'run out': 'RO',
+    'mr': 'MRO', 'mro': 'MRO', 'missed run out': 'MRO', 'missed runout': 'MRO',
+    'stumping': 'ST', 'missed stumping': None
+}
+# A single Event column takes any unambiguous label from either vocabulary.
+EVENT_LABELS = {**{k: v for k, v in PICK_EVENTS.items() if k not in ('y', 'n')},
+                **{k: v for k, v in THROW_EVENTS.items() if k not in ('y', 'n')}}
+
+EVENT_VOCABULARIES = {'Pick': PICK_EVENTS, 'Throw': THROW_EVENTS, 'Event': EVENT_LABELS}
+
+RUNS_COLUMN = 'Runs'
+
+# Header spellings used by the raw scorer's sheet.
+RAW_HEADERS = {
+    'Match No.': 'Match_No',
+    'Teams': 'Team',
+    'Player Name': 'Player_Name',
+    'BallCount': 'Ballcount'
+}
+
+
+def normalize_events(events):
+    """Rename raw-sheet headers and drop rows without a fielder (e.g. blank balls)."""
+    events = events.rename(columns=RAW_HEADERS)
+    if 'Player_Name' not in events.columns:
+        raise SchemaError("Event log has no 'Player_Name' (or 'Player Name') column")
+    names = events['Player_Name']
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Compare codes only; categorical logs are expected to be clean already.
+        keep = names.notna() & ~names.isin([''])
+    else:
+        names = names.str.strip()
+        events = events.assign(Player_Name=names)
+        keep = names.notna() & (names != '')
+    return events if keep.all() else events[keep]
+
+
+def read_events(filepath, sheet_name=0):
+    """
+    Read an event log from .xlsx/.csv/.parquet.
+
+    Excel sheets may carry a legend above the table and notes below it
+    (as the raw scorer's sheet does); the header row is found by looking
+    for the player column.
+    """
+    suffix = Path(filepath).suffix.lower()
+    if suffix == '.csv':
+        events = pd.read_csv(filepath)
+    elif suffix == '.parquet':
+        events = pd.read_parquet(filepath)
+    elif suffix in ('.xlsx', '.xlsm', '.xls'):
+        events = pd.read_excel(filepath, sheet_name=sheet_name, header=None)
+        is_header = events.isin(['Player_Name', 'Player Name']).any(axis=1).to_numpy()
+        if not is_header.any():
+            raise SchemaError(f"No 'Player_Name' header found in {filepath}")
+        row = int(is_header.argmax())
+        events.columns = [str(c).strip() if pd.notna(c) else f'_unnamed_{i}'
+                          for i, c in enumerate(events.iloc[row])]
+        events = events.iloc[row + 1:].reset_index(drop=True)
+        # The table ends at the first blank row; notes may follow it.
+        blank = events.isna().all(axis=1).to_numpy()
+        if blank.any():
+            events = events.iloc[:int(blank.argmax())]
+        events = events.drop(columns=[c for c in events.columns if c.startswith('_unnamed_')])
+    else:
+        raise ValueError(f"unsupported file type '{suffix}'")
+    return normalize_events(events)
+
+
+def _codes(series):
+    """(integer codes, distinct values) of a column; -1 marks missing."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series)
+
+
+def _metric_codes(series, vocabulary):
+    """Metric index per event (-1 for non-scoring or missing outcomes)."""
+    codes, labels = _codes(series)
+    keys = [str(label).strip().lower() for label in labels]
+    unknown = sorted({label for label, key in zip(labels, keys) if key not in vocabulary})
+    if unknown:
+        shown = ', '.join(repr(u) for u in unknown[:MAX_REPORTED_ROWS])
+        raise SchemaError(f"Column '{series.name}' has unknown event labels: {shown}")
+    lookup = np.array([METRIC_INDEX[vocabulary[key]] if vocabulary[key] else -1 for key in keys] + [-1],
+                      dtype=np.int64)
+    # codes of -1 (missing) index the trailing -1.
+    return lookup[codes]
+
+
+def _runs(events):
+    if RUNS_COLUMN not in events.columns:
+        return None
+    runs = events[RUNS_COLUMN]
+    if runs.dtype.kind not in 'iub':
+        runs = pd.to_numeric(runs, errors='coerce').fillna(0)
+    return runs.to_numpy()
+
+
+class EventTallies:
+    """
+    Per-player metric counts accumulated from event logs.
+
+    Players get stable integer ids in first-seen order; counts is an
+    (players × 9) int64 array in METRIC_COLUMNS order (RS last).
+    """
+
+    def __init__(self):
+        self.players = pd.Index([], dtype=object)
+        self.counts = np.zeros((0, len(METRIC_COLUMNS)), dtype=np.int64)
+        self.events = 0
+
+    def _player_ids(self, names):
+        """Global ids for every event's player, registering new names."""
+        codes, uniques = _codes(names)
+        if (codes < 0).any():
+            raise SchemaError("Event log has events without a Player_Name")
+        uniques = pd.Index(np.asarray(uniques, dtype=object))
+        ids = self.players.get_indexer(uniques)
+        new = ids < 0
+        if new.any():
+            ids[new] = np.arange(len(self.players), len(self.players) + new.sum())
+            self.players = self.players.append(uniques[new])
+            grown = np.zeros((len(self.players), len(METRIC_COLUMNS)), dtype=np.int64)
+            grown[:len(self.counts)] = self.counts
+            self.counts = grown
+        return ids[codes]
+
+    def add(self, events):
+        """Tally a block of events into the running counts; returns self."""
+        events = normalize_events(events)
+        columns = [col for col in EVENT_VOCABULARIES if col in events.columns]
+        if not columns:
+            raise SchemaError(f"Event log needs at least one of: {', '.join(EVENT_VOCABULARIES)}")
+
+        player_ids = self._player_ids(events['Player_Name'])
+        n_players, n_counts = len(self.players), len(COUNT_COLUMNS)
+        for col in columns:
+            metrics = _metric_codes(events[col], EVENT_VOCABULARIES[col])
+            scoring = metrics >= 0
+            cells = player_ids[scoring] * n_counts + metrics[scoring]
+            self.counts[:, :n_counts] += np.bincount(cells, minlength=n_players * n_counts).reshape(
+                n_players, n_counts)
+
+        runs = _runs(events)
+        if runs is not None:
+            self.counts[:, -1] += np.rint(np.bincount(player_ids, weights=runs,
+                                                      minlength=n_players)).astype(np.int64)
+        self.events += len(events)
+        return self
+
+    def to_frame(self):
+        """The Performance Matrix: one row per player, in first-seen order."""
+        df = pd.DataFrame(self.counts, columns=list(METRIC_COLUMNS))
+        df.insert(0, 'Player_Name', self.players.to_numpy())
+        return df
+
+
+def tally_events(events):
+    """One-shot: Performance Matrix from a frame of events."""
+    return EventTallies().add(events).to_frame()
@@ -0,0 +1,167 @@
+"""
+Export writers for analyzed fielding frames.
+
+The caller picks any of FORMATS. Metadata (analysis date and weights) is
+built once per export and shared by every writer; records are streamed in
+blocks through pandas' vectorized serializers instead of being turned
+into a list of dicts first.
+
+    paths = export_frame(df, weights, Path('cricket_analysis') / 'run_1',
+                         formats=('parquet', 'ndjson'), parallel=True)
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+FORMATS = ('excel', 'json', 'ndjson', 'csv', 'parquet')
+
+EXTENSIONS = {
+    'excel': '.xlsx',
+    'json': '.json',
+    'ndjson': '.ndjson',
+    'csv': '.csv',
+    'parquet': '.parquet'
+}
+
+# Rows serialized per block by the streaming writers.
+BLOCK_ROWS = 100_000
+
+# Excel sheets hold at most 1,048,576 rows including the header.
+EXCEL_MAX_ROWS = 1_048_575
+
+# Where the weights go: a sheet of Excel exports, a schema metadata key of Parquet ones.
+WEIGHTS_SHEET = 'Weights'
+PARQUET_METADATA_KEY = b'fielding_analysis'
+
+WEIGHT_LABELS = {
+    'WCP': 'Clean Picks (CP)',
+    'WGT': 'Good Throws (GT)',
+    'WC': 'Catches (C)',
+    'WDC': 'Dropped Catches (DC)',
+    'WST': 'Stumpings (ST)',
+    'WRO': 'Run Outs (RO)',
+    'WMRO': 'Missed Run Outs (MRO)',
+    'WDH': 'Direct Hits (DH)'
+}
+
+
+def build_metadata(weights):
+    """Metadata shared by every format of one export."""
+    return {
+        'analysis_date': datetime.now().isoformat(),
+        'weights': dict(weights)
+    }
+
+
+def _blocks(df):
+    for start in range(0, len(df), BLOCK_ROWS):
+        yield df.iloc[start:start + BLOCK_ROWS]
+
+
+def write_excel(df, path, metadata):
+    """Write the players sheet plus a Weights sheet."""
+    if len(df) > EXCEL_MAX_ROWS:
+        raise ValueError(f"{len(df)} rows exceed Excel's sheet limit of {EXCEL_MAX_ROWS}")
+    weights_df = pd.DataFrame([
+        {'Metric': WEIGHT_LABELS.get(key, key), 'Weight': value}
+        for key, value in metadata['weights'].items()
+    ])
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Performance Analysis', index=False)
+        weights_df.to_excel(writer, sheet_name=WEIGHTS_SHEET, index=False)
+
+
+def write_json(df, path, metadata):
+    """Write one compact JSON document: metadata plus a streamed 'players' array."""
+    header = json.dumps(metadata, separators=(',', ':'))[:-1]
+    with open(path, 'w') as f:
+        f.write(header + ',"players":[')
+        first = True
+        for block in _blocks(df):
+            records = block.to_json(orient='records')[1:-1]
+            if not records:
+                continue
+            if not first:
+                f.write(',')
+            f.write(records)
+            first = False
+        f.write(']}')
+
+
+def write_ndjson(df, path, metadata):
+    """Write one JSON record per line."""
+    with open(path, 'w') as f:
+        for block in _blocks(df):
+            # to_json(lines=True) already ends every record with a newline.
+            f.write(block.to_json(orient='records', lines=True))
+
+
+def write_csv(df, path, metadata):
+    """Write CSV in chunks."""
+    df.to_csv(path, index=False, chunksize=BLOCK_ROWS)
+
+
+def write_parquet(df, path, metadata):
+    """Write Parquet with the metadata embedded in the file schema."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[PARQUET_METADATA_KEY] = json.dumps(metadata).encode()
+    pq.write_table(table.replace_schema_metadata(schema_metadata), path)
+
+
+WRITERS = {
+    'excel': write_excel,
+    'json': write_json,
+    'ndjson': write_ndjson,
+    'csv': write_csv,
+    'parquet': write_parquet
+}
+
+# Formats that cannot carry metadata get a shared <base>.meta.json sidecar.
+SIDECAR_FORMATS = ('ndjson', 'csv')
+
+
+def export_frame(df, weights, base_path, formats=('excel', 'json'), parallel=False):
+    """
+    Write df in each requested format next to base_path (suffix added per format).
+
+    Returns {format: path}. parallel=True writes the formats concurrently.
+    """
+    unknown = [fmt for fmt in formats if fmt not in WRITERS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)}. Choose from: {', '.join(FORMATS)}")
+
+    metadata = build_metadata(weights)
+    paths = {fmt: base_path.with_name(base_path.name + EXTENSIONS[fmt]) for fmt in formats}
+
+    if any(fmt in SIDECAR_FORMATS for fmt in formats):
+        with open(base_path.with_name(base_path.name + '.meta.json'), 'w') as f:
+            json.dump(metadata, f)
+
+    if parallel and len(formats) > 1:
+        with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+            futures = [pool.submit(WRITERS[fmt], df, paths[fmt], metadata) for fmt in formats]
+            for future in futures:
+                future.result()
+    else:
+        for fmt in formats:
+            WRITERS[fmt](df, paths[fmt], metadata)
+    return paths
+
+
+def write_file(df, weights, path):
+    """Write df to a single file, choosing the format from its extension."""
+    suffix = Path(path).suffix.lower()
+    formats = [fmt for fmt, ext in EXTENSIONS.items() if ext == suffix]
+    if not formats:
+        raise ValueError(f"Cannot infer export format from '{suffix}'. "
+                         f"Use one of: {', '.join(EXTENSIONS.values())}")
+    WRITERS[formats[0]](df, path, build_metadata(weights))
+    return path
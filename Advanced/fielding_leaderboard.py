@@ -0,0 +1,169 @@
+"""
+Incremental fielding leaderboard.
+
+Keeps cumulative PS per player in an order-statistic tree (a treap with
+subtree sizes) so each new match only touches the players in it:
+updates, "rank of player X" and "top K" are all O(log n) (+K for top K)
+instead of re-sorting the whole season.
+
+Ordering matches a full recompute with fielding_stream's
+    rank_players(player_totals(all_rows))
+i.e. higher PS first and ties kept in the order players were first seen
+(a stable sort). Rows are grouped the same way too: by Player_ID when
+the frame has one, under the first name seen for that ID in any match.
+"""
+
+import random
+
+import pandas as pd
+
+
+class _Node:
+    __slots__ = ('key', 'priority', 'size', 'left', 'right')
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+
+def _split(node, key):
+    """Split into (keys < key, keys >= key)."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        return _update(node), right
+    left, node.left = _split(node.left, key)
+    return left, _update(node)
+
+
+def _merge(left, right):
+    """Join two treaps where every key in left is smaller than every key in right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+def _insert(node, new):
+    left, right = _split(node, new.key)
+    return _merge(_merge(left, new), right)
+
+
+def _remove(node, key):
+    if node is None:
+        raise KeyError(key)
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    else:
+        node.right = _remove(node.right, key)
+    return _update(node)
+
+
+class Leaderboard:
+    """
+    Ranks players by cumulative PS with O(log n) updates.
+
+    Usage:
+        board = Leaderboard()
+        board.apply_match(match_df)      # needs Player_Name and PS columns
+        board.rank('Axer Patel')         # 1-based position
+        board.top(5)                     # [(player, PS), ...]
+    """
+
+    def __init__(self):
+        self._root = None
+        self.scores = {}
+        # First-seen position of each player: breaks PS ties like a stable sort.
+        self._seen = {}
+        # Player_ID -> the name it was first seen under, across every match applied.
+        self._names = {}
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __contains__(self, player):
+        return player in self.scores
+
+    def _key(self, player, ps):
+        return (-ps, self._seen[player], player)
+
+    def update(self, player, delta):
+        """Add delta to a player's PS (new players start at 0) and re-position them."""
+        old = self.scores.get(player)
+        if old is not None:
+            self._root = _remove(self._root, self._key(player, old))
+        else:
+            self._seen[player] = len(self._seen)
+        new = (old or 0) + delta
+        self.scores[player] = new
+        self._root = _insert(self._root, _Node(self._key(player, new)))
+
+    def apply_match(self, df):
+        """
+        Fold one match's scored rows (Player_Name, PS, optional Player_ID) into
+        the leaderboard; rows are grouped like fielding_stream.player_totals.
+        """
+        if 'Player_ID' not in df.columns:
+            deltas = df.groupby('Player_Name', sort=False, observed=True)['PS'].sum()
+            players = deltas.index.astype(str)
+        else:
+            ids = df['Player_ID']
+            deltas = df['PS'].groupby(ids, sort=False).sum()
+            first = ~ids.duplicated().to_numpy()
+            names = self._names
+            first_names = df['Player_Name'].astype(str).to_numpy()[first]
+            for player_id, name in zip(ids.to_numpy()[first].tolist(), first_names):
+                names.setdefault(player_id, name)
+            players = [names[player_id] for player_id in deltas.index.tolist()]
+        for player, delta in zip(players, deltas.tolist()):
+            self.update(player, delta)
+
+    def rank(self, player):
+        """Return a player's 1-based rank."""
+        key = self._key(player, self.scores[player])
+        rank, node = 1, self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            else:
+                if key == node.key:
+                    return rank + _size(node.left)
+                rank += _size(node.left) + 1
+                node = node.right
+        raise KeyError(player)
+
+    def top(self, k=10):
+        """Return the k best (player, PS) pairs, best first."""
+        result, stack, node = [], [], self._root
+        while (stack or node is not None) and len(result) < k:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append((node.key[2], -node.key[0]))
+            node = node.right
+        return result
+
+    def to_frame(self):
+        """Return the full ranking as a DataFrame."""
+        return pd.DataFrame(self.top(len(self)), columns=['Player_Name', 'PS'])
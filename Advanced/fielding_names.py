@@ -0,0 +1,242 @@
+"""
+Player-name resolution: one stable integer ID per player across files.
+
+Names are normalized (Unicode NFKC, case-folded, whitespace collapsed,
+dots and apostrophes dropped), so 'Kuldeep yadav' and ' Kuldeep  Yadav'
+are the same key. A key never seen before is compared with the known keys
+within `max_distance` edits ('Axer Patel' ~ 'Axar Patel') through a
+deletion-neighbourhood index: every key is stored under each string
+obtainable by deleting up to max_distance characters, and two keys within
+that many edits always share one of those strings. A lookup therefore
+touches a few dict buckets instead of comparing against every known name.
+
+One edit also separates real players ('Rohit Sharma' / 'Mohit Sharma'), so
+a near match is not taken as the same player: the new name gets its own
+ID and the match is kept in `suggestions` until someone confirms it with
+add_alias() (`aliases --add` on the command line). merge_fuzzy=True merges
+near matches automatically instead, for lists known to hold only typos.
+
+    registry = PlayerRegistry.load('cricket_analysis/players.json')
+    registry.attach_ids(df)          # adds Player_ID, canonicalizes Player_Name
+    registry.suggestions             # {new key: ID of the player it resembles}
+    registry.save()
+
+The alias table (key -> ID, and how it was matched) is a JSON file, so a
+confirmed or corrected alias stays fixed.
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_DISTANCE = 1
+
+# Shorter keys only match exactly: one edit changes too much of them.
+MIN_FUZZY_LENGTH = 6
+
+_DROPPED = re.compile(r"[.'’`]")
+_SEPARATORS = re.compile(r'[-_,]')
+
+
+def normalize_name(name):
+    """Case-, spacing- and punctuation-insensitive key for a player name."""
+    text = unicodedata.normalize('NFKC', str(name))
+    text = _SEPARATORS.sub(' ', _DROPPED.sub('', text))
+    return ' '.join(text.casefold().split())
+
+
+def display_name(name):
+    """The name as it will be shown: surrounding and repeated whitespace removed."""
+    return ' '.join(str(name).split())
+
+
+def _deletions(key, depth):
+    """Every string reachable from key by deleting up to depth characters (key included)."""
+    variants = frontier = {key}
+    for _ in range(depth):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants = variants | frontier
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance, or limit + 1 as soon as it must exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class PlayerRegistry:
+    """
+    Alias table mapping normalized names to stable player IDs.
+
+    names[id] is the canonical (first-seen) spelling; aliases maps every
+    key ever resolved to [id, how], how being 'exact', 'fuzzy' (merged with
+    merge_fuzzy=True) or 'manual'; suggestions maps keys registered as new
+    players to the ID of the known player they are a near match of.
+    """
+
+    def __init__(self, path=None, max_distance=DEFAULT_MAX_DISTANCE, fuzzy=True, merge_fuzzy=False):
+        self.path = Path(path) if path is not None else None
+        self.max_distance = max_distance
+        self.fuzzy = fuzzy
+        self.merge_fuzzy = merge_fuzzy
+        self.names = []
+        self.aliases = {}
+        self.suggestions = {}
+        self._index = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, **options):
+        """Open the alias table at path (an empty registry if it does not exist yet)."""
+        registry = cls(path, **options)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return registry
+        registry.names = data['players']
+        registry.suggestions = data.get('suggestions', {})
+        demoted = False
+        for key, (player_id, how) in data['aliases'].items():
+            if how == 'fuzzy' and not registry.merge_fuzzy:
+                # Merged automatically by an older version: the name is resolved afresh next time it is seen.
+                registry.suggestions[key] = player_id
+                demoted = True
+                continue
+            registry._register(key, player_id, how)
+        registry.dirty = demoted
+        return registry
+
+    def save(self, path=None):
+        """Write the alias table (only if something changed)."""
+        path = Path(path) if path is not None else self.path
+        if path is None or not (self.dirty or not path.exists()):
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'players': self.names, 'aliases': self.aliases, 'suggestions': self.suggestions},
+                      f, ensure_ascii=False)
+        tmp.replace(path)
+        self.dirty = False
+        return path
+
+    def __len__(self):
+        return len(self.names)
+
+    def _variants(self, key):
+        """Deletion variants used for fuzzy matching (none for short keys or fuzzy=False)."""
+        if not self.fuzzy or len(key) < MIN_FUZZY_LENGTH:
+            return ()
+        return _deletions(key, self.max_distance)
+
+    def _register(self, key, player_id, how, variants=None):
+        self.aliases[key] = [player_id, how]
+        index = self._index
+        for variant in self._variants(key) if variants is None else variants:
+            bucket = index.get(variant)
+            if bucket is None:
+                index[variant] = [key]
+            else:
+                bucket.append(key)
+        self.dirty = True
+
+    def _closest(self, key, variants):
+        """ID of the nearest known key within max_distance edits, or None."""
+        best = None
+        seen = set()
+        for variant in variants:
+            for candidate in self._index.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(key, candidate, self.max_distance)
+                if distance <= self.max_distance:
+                    player_id = self.aliases[candidate][0]
+                    if best is None or (distance, player_id) < best:
+                        best = (distance, player_id)
+        return None if best is None else best[1]
+
+    def find(self, name):
+        """ID of an already registered name, or None; unlike resolve() nothing is registered."""
+        key = normalize_name(name)
+        known = self.aliases.get(key)
+        if known is not None:
+            return known[0]
+        return self._closest(key, self._variants(key)) if self.merge_fuzzy else None
+
+    def suggest(self, name):
+        """ID of the known player nearest to an unregistered name (within max_distance edits), or None."""
+        key = normalize_name(name)
+        if key in self.aliases:
+            return None
+        return self._closest(key, self._variants(key))
+
+    def resolve(self, name):
+        """Stable ID for a name, registering it as a new player (or, with merge_fuzzy, an alias) if unseen."""
+        key = normalize_name(name)
+        known = self.aliases.get(key)
+        if known is not None:
+            return known[0]
+        variants = self._variants(key)
+        similar = self._closest(key, variants)
+        if similar is not None and self.merge_fuzzy:
+            self._register(key, similar, 'fuzzy', variants)
+            return similar
+        player_id = len(self.names)
+        self.names.append(display_name(name))
+        self._register(key, player_id, 'exact', variants)
+        if similar is not None:
+            self.suggestions[key] = similar
+        return player_id
+
+    def resolve_many(self, names):
+        """IDs for a column of names; each distinct spelling is resolved once."""
+        codes, uniques = pd.factorize(pd.Series(names), use_na_sentinel=True)
+        if (codes < 0).any():
+            raise ValueError("Cannot resolve a missing Player_Name")
+        ids = np.fromiter((self.resolve(name) for name in uniques), dtype=np.int64, count=len(uniques))
+        return ids[codes]
+
+    def add_alias(self, alias, canonical):
+        """Manually point alias at canonical's player (overrides any earlier match)."""
+        player_id = self.resolve(canonical)
+        key = normalize_name(alias)
+        self.suggestions.pop(key, None)
+        if key in self.aliases:
+            self.aliases[key] = [player_id, 'manual']
+            self.dirty = True
+        else:
+            self._register(key, player_id, 'manual')
+        return player_id
+
+    def attach_ids(self, df):
+        """Add a Player_ID column and replace Player_Name with canonical names (in place)."""
+        ids = self.resolve_many(df['Player_Name'])
+        df['Player_ID'] = ids.astype(np.int32)
+        df['Player_Name'] = pd.Categorical.from_codes(ids, categories=pd.Index(self.names, dtype=object))
+        return df
+
+    def alias_table(self):
+        """The alias table as a frame: Alias_Key, Player_ID, Player_Name, Match."""
+        rows = [(key, player_id, self.names[player_id], how) for key, (player_id, how) in self.aliases.items()]
+        return pd.DataFrame(rows, columns=['Alias_Key', 'Player_ID', 'Player_Name', 'Match'])
+
+    def suggestion_table(self):
+        """Unconfirmed near matches as a frame: Alias_Key, Similar_ID, Similar_Name."""
+        rows = [(key, player_id, self.names[player_id]) for key, player_id in self.suggestions.items()]
+        return pd.DataFrame(rows, columns=['Alias_Key', 'Similar_ID', 'Similar_Name'])
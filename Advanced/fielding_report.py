@@ -0,0 +1,120 @@
+"""
+Text report renderer for ranked fielding frames.
+
+The player section is built column-wise: every field is formatted for
+all players at once, the pieces are concatenated as string columns and
+written in large blocks. Key insights come from a single argmax pass
+over the PS/C/RO columns.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+RULE = "=" * 80
+THIN_RULE = "-" * 80
+
+# Players rendered and written per block.
+BLOCK_PLAYERS = 50_000
+
+WRITE_BUFFER = 1 << 20
+
+
+def _as_text(series, signed=False):
+    """Format a numeric column like '{:.0f}' (or '{:+.0f}') for every row at once."""
+    values = series.to_numpy()
+    if values.dtype.kind in 'iub':
+        text = pd.Series(values.astype(np.int64), index=series.index).astype(str)
+    else:
+        text = pd.Series(np.round(values.astype(np.float64)), index=series.index).map('{:.0f}'.format)
+    if signed:
+        text = pd.Series(np.where(values >= 0, '+', ''), index=series.index) + text
+    return text
+
+
+def render_players(df, first_rank=1):
+    """Return the PLAYER RANKINGS entries of df as one string."""
+    ranks = pd.Series(np.arange(first_rank, first_rank + len(df)), index=df.index).astype(str)
+    entries = (
+        ranks + '. ' + df['Player_Name'].astype(str) + '\n'
+        + '   Performance Score: ' + _as_text(df['PS']) + '\n'
+        + '   Catches: ' + _as_text(df['C']) + ', Run Outs: ' + _as_text(df['RO'])
+        + ', Direct Hits: ' + _as_text(df['DH']) + '\n'
+        + '   Runs Impact: ' + _as_text(df['RS'], signed=True) + '\n\n'
+    )
+    return ''.join(entries.tolist())
+
+
+def key_insights(df):
+    """Best performer, most catches and most run outs from one argmax pass."""
+    if df.empty:
+        return {}
+    best = df[['PS', 'C', 'RO']].to_numpy(dtype=np.float64, na_value=-np.inf).argmax(axis=0)
+    names = df['Player_Name'].astype(str).to_numpy()
+    insights = {
+        'best': (names[best[0]], df['PS'].iloc[best[0]]),
+        'catches': (names[best[1]], df['C'].iloc[best[1]])
+    }
+    if df['RO'].iloc[best[2]] > 0:
+        insights['run_outs'] = (names[best[2]], df['RO'].iloc[best[2]])
+    return insights
+
+
+def _header(weights):
+    lines = [
+        RULE,
+        "IPL FIELDING PERFORMANCE ANALYSIS REPORT",
+        "ShadowFox Analytics",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        RULE,
+        "",
+        "PERFORMANCE SCORE FORMULA:",
+        THIN_RULE,
+        "PS = (CP×WCP) + (GT×WGT) + (C×WC) + (DC×WDC) + (ST×WST) +",
+        "     (RO×WRO) + (MRO×WMRO) + (DH×WDH) + RS",
+        "",
+        "WEIGHTS:",
+        THIN_RULE
+    ]
+    lines += [f"{key}: {value:+g}" for key, value in weights.items()]
+    lines += ["", "PLAYER RANKINGS:", THIN_RULE, "", ""]
+    return '\n'.join(lines)
+
+
+def _footer(insights):
+    lines = [RULE, "KEY INSIGHTS:", THIN_RULE]
+    if 'best' in insights:
+        name, ps = insights['best']
+        lines.append(f"• Best Performer: {name} (PS: {ps:.0f})")
+        name, catches = insights['catches']
+        lines.append(f"• Most Catches: {name} ({catches:.0f} catches)")
+    if 'run_outs' in insights:
+        name, run_outs = insights['run_outs']
+        lines.append(f"• Most Run Outs: {name} ({run_outs:.0f} run outs)")
+    lines += ["", RULE, ""]
+    return '\n'.join(lines)
+
+
+def write_report(df, weights, report_file, top_n=None, page_size=None):
+    """
+    Write the text report for a frame already sorted by PS.
+
+    top_n: only list the first N players (insights still cover everyone).
+    page_size: split the rankings into pages of this many players.
+    """
+    insights = key_insights(df)
+    players = df if top_n is None else df.head(top_n)
+    step = page_size or BLOCK_PLAYERS
+    pages = max(1, -(-len(players) // step)) if page_size else None
+
+    with open(report_file, 'w', buffering=WRITE_BUFFER) as f:
+        f.write(_header(weights))
+        for number, start in enumerate(range(0, len(players), step), 1):
+            if pages:
+                f.write(f"--- Page {number} of {pages} ---\n\n")
+            f.write(render_players(players.iloc[start:start + step], first_rank=start + 1))
+        if top_n is not None and len(df) > top_n:
+            f.write(f"... {len(df) - top_n} more players not shown\n\n")
+        f.write(_footer(insights))
+    return report_file
@@ -0,0 +1,115 @@
+"""
+Declared column schema for fielding Performance Matrix frames.
+
+Counts are stored as uint16, Runs Saved as int16 and player/team names
+as categoricals, which cuts a frame to a fraction of the default
+int64/object layout. enforce_schema() is applied once when data is
+loaded; it raises SchemaError naming the offending rows when a cell
+cannot be represented.
+"""
+
+import numpy as np
+import pandas as pd
+
+from fielding_scoring import METRIC_COLUMNS
+
+COUNT_DTYPE = 'uint16'
+RUNS_DTYPE = 'int16'
+
+# column -> storage dtype
+SCHEMA = {
+    'Player_Name': 'category',
+    'Team': 'category',
+    **{col: COUNT_DTYPE for col in METRIC_COLUMNS if col != 'RS'},
+    'RS': RUNS_DTYPE
+}
+
+# Nullable counterparts used when blank cells are kept as <NA>.
+NULLABLE_DTYPES = {COUNT_DTYPE: 'UInt16', RUNS_DTYPE: 'Int16'}
+
+REQUIRED_COLUMNS = ('Player_Name',) + METRIC_COLUMNS
+
+# Bump whenever SCHEMA or enforce_schema() changes what a parsed frame holds:
+# the parsed-workbook cache (fielding_cache) keys its entries on it.
+SCHEMA_VERSION = 1
+
+# How many offending rows to quote in an error message.
+MAX_REPORTED_ROWS = 10
+
+
+class SchemaError(ValueError):
+    """Raised when a frame cannot be coerced to the fielding schema."""
+
+
+def _row_labels(mask):
+    """Format offending rows as spreadsheet row numbers (header is row 1)."""
+    rows = mask.index[mask.to_numpy()]
+    labels = ', '.join(str(r + 2) for r in rows[:MAX_REPORTED_ROWS])
+    if len(rows) > MAX_REPORTED_ROWS:
+        labels += f' ... ({len(rows)} rows)'
+    return labels
+
+
+def _coerce_metric(series, dtype, fill_missing):
+    """Validate one metric column and return it in its storage dtype."""
+    name = series.name
+    values = pd.to_numeric(series, errors='coerce')
+
+    bad = values.isna() & series.notna()
+    if bad.any():
+        raise SchemaError(f"Column '{name}' has non-numeric values in rows {_row_labels(bad)}")
+
+    present = values.notna()
+    fractional = present & (values != values.round())
+    if fractional.any():
+        raise SchemaError(f"Column '{name}' has fractional values in rows {_row_labels(fractional)}")
+
+    info = np.iinfo(dtype)
+    out_of_range = present & ((values < info.min) | (values > info.max))
+    if out_of_range.any():
+        kind = 'negative' if info.min == 0 and (values[out_of_range] < 0).all() else 'out-of-range'
+        raise SchemaError(f"Column '{name}' has {kind} values in rows {_row_labels(out_of_range)} "
+                          f"(allowed {info.min}..{info.max})")
+
+    if not present.all():
+        if fill_missing:
+            values = values.fillna(0)
+        else:
+            return values.astype(NULLABLE_DTYPES[dtype])
+    return values.astype(dtype)
+
+
+def enforce_schema(df, fill_missing=True):
+    """
+    Coerce a Performance Matrix frame to SCHEMA in place and return it.
+
+    fill_missing=True treats blank metric cells as 0 (no event recorded);
+    False keeps them as <NA> in nullable integer columns.
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise SchemaError(f"Missing columns: {', '.join(missing)}")
+
+    names = df['Player_Name']
+    blank = names.isna() | (names.astype(str).str.strip() == '')
+    if blank.any():
+        raise SchemaError(f"Missing Player_Name in rows {_row_labels(blank)}")
+
+    for col, dtype in SCHEMA.items():
+        if col not in df.columns:
+            continue
+        if dtype == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = _coerce_metric(df[col], dtype, fill_missing)
+    return df
+
+
+def is_performance_matrix(df):
+    """True if a frame has the columns needed to score players."""
+    return all(col in df.columns for col in REQUIRED_COLUMNS)
+
+
+def memory_usage(df):
+    """Return the deep memory footprint of a frame in bytes."""
+    return int(df.memory_usage(deep=True).sum())
@@ -0,0 +1,99 @@
+"""
+Vectorized Performance Score engine for the IPL Fielding Analysis System.
+
+PS = (CP×WCP) + (GT×WGT) + (C×WC) + (DC×WDC) + (ST×WST) +
+     (RO×WRO) + (MRO×WMRO) + (DH×WDH) + RS
+
+The whole formula is a single matrix-vector product: the metric columns
+of a frame form a (rows × 9) matrix and the weights form a 9-long vector
+(RS always carries a weight of 1).
+"""
+
+import numpy as np
+
+
+# Metric columns in formula order, paired with the weight key they use.
+METRIC_COLUMNS = ('CP', 'GT', 'C', 'DC', 'ST', 'RO', 'MRO', 'DH', 'RS')
+
+WEIGHT_KEYS = {
+    'CP': 'WCP',
+    'GT': 'WGT',
+    'C': 'WC',
+    'DC': 'WDC',
+    'ST': 'WST',
+    'RO': 'WRO',
+    'MRO': 'WMRO',
+    'DH': 'WDH',
+    'RS': None   # Runs Saved are added as-is
+}
+
+# Rows scored per matrix-vector product; bounds the temporary matrix size.
+BLOCK_ROWS = 1_000_000
+
+
+class ScoringEngine:
+    """
+    Scores fielding metrics with one NumPy matrix-vector product.
+
+    Usage:
+        engine = ScoringEngine(IPLFieldingAnalyzer.WEIGHTS)
+        df['PS'] = engine.score(df)
+        strict = engine.with_overrides(WDC=-4)
+    """
+
+    def __init__(self, weights, overrides=None):
+        """Build the weight vector from a WEIGHTS mapping plus overrides."""
+        merged = dict(weights)
+        for key, value in (overrides or {}).items():
+            if key not in merged:
+                raise KeyError(f"Unknown weight '{key}'. Expected one of: {', '.join(merged)}")
+            merged[key] = value
+        self.weights = merged
+
+        missing = [key for key in WEIGHT_KEYS.values() if key and key not in merged]
+        if missing:
+            raise KeyError(f"Missing weights: {', '.join(missing)}")
+
+        self.vector = np.array(
+            [merged[key] if key else 1 for key in WEIGHT_KEYS.values()]
+        )
+
+    def with_overrides(self, **overrides):
+        """Return a new engine with some weights replaced for this run."""
+        return ScoringEngine(self.weights, overrides)
+
+    def _matrix(self, df):
+        """Return the metric columns of a frame as a 2-D array."""
+        missing = [col for col in METRIC_COLUMNS if col not in df.columns]
+        if missing:
+            raise KeyError(f"Missing metric columns: {', '.join(missing)}")
+        metrics = df[list(METRIC_COLUMNS)]
+        # Keep integer data integral (PS stays a whole number); anything else
+        # (NaN-bearing, nullable, object) is scored in float64 with <NA> as NaN.
+        if all(isinstance(dtype, np.dtype) and dtype.kind in 'iub' for dtype in metrics.dtypes):
+            return metrics.to_numpy(dtype=np.int64)
+        return metrics.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def score_matrix(self, matrix):
+        """Score a (rows × 9) array laid out in METRIC_COLUMNS order."""
+        return np.asarray(matrix) @ self.vector
+
+    def score(self, df):
+        """Return PS for every row of a frame as a NumPy array."""
+        n = len(df)
+        if n <= BLOCK_ROWS:
+            return self.score_matrix(self._matrix(df))
+
+        scores = None
+        for start in range(0, n, BLOCK_ROWS):
+            block = self.score_matrix(self._matrix(df.iloc[start:start + BLOCK_ROWS]))
+            if scores is None:
+                scores = np.empty(n, dtype=block.dtype)
+            elif block.dtype != scores.dtype:
+                scores = scores.astype(np.result_type(scores, block))
+            scores[start:start + len(block)] = block
+        return scores
+
+    def score_row(self, row):
+        """Score a single record (mapping or Series) with the same weights."""
+        return sum(row[col] * w for col, w in zip(METRIC_COLUMNS, self.vector))
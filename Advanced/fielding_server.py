@@ -0,0 +1,299 @@
+"""
+Local HTTP scoring service on asyncio (standard library only).
+
+One process keeps the analyzer, its weights and the season leaderboard
+warm, so a dashboard pays for a socket round trip instead of a Python and
+pandas start per request. Score requests that arrive together are
+coalesced: they are queued for at most `batch_delay` seconds, stacked
+into one matrix and scored with a single matrix-vector product.
+
+Endpoints (JSON in and out, HTTP/1.1 keep-alive):
+    POST /score        {"rows": [{"CP": 2, "GT": 1, ...}, ...]}  -> {"PS": [...]}
+    POST /match        {"rows": [{"Player_Name": ..., "CP": ..., ...}]} folds a match into the season
+    GET  /top?k=10     -> {"players": [{"Player_Name": ..., "PS": ...}, ...]}
+    GET  /rank?player=axer%20patel -> {"Player_Name": "Axer Patel", "rank": 3, "PS": ...}
+    GET  /health, GET /stats
+
+Player names in /match, /rank and the seeded season go through the
+analyzer's PlayerRegistry (unless it runs with exact names), so case,
+spacing and confirmed aliases map to one leaderboard entry, as in every
+file-based command. A near match ('Axar Patel' for 'Axer Patel') is not
+merged: /rank answers 404 and names the player in "suggestion".
+
+Bodies over MAX_BODY_BYTES get 413 and headers over the stream limit 431;
+both close the connection.
+
+    python ipl_fielding_analyzer.py serve season.xlsx --port 8765
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from fielding_scoring import METRIC_COLUMNS
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# How long a score request may wait for others to share its batch.
+DEFAULT_BATCH_DELAY = 0.001
+MAX_BATCH_ROWS = 100_000
+
+MAX_BODY_BYTES = 64 * 2**20
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 431: 'Request Header Fields Too Large', 500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """Client error carrying an HTTP status (and optional extra fields for the JSON reply)."""
+
+    def __init__(self, status, message, **details):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+
+def rows_to_matrix(rows):
+    """(rows × 9) float matrix in METRIC_COLUMNS order; missing metrics count as 0."""
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise RequestError(400, "'rows' must be a list of objects")
+    try:
+        return np.array([[row.get(col) or 0 for col in METRIC_COLUMNS] for row in rows], dtype=np.float64)
+    except (TypeError, ValueError):
+        raise RequestError(400, 'metric values must be numbers')
+
+
+class ScoreBatcher:
+    """Coalesces concurrent score requests into one vectorized scoring call."""
+
+    def __init__(self, engine, batch_delay=DEFAULT_BATCH_DELAY, max_rows=MAX_BATCH_ROWS):
+        self.engine = engine
+        self.batch_delay = batch_delay
+        self.max_rows = max_rows
+        self.pending = []
+        self.pending_rows = 0
+        self._timer = None
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, matrix):
+        """Queue a matrix for scoring; returns a future resolving to its PS list."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((matrix, future))
+        self.pending_rows += len(matrix)
+        if self.pending_rows >= self.max_rows:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_delay, self.flush)
+        return future
+
+    def flush(self):
+        """Score everything queued in one call and resolve the waiting requests."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self.pending, self.pending_rows = self.pending, [], 0
+        if not batch:
+            return
+        self.batches += 1
+        self.requests += len(batch)
+        try:
+            scores = self.engine.score_matrix(np.vstack([matrix for matrix, _ in batch]))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for matrix, future in batch:
+            end = start + len(matrix)
+            if not future.done():
+                future.set_result(scores[start:end].tolist())
+            start = end
+
+
+class ScoringServer:
+    """Routes requests to a warm analyzer and its season leaderboard."""
+
+    def __init__(self, analyzer, batch_delay=DEFAULT_BATCH_DELAY):
+        self.analyzer = analyzer
+        self.batcher = ScoreBatcher(analyzer.engine, batch_delay)
+        if analyzer.leaderboard is None:
+            from fielding_leaderboard import Leaderboard
+            analyzer.leaderboard = Leaderboard()
+        self.served = 0
+
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/') or '/'
+
+        if path == '/score':
+            self._expect(method, 'POST')
+            return {'PS': await self.batcher.submit(rows_to_matrix(self._rows(body)))}
+        if path == '/match':
+            self._expect(method, 'POST')
+            return self._match(self._rows(body))
+        if path == '/top':
+            self._expect(method, 'GET')
+            k = self._int(query.get('k', '10'), 'k')
+            return {'players': [{'Player_Name': name, 'PS': ps}
+                                for name, ps in self.analyzer.leaderboard.top(k)]}
+        if path == '/rank':
+            self._expect(method, 'GET')
+            return self._rank(query.get('player'))
+        if path == '/health':
+            return {'status': 'ok', 'players': len(self.analyzer.leaderboard)}
+        if path == '/stats':
+            batcher = self.batcher
+            return {'served': self.served, 'score_requests': batcher.requests, 'score_batches': batcher.batches,
+                    'mean_batch': batcher.requests / batcher.batches if batcher.batches else 0.0}
+        raise RequestError(404, f'no endpoint {path}')
+
+    @staticmethod
+    def _expect(method, allowed):
+        if method != allowed:
+            raise RequestError(405, f'use {allowed}')
+
+    @staticmethod
+    def _int(text, name):
+        try:
+            return int(text)
+        except ValueError:
+            raise RequestError(400, f"'{name}' must be an integer")
+
+    @staticmethod
+    def _rows(body):
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError:
+            raise RequestError(400, 'body is not valid JSON')
+        rows = payload.get('rows') if isinstance(payload, dict) else payload
+        if rows is None:
+            raise RequestError(400, "expected {'rows': [...]}")
+        return rows
+
+    def _match(self, rows):
+        matrix = rows_to_matrix(rows)
+        try:
+            names = [str(row['Player_Name']) for row in rows]
+        except KeyError:
+            raise RequestError(400, 'every match row needs Player_Name')
+        board = self.analyzer.leaderboard
+        deltas = {}
+        for name, ps in zip(self._canonical(names), self.analyzer.engine.score_matrix(matrix).tolist()):
+            deltas[name] = deltas.get(name, 0) + ps
+        for name, delta in deltas.items():
+            board.update(name, delta)
+        return {'updated': len(deltas), 'players': len(board)}
+
+    def _canonical(self, names):
+        """Registered spelling of each name (new names are added to the alias table)."""
+        analyzer = self.analyzer
+        if not analyzer.resolve_names or not names:
+            return names
+        registry = analyzer.registry
+        canonical = [registry.names[player_id] for player_id in registry.resolve_many(names)]
+        registry.save()
+        return canonical
+
+    def _rank(self, player):
+        board = self.analyzer.leaderboard
+        if not player:
+            raise RequestError(400, "missing 'player'")
+        registry = self.analyzer.registry if self.analyzer.resolve_names else None
+        if registry is not None:
+            # A lookup must not register the name as a new player.
+            player_id = registry.find(player)
+            if player_id is not None:
+                player = registry.names[player_id]
+        if player not in board:
+            similar = registry.suggest(player) if registry is not None else None
+            if similar is not None and registry.names[similar] in board:
+                raise RequestError(404, f'unknown player {player}', suggestion=registry.names[similar])
+            raise RequestError(404, f'unknown player {player}')
+        return {'Player_Name': player, 'rank': board.rank(player), 'PS': board.scores[player]}
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.LimitOverrunError:
+                    # The rest of the headers is still unread, so the connection is closed after the reply.
+                    await self._reply(writer, 431, {'error': 'request headers too large'}, False)
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version == 'HTTP/1.1')
+
+                length = headers.get('content-length') or '0'
+                if not (length.isascii() and length.isdigit()):
+                    # Without a valid length the body cannot be skipped, so the connection is closed.
+                    status, payload, keep_alive = 400, {'error': 'invalid Content-Length'}, False
+                elif int(length) > MAX_BODY_BYTES:
+                    status, payload, keep_alive = 413, {'error': 'request body too large'}, False
+                else:
+                    body = await reader.readexactly(int(length))
+                    status, payload = await self._respond(method, target, body)
+
+                await self._reply(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _reply(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload, separators=(',', ':')).encode()
+        writer.write(
+            f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(data)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + data
+        )
+        await writer.drain()
+        self.served += 1
+
+    async def _respond(self, method, target, body):
+        try:
+            return 200, await self.route(method, target, body)
+        except RequestError as e:
+            return e.status, {'error': str(e), **e.details}
+        except Exception as e:
+            return 500, {'error': f'{type(e).__name__}: {e}'}
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """Run until cancelled; ready(port) is called once the socket is listening."""
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            if ready:
+                ready(server.sockets[0].getsockname()[1])
+            await server.serve_forever()
+
+
+def run_server(analyzer, host=DEFAULT_HOST, port=DEFAULT_PORT, batch_delay=DEFAULT_BATCH_DELAY, ready=None):
+    """Blocking entry point; Ctrl+C stops the server."""
+    server = ScoringServer(analyzer, batch_delay)
+    try:
+        asyncio.run(server.serve(host, port, ready))
+    except KeyboardInterrupt:
+        pass
+    return server
@@ -0,0 +1,200 @@
+"""
+Embedded SQLite store of analysis runs.
+
+Every run is one row in `runs` (timestamp, weights, weights hash, source)
+and one row per player in `results`. results carries the run timestamp
+and weights hash next to the player so the (player, run_at, weights_hash)
+index answers history questions on its own, without touching old
+exports.
+
+    store = ResultsStore('cricket_analysis/results.sqlite')
+    store.record_run(ranked_df, weights)
+    store.player_history('Yash Dhull')
+    store.import_json_exports(Path('.').glob('*analysis_*.json'))
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from fielding_scoring import METRIC_COLUMNS
+
+RESULT_COLUMNS = list(METRIC_COLUMNS) + ['PS']
+
+# SQLite page cache; keeps the player index hot during bulk imports.
+CACHE_KIB = 64 * 1024
+
+# Column names used by the older 'results'-style JSON exports.
+LEGACY_COLUMNS = {
+    'Clean_Picks': 'CP',
+    'Good_Throws': 'GT',
+    'Catches': 'C',
+    'Dropped_Catches': 'DC',
+    'Stumpings': 'ST',
+    'Run_Outs': 'RO',
+    'Missed_Run_Outs': 'MRO',
+    'Direct_Hits': 'DH',
+    'Runs_Impact': 'RS',
+    'Performance_Score': 'PS'
+}
+
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       INTEGER PRIMARY KEY,
+    run_at       TEXT NOT NULL,
+    weights_hash TEXT NOT NULL,
+    weights      TEXT NOT NULL,
+    source       TEXT UNIQUE,
+    players      INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id       INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    player       TEXT NOT NULL,
+    run_at       TEXT NOT NULL,
+    weights_hash TEXT NOT NULL,
+    rank         INTEGER NOT NULL,
+    {', '.join(f'{col} INTEGER' for col in METRIC_COLUMNS)},
+    PS           REAL
+);
+CREATE INDEX IF NOT EXISTS results_player ON results (player, run_at, weights_hash);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id, rank);
+"""
+
+
+def weights_hash(weights):
+    """Short stable hash of a weights dict (key order does not matter)."""
+    canonical = json.dumps({key: float(value) for key, value in weights.items()}, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _ranks(ps):
+    """Competition ranks by PS, best first."""
+    return ps.rank(method='min', ascending=False).fillna(len(ps)).astype('int64')
+
+
+class ResultsStore:
+    """
+    Runs and per-player results in one SQLite file.
+
+    Each record_run() / import is a single transaction; writes use
+    executemany so a run of any size costs one commit.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.execute(f'PRAGMA cache_size=-{CACHE_KIB}')
+        self.conn.executescript(SCHEMA_SQL)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_run(self, df, weights, run_at=None, source=None):
+        """
+        Store one run (one row per player in df) and return its run_id.
+
+        Missing metric columns are stored as NULL; PS is required.
+        """
+        with self.conn:
+            return self._insert_run(df, weights, run_at, source)
+
+    def _insert_run(self, df, weights, run_at, source):
+        """Insert one run inside the caller's transaction."""
+        if 'PS' not in df.columns:
+            raise ValueError("Cannot store a run without a PS column")
+        run_at = run_at or datetime.now().isoformat()
+        digest = weights_hash(weights)
+
+        table = pd.DataFrame({'player': df['Player_Name'].astype(str).to_numpy()})
+        table['run_at'] = run_at
+        table['weights_hash'] = digest
+        table['rank'] = _ranks(df['PS']).to_numpy()
+        for col in RESULT_COLUMNS:
+            table[col] = df[col].astype('float64').to_numpy() if col in df.columns else None
+        table = table.astype(object).where(table.notna(), None)
+
+        cursor = self.conn.execute(
+            'INSERT INTO runs (run_at, weights_hash, weights, source, players) VALUES (?, ?, ?, ?, ?)',
+            (run_at, digest, json.dumps(dict(weights)), source, len(table))
+        )
+        run_id = cursor.lastrowid
+        table.insert(0, 'run_id', run_id)
+        insert = (f"INSERT INTO results ({', '.join(table.columns)}) "
+                  f"VALUES ({', '.join('?' * len(table.columns))})")
+        self.conn.executemany(insert, table.itertuples(index=False, name=None))
+        return run_id
+
+    def has_source(self, source):
+        return self.conn.execute('SELECT 1 FROM runs WHERE source = ?', (str(source),)).fetchone() is not None
+
+    def _import_json(self, path):
+        path = Path(path)
+        source = str(path.resolve())
+        if self.has_source(source):
+            return None
+        with open(path) as f:
+            data = json.load(f)
+        records = data.get('players', data.get('results'))
+        if records is None:
+            raise ValueError(f"{path} has neither 'players' nor 'results'")
+        df = pd.DataFrame(records).rename(columns=LEGACY_COLUMNS)
+        return self._insert_run(df, data.get('weights', {}), data.get('analysis_date'), source)
+
+    def import_json(self, path):
+        """
+        Import one JSON export ('players' or legacy 'results' layout).
+
+        Returns the new run_id, or None if this file was imported before.
+        """
+        with self.conn:
+            return self._import_json(path)
+
+    def import_json_exports(self, paths):
+        """
+        Import every JSON export in paths in one transaction (all or nothing).
+
+        Returns {path: run_id, or None if that file was imported before}.
+        """
+        with self.conn:
+            return {str(path): self._import_json(path) for path in paths}
+
+    def runs(self):
+        """All runs, oldest first."""
+        return pd.read_sql_query('SELECT * FROM runs ORDER BY run_at, run_id', self.conn)
+
+    def run_results(self, run_id, top=None):
+        """One run's players in rank order."""
+        sql = 'SELECT * FROM results WHERE run_id = ? ORDER BY rank'
+        params = [run_id]
+        if top is not None:
+            sql += ' LIMIT ?'
+            params.append(top)
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def player_history(self, player, weights=None):
+        """
+        A player's results across runs, oldest first.
+
+        weights: a weights dict or hash to restrict to runs with those weights.
+        """
+        sql = 'SELECT * FROM results WHERE player = ?'
+        params = [player]
+        if weights is not None:
+            sql += ' AND weights_hash = ?'
+            params.append(weights if isinstance(weights, str) else weights_hash(weights))
+        sql += ' ORDER BY run_at'
+        return pd.read_sql_query(sql, self.conn, params=params)
@@ -0,0 +1,148 @@
+"""
+Streaming ingest for large fielding workbooks, CSVs and Parquet files.
+
+Rows are read in bounded-size batches, each batch is scored with the
+ScoringEngine and folded into per-player running totals, so peak memory
+depends on the batch size and number of players, not on the file size.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fielding_schema import enforce_schema
+from fielding_scoring import METRIC_COLUMNS
+
+# Default number of rows held in memory at once.
+BATCH_ROWS = 100_000
+
+TOTAL_COLUMNS = list(METRIC_COLUMNS) + ['PS']
+
+
+def iter_batches(filepath, batch_size=BATCH_ROWS, sheet_name=None):
+    """
+    Yield DataFrames of at most batch_size rows from an .xlsx, .csv or .parquet file.
+    
+    Batches are indexed by their row position in the whole file.
+    """
+    suffix = Path(filepath).suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        batches = _iter_excel(filepath, batch_size, sheet_name)
+    elif suffix == '.csv':
+        batches = _iter_csv(filepath, batch_size)
+    elif suffix == '.parquet':
+        batches = _iter_parquet(filepath, batch_size)
+    else:
+        raise ValueError(f"Unsupported file type '{suffix}' (expected .xlsx, .csv or .parquet)")
+
+    offset = 0
+    for batch in batches:
+        batch.index = pd.RangeIndex(offset, offset + len(batch))
+        offset += len(batch)
+        yield batch
+
+
+def _iter_csv(filepath, batch_size):
+    with pd.read_csv(filepath, chunksize=batch_size) as reader:
+        yield from reader
+
+
+def _iter_excel(filepath, batch_size, sheet_name):
+    """Read a workbook row by row with openpyxl's read-only mode."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(h) if h is not None else f'Unnamed: {i}' for i, h in enumerate(header)]
+
+        batch = []
+        for row in rows:
+            if all(v is None for v in row):
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield pd.DataFrame.from_records(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch, columns=header)
+    finally:
+        wb.close()
+
+
+def _iter_parquet(filepath, batch_size):
+    """Read a Parquet file one record batch at a time."""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(filepath)
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield record_batch.to_pandas()
+
+
+def player_totals(df):
+    """
+    Sum the metric columns and PS per player, keeping first-seen order.
+
+    Frames with a Player_ID column (see fielding_names) are grouped by the
+    ID, so differently spelled aliases of one player share a row.
+    """
+    values = df[TOTAL_COLUMNS]
+    # Widen the compact schema dtypes so season totals cannot overflow.
+    wide = {col: np.int64 for col, dtype in values.dtypes.items()
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iu'}
+    values = values.astype(wide)
+    if 'Player_ID' not in df.columns:
+        return values.groupby(df['Player_Name'], sort=False, observed=True).sum()
+
+    ids = df['Player_ID']
+    totals = values.groupby(ids, sort=False).sum()
+    first = ~ids.duplicated().to_numpy()
+    names = pd.Series(df['Player_Name'].astype(str).to_numpy()[first], index=ids.to_numpy()[first])
+    totals.index = pd.Index(names.reindex(totals.index).to_numpy(), name='Player_Name')
+    return totals
+
+
+def rank_players(totals):
+    """Turn a per-player totals frame into a ranking sorted by PS."""
+    ranked = totals.sort_values('PS', ascending=False, kind='stable')
+    return ranked.reset_index()
+
+
+class RunningTotals:
+    """Folds scored batches into per-player totals."""
+
+    def __init__(self):
+        self.totals = None
+        self.rows = 0
+        self.batches = 0
+
+    def add(self, df):
+        """Fold one scored batch into the running totals."""
+        partial = player_totals(df)
+        if self.totals is None:
+            self.totals = partial
+        else:
+            self.totals = pd.concat([self.totals, partial]).groupby(level=0, sort=False).sum()
+        self.rows += len(df)
+        self.batches += 1
+
+    def ranking(self):
+        """Return the players ranked by cumulative PS."""
+        if self.totals is None:
+            return pd.DataFrame(columns=['Player_Name'] + TOTAL_COLUMNS)
+        return rank_players(self.totals)
+
+
+def stream_rankings(filepath, engine, batch_size=BATCH_ROWS, sheet_name=None):
+    """Score every batch of a file with engine and return (ranking, RunningTotals)."""
+    running = RunningTotals()
+    for batch in iter_batches(filepath, batch_size, sheet_name):
+        enforce_schema(batch)
+        batch['PS'] = engine.score(batch)
+        running.add(batch)
+    return running.ranking(), running
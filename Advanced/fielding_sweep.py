@@ -0,0 +1,217 @@
+"""
+Weight sensitivity sweep for the Performance Score.
+
+Scores every player under thousands of candidate WEIGHTS at once with a
+matrix-matrix product (players × metrics @ metrics × configs) and
+reports how stable each player's rank is: rank distribution, top-K
+membership frequency, and Kendall's tau-b of every configuration's
+ranking against the baseline weights.
+
+Configurations are processed in chunks sized to a memory budget, and
+only running per-player statistics are kept, so 10k configurations ×
+10k players never needs the full 10k × 10k rank matrix.
+
+    configs = grid_configs(IPLFieldingAnalyzer.WEIGHTS, {'WDC': [-3, -4], 'WDH': [1, 2, 3]})
+    result = sweep(players_df, IPLFieldingAnalyzer.WEIGHTS, configs, top_k=5)
+    print(result.players.head())
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from fielding_scoring import METRIC_COLUMNS, WEIGHT_KEYS
+
+# Working memory allowed for one chunk of configurations.
+DEFAULT_BUDGET_BYTES = 256 * 2**20
+
+# Rank histogram resolution used for the approximate rank quantiles.
+RANK_BINS = 100
+
+
+def grid_configs(base, options):
+    """Every combination of the candidate values in options; other weights stay at base."""
+    keys = list(options)
+    rows = [dict(base, **dict(zip(keys, values))) for values in itertools.product(*options.values())]
+    return pd.DataFrame(rows, columns=list(base))
+
+
+def random_configs(base, n, spread=1, seed=None, integer=True):
+    """n random configurations, each weight drawn uniformly from base ± spread."""
+    rng = np.random.default_rng(seed)
+    base_vec = np.array([base[key] for key in base], dtype=np.float64)
+    draws = base_vec + rng.uniform(-spread, spread, size=(n, len(base_vec)))
+    if integer:
+        draws = np.rint(draws).astype(np.int64)
+    return pd.DataFrame(draws, columns=list(base))
+
+
+def weight_matrix(configs):
+    """(9 × configs) matrix in METRIC_COLUMNS order; RS always weighs 1."""
+    rows = [configs[key].to_numpy(dtype=np.float64) if key else np.ones(len(configs))
+            for key in WEIGHT_KEYS.values()]
+    return np.vstack(rows)
+
+
+def _min_ranks(scores):
+    """Competition ranks (1 = best, ties share the best rank) along axis 1 of (c × P) scores."""
+    c, n = scores.shape
+    order = np.argsort(-scores, axis=1)
+    ordered = np.take_along_axis(scores, order, axis=1)
+    is_new = np.ones((c, n), dtype=bool)
+    is_new[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    starts = np.maximum.accumulate(np.where(is_new, np.arange(n), 0), axis=1)
+    ranks = np.empty((c, n), dtype=np.int64)
+    np.put_along_axis(ranks, order, starts + 1, axis=1)
+    return ranks
+
+
+def _tie_pairs(sorted_rows):
+    """Number of tied pairs per row of an array whose rows are sorted."""
+    c, n = sorted_rows.shape
+    if n < 2:
+        return np.zeros(c, dtype=np.int64)
+    is_new = np.ones((c, n), dtype=bool)
+    is_new[:, 1:] = sorted_rows[:, 1:] != sorted_rows[:, :-1]
+    starts = np.maximum.accumulate(np.where(is_new, np.arange(n), 0), axis=1)
+    # Each element is tied with every earlier element of its run.
+    return (np.arange(n) - starts).sum(axis=1)
+
+
+def _count_inversions(values):
+    """Strict inversions (i < j, v[i] > v[j]) per row of a (c × n) int array with values in [0, n)."""
+    c, n = values.shape
+    inversions = np.zeros(c, dtype=np.int64)
+    cur = values.astype(np.int64)
+    pos = np.arange(n)
+    width = 1
+    # Bottom-up merge sort run on all rows at once: keys are offset by a
+    # per-(row, block) id so one stable sort merges every block pair. A
+    # right-half element jumps ahead of exactly the left-half elements
+    # greater than it, so its inversions are how far it moves.
+    while width < n:
+        block = pos // (2 * width)
+        right = (pos // width) % 2 == 1
+        gid = np.arange(c)[:, None] * (block[-1] + 1) + block[None, :]
+        keys = (gid * n + cur).ravel()
+        order = np.argsort(keys, kind='stable')
+        moved = order - np.arange(c * n)
+        inversions += np.where(right[order % n], moved, 0).reshape(c, n).sum(axis=1)
+        cur = keys[order].reshape(c, n) - gid * n
+        width *= 2
+    return inversions
+
+
+def kendall_tau_b(baseline, scores):
+    """
+    Kendall's tau-b of each row of scores (c × P) against baseline (P,).
+
+    Uses Knight's O(P log P) method: order by (baseline, score), count
+    discordant pairs as inversions, correct for ties.
+    """
+    c, n = scores.shape
+    total = n * (n - 1) // 2
+    base_sorted = np.sort(baseline)
+    x_ties = _tie_pairs(base_sorted[None, :])[0]
+
+    order = np.lexsort((scores, np.broadcast_to(baseline, scores.shape)), axis=1)
+    y = np.take_along_axis(scores, order, axis=1)
+    x = baseline[order]
+    joint_new = np.ones((c, n), dtype=bool)
+    joint_new[:, 1:] = (y[:, 1:] != y[:, :-1]) | (x[:, 1:] != x[:, :-1])
+    joint_starts = np.maximum.accumulate(np.where(joint_new, np.arange(n), 0), axis=1)
+    joint_ties = (np.arange(n) - joint_starts).sum(axis=1)
+
+    y_ranks = _min_ranks(-y) - 1              # ascending ranks in [0, n), ties equal
+    discordant = _count_inversions(y_ranks)
+    y_ties = _tie_pairs(np.sort(scores, axis=1))
+
+    concordant = total - x_ties - y_ties + joint_ties - discordant
+    denom = np.sqrt((total - x_ties).astype(np.float64) * (total - y_ties))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denom > 0, (concordant - discordant) / denom, np.nan)
+
+
+class SweepResult:
+    """Per-player rank stability and per-configuration agreement with the baseline."""
+
+    def __init__(self, players, configs, top_k):
+        self.players = players
+        self.configs = configs
+        self.top_k = top_k
+
+    def summary(self, rows=10):
+        """Printable digest: tau spread plus the top of the baseline ranking with its stability."""
+        lines = [f"{len(self.configs)} weight configurations × {len(self.players)} players"]
+        if 'Kendall_Tau' in self.configs:
+            tau = self.configs['Kendall_Tau']
+            lines.append(f"Kendall tau vs baseline: min {tau.min():.3f}, median {tau.median():.3f}, "
+                         f"max {tau.max():.3f}")
+        lines.append("")
+        cols = ['Player_Name', 'Baseline_Rank', 'Mean_Rank', 'Std_Rank', 'Best_Rank', 'Worst_Rank',
+                f'Top{self.top_k}_Freq']
+        lines.append(self.players[cols].head(rows).to_string(index=False))
+        return '\n'.join(lines)
+
+
+def sweep(players_df, base_weights, configs, top_k=10, kendall=True,
+          budget_bytes=DEFAULT_BUDGET_BYTES):
+    """
+    Rank every player under every configuration in configs (one row per weight set).
+
+    players_df needs Player_Name and the metric columns (one row per player).
+    """
+    X = players_df[list(METRIC_COLUMNS)].to_numpy(dtype=np.float64)
+    n_players = len(X)
+    W = weight_matrix(configs)
+    n_configs = W.shape[1]
+
+    base_scores = X @ weight_matrix(pd.DataFrame([base_weights]))[:, 0]
+    base_ranks = _min_ranks(base_scores[None, :])[0]
+
+    # About a dozen (players × chunk) temporaries are alive per chunk.
+    chunk = max(1, min(n_configs, budget_bytes // (12 * 8 * max(n_players, 1))))
+
+    rank_sum = np.zeros(n_players)
+    rank_sqsum = np.zeros(n_players)
+    rank_min = np.full(n_players, np.iinfo(np.int64).max)
+    rank_max = np.zeros(n_players, dtype=np.int64)
+    top_count = np.zeros(n_players, dtype=np.int64)
+    bin_width = max(1, -(-n_players // RANK_BINS))
+    histogram = np.zeros((n_players, RANK_BINS), dtype=np.int64)
+    taus = np.full(n_configs, np.nan)
+
+    player_idx = np.arange(n_players)
+    for start in range(0, n_configs, chunk):
+        scores = (X @ W[:, start:start + chunk]).T          # (chunk × players)
+        ranks = _min_ranks(scores)
+        rank_sum += ranks.sum(axis=0)
+        rank_sqsum += (ranks.astype(np.float64) ** 2).sum(axis=0)
+        rank_min = np.minimum(rank_min, ranks.min(axis=0))
+        rank_max = np.maximum(rank_max, ranks.max(axis=0))
+        top_count += (ranks <= top_k).sum(axis=0)
+        cells = player_idx * RANK_BINS + (ranks - 1) // bin_width
+        histogram += np.bincount(cells.ravel(), minlength=histogram.size).reshape(histogram.shape)
+        if kendall:
+            taus[start:start + len(scores)] = kendall_tau_b(base_scores, scores)
+
+    mean = rank_sum / n_configs
+    std = np.sqrt(np.maximum(rank_sqsum / n_configs - mean ** 2, 0))
+    median_bin = (np.cumsum(histogram, axis=1) >= (n_configs + 1) / 2).argmax(axis=1)
+
+    players = pd.DataFrame({
+        'Player_Name': players_df['Player_Name'].astype(str).to_numpy(),
+        'Baseline_Rank': base_ranks,
+        'Mean_Rank': mean,
+        'Std_Rank': std,
+        'Best_Rank': rank_min,
+        'Worst_Rank': rank_max,
+        'Median_Rank_Bucket': median_bin * bin_width + 1,
+        f'Top{top_k}_Freq': top_count / n_configs
+    }).sort_values(['Baseline_Rank', 'Player_Name'], kind='stable').reset_index(drop=True)
+
+    configs = configs.reset_index(drop=True).copy()
+    if kendall:
+        configs['Kendall_Tau'] = taus
+    return SweepResult(players, configs, top_k)
@@ -0,0 +1,193 @@
+"""
+Per-stage timing for the analyzer pipeline.
+
+A Tracer records, for every stage it wraps: wall and CPU time, rows
+handled, the process's peak RSS so far and, optionally, a cProfile dump.
+Stages nest (load -> score) and are written as a JSON trace plus a
+summary table. Only one profiler can be active at a time, so the dump is
+made for each outermost stage and covers the stages nested in it.
+
+    tracer = Tracer(enabled=True, profile_dir='cricket_analysis/profiles')
+    with tracer.stage('score', rows=len(df)):
+        ...
+    tracer.write_json('trace.json')
+    print(tracer.summary())
+
+A disabled Tracer hands out one shared no-op stage, and @traced methods
+check `tracer.enabled` before doing anything else, so tracing costs an
+attribute lookup when it is off. Standard library only.
+"""
+
+import functools
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# resource (peak RSS) only exists on Unix.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# ru_maxrss is in bytes on macOS and in KiB on Linux and the BSDs.
+MAXRSS_PER_MB = 2**20 if sys.platform == 'darwin' else 2**10
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / MAXRSS_PER_MB
+
+
+class _NullStage:
+    """Stand-in stage used while tracing is disabled."""
+
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """One timed stage; set .rows inside the with-block if not known up front."""
+
+    def __init__(self, tracer, name, rows):
+        self.tracer = tracer
+        self.name = name
+        self.rows = rows
+        self.record = None
+        self._profiler = None
+
+    def __enter__(self):
+        tracer = self.tracer
+        self.depth = len(tracer._open)
+        tracer._open.append(self)
+        if tracer.profile_dir is not None and self.depth == 0:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        tracer = self.tracer
+        tracer._open.pop()
+        self.record = {
+            'stage': self.name,
+            'depth': self.depth,
+            'start_s': round(self._wall - tracer._origin, 6),
+            'wall_s': round(wall, 6),
+            'cpu_s': round(cpu, 6),
+            'rows': self.rows,
+            'peak_rss_mb': peak_rss_mb(),
+            'error': exc_type.__name__ if exc_type else None
+        }
+        if self._profiler is not None:
+            self._profiler.disable()
+            path = tracer.profile_dir / f'{len(tracer.records):03d}_{self.name}.prof'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._profiler.dump_stats(path)
+            self.record['profile'] = str(path)
+        tracer.records.append(self.record)
+        return False
+
+
+class Tracer:
+    """Collects Stage records; disabled tracers record nothing."""
+
+    def __init__(self, enabled=False, profile_dir=None):
+        self.enabled = enabled or profile_dir is not None
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self.records = []
+        self._open = []
+        self._origin = time.perf_counter()
+        self.started = datetime.now().isoformat()
+
+    def stage(self, name, rows=None):
+        """Context manager timing one stage."""
+        if not self.enabled:
+            return NULL_STAGE
+        return Stage(self, name, rows)
+
+    def totals(self):
+        """Per stage name, in order of first start: calls plus wall, CPU and rows summed over every call."""
+        totals = {}
+        for record in sorted(self.records, key=lambda r: r['start_s']):
+            entry = totals.setdefault(record['stage'], {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'rows': 0,
+                                                        'depth': record['depth'], 'peak_rss_mb': None})
+            entry['calls'] += 1
+            entry['wall_s'] += record['wall_s']
+            entry['cpu_s'] += record['cpu_s']
+            entry['rows'] += record['rows'] or 0
+            entry['depth'] = min(entry['depth'], record['depth'])
+            if record['peak_rss_mb'] is not None:
+                entry['peak_rss_mb'] = max(entry['peak_rss_mb'] or 0, record['peak_rss_mb'])
+        return totals
+
+    def to_dict(self):
+        return {
+            'started': self.started,
+            'wall_s': round(time.perf_counter() - self._origin, 6),
+            'stages': self.records,
+            'totals': self.totals()
+        }
+
+    def write_json(self, path):
+        """Write the machine-readable trace."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def summary(self):
+        """Plain-text table of the per-stage totals (nested stages indented)."""
+        headers = ['stage', 'calls', 'wall s', 'cpu s', 'rows', 'peak RSS MB']
+        rows = [[' ' * 2 * t['depth'] + name, str(t['calls']), f"{t['wall_s']:.3f}", f"{t['cpu_s']:.3f}",
+                 f"{t['rows']:,}" if t['rows'] else '-',
+                 f"{t['peak_rss_mb']:,.0f}" if t['peak_rss_mb'] is not None else '-']
+                for name, t in self.totals().items()]
+        widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h) for i, h in enumerate(headers)]
+        lines = ['  '.join(h.ljust(w) if i == 0 else h.rjust(w) for i, (h, w) in enumerate(zip(headers, widths)))]
+        lines.append('-' * len(lines[0]))
+        for row in rows:
+            lines.append('  '.join(c.ljust(w) if i == 0 else c.rjust(w) for i, (c, w) in enumerate(zip(row, widths))))
+        return '\n'.join(lines)
+
+
+def _row_count(args, result):
+    """Rows handled by a call: the result's, else the first frame-like argument's."""
+    for value in (result, *args):
+        shape = getattr(value, 'shape', None)
+        if shape:
+            return shape[0]
+    return None
+
+
+def traced(name):
+    """Method decorator timing calls as stage `name` on self.tracer."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = self.tracer
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            with tracer.stage(name) as stage:
+                result = method(self, *args, **kwargs)
+                stage.rows = _row_count(args, result)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,162 @@
+"""
+Time-windowed fielding aggregates per player.
+
+Event history is first collapsed to one row per (player, match) in
+match order. Every window is then answered from per-player prefix sums
+computed in one pass: a window over matches i..j costs
+prefix[j] - prefix[i-1], whatever its length.
+
+    form = rolling_sums(match_totals(history), size=5)        # last 5 matches
+    blocks = tumbling_sums(match_totals(history), size=10)    # matches 1-10, 11-20, ...
+    by_venue = breakdown(history, 'Venue')
+
+RollingWindows keeps just enough state (each player's last few matches
+and running totals) to extend those results when new matches arrive.
+"""
+
+import numpy as np
+import pandas as pd
+
+MATCH_COLUMN = 'Match_No'
+
+
+def match_totals(events, columns=('PS',), match_col=MATCH_COLUMN):
+    """
+    Collapse events to one row per (player, match), grouped by player.
+
+    Matches keep the order they first appear in within each player, so the
+    input is expected to be chronological. Adds Match_Seq (1-based per player).
+    """
+    totals = (events.groupby(['Player_Name', match_col], sort=False, observed=True)[list(columns)]
+              .sum().reset_index())
+    totals = totals.sort_values('Player_Name', kind='stable').reset_index(drop=True)
+    totals['Match_Seq'] = totals.groupby('Player_Name', sort=False, observed=True).cumcount() + 1
+    return totals
+
+
+def _group_starts(players):
+    """Index of the first row of each row's player block (rows grouped by player)."""
+    codes = pd.factorize(players)[0]
+    is_start = np.ones(len(codes), dtype=bool)
+    is_start[1:] = codes[1:] != codes[:-1]
+    return np.maximum.accumulate(np.where(is_start, np.arange(len(codes)), 0))
+
+
+def _prefix(values):
+    """Prefix sums with a leading zero: window i..j is prefix[j + 1] - prefix[i]."""
+    prefix = np.zeros(len(values) + 1, dtype=np.result_type(values.dtype, np.int64))
+    np.cumsum(values, out=prefix[1:])
+    return prefix
+
+
+def rolling_sums(totals, size, columns=('PS',)):
+    """Add '<col>_last<size>': each player's sum over their last `size` matches."""
+    out = totals.copy()
+    starts = _group_starts(out['Player_Name'].to_numpy())
+    rows = np.arange(len(out))
+    lower = np.maximum(rows + 1 - size, starts)
+    for col in columns:
+        prefix = _prefix(out[col].to_numpy())
+        out[f'{col}_last{size}'] = prefix[rows + 1] - prefix[lower]
+    return out
+
+
+def expanding_sums(totals, columns=('PS',)):
+    """Add '<col>_total': each player's running total up to and including the match."""
+    out = totals.copy()
+    starts = _group_starts(out['Player_Name'].to_numpy())
+    rows = np.arange(len(out))
+    for col in columns:
+        prefix = _prefix(out[col].to_numpy())
+        out[f'{col}_total'] = prefix[rows + 1] - prefix[starts]
+    return out
+
+
+def tumbling_sums(totals, size, columns=('PS',)):
+    """
+    One row per (player, block of `size` matches): matches 1..size, size+1..2*size, ...
+
+    The last block of a player may be partial; 'Matches' says how many it holds.
+    """
+    players = totals['Player_Name'].to_numpy()
+    starts = _group_starts(players)
+    seq = totals['Match_Seq'].to_numpy()
+    rows = np.arange(len(totals))
+
+    # A block ends where the next match starts a new block or a new player.
+    ends = np.zeros(len(totals), dtype=bool)
+    ends[-1:] = True
+    ends[:-1] = (seq[:-1] % size == 0) | (starts[1:] != starts[:-1])
+    end_rows = rows[ends]
+    begin_rows = np.maximum(end_rows - (seq[end_rows] - 1) % size, starts[end_rows])
+
+    out = pd.DataFrame({
+        'Player_Name': totals['Player_Name'].to_numpy()[end_rows],
+        'Window': (seq[end_rows] - 1) // size + 1,
+        'Matches': end_rows - begin_rows + 1
+    })
+    for col in columns:
+        prefix = _prefix(totals[col].to_numpy())
+        out[col] = prefix[end_rows + 1] - prefix[begin_rows]
+    return out
+
+
+def breakdown(events, by, columns=('PS',)):
+    """Per-player totals split by another column (e.g. 'Season' or 'Venue'), best first."""
+    keys = [by, 'Player_Name'] if isinstance(by, str) else list(by) + ['Player_Name']
+    table = events.groupby(keys, sort=False, observed=True)[list(columns)].sum().reset_index()
+    return table.sort_values(keys[:-1] + [columns[0]], ascending=[True] * (len(keys) - 1) + [False],
+                             kind='stable').reset_index(drop=True)
+
+
+class RollingWindows:
+    """
+    Incremental rolling/expanding windows over each player's matches.
+
+    Usage:
+        windows = RollingWindows(size=5)
+        form = windows.extend(season_events)     # rows for every match so far
+        form = windows.extend(next_match_events) # rows for the new matches only
+
+    Between calls only each player's last size-1 matches are kept, plus the
+    match count and totals of everything older (prior).
+    """
+
+    def __init__(self, size=5, columns=('PS',), match_col=MATCH_COLUMN):
+        self.size = size
+        self.columns = list(columns)
+        self.match_col = match_col
+        self.tail = None
+        self.prior = pd.DataFrame(columns=['Matches'] + self.columns, dtype='int64')
+
+    def extend(self, events):
+        """Add new matches (appended after everything seen) and return their window rows."""
+        new = match_totals(events, self.columns, self.match_col)
+        new['_new'] = True
+        combined = new
+        if self.tail is not None and len(self.tail):
+            combined = pd.concat([self.tail.assign(_new=False), new], ignore_index=True)
+            combined = combined.sort_values('Player_Name', kind='stable').reset_index(drop=True)
+
+        # Continue each player's match numbering and running totals from earlier calls.
+        players = combined['Player_Name'].astype(str)
+        prior = self.prior.reindex(players, fill_value=0)
+        combined['Match_Seq'] = (combined.groupby('Player_Name', sort=False, observed=True).cumcount() + 1
+                                 + prior['Matches'].to_numpy())
+
+        result = expanding_sums(rolling_sums(combined, self.size, self.columns), self.columns)
+        for col in self.columns:
+            result[f'{col}_total'] += prior[col].to_numpy()
+
+        self._keep_tail(combined, players)
+        return result[result['_new']].drop(columns='_new').reset_index(drop=True)
+
+    def _keep_tail(self, combined, players):
+        """Keep each player's last size-1 matches; fold older ones into prior."""
+        from_end = combined.groupby('Player_Name', sort=False, observed=True).cumcount(ascending=False)
+        keep = (from_end < self.size - 1).to_numpy()
+        if not keep.all():
+            dropped = combined.loc[~keep, self.columns].assign(Matches=1)
+            folded = dropped.groupby(players[~keep].to_numpy()).sum()
+            self.prior = pd.concat([self.prior, folded[self.prior.columns]]).groupby(level=0).sum()
+        self.tail = combined[keep].drop(columns='_new').reset_index(drop=True)
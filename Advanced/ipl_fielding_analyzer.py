@@ -13,11 +13,16 @@ IPL Cricket Fielding Performance Analysis Tool
 Based on Performance Score Formula with Weighted Metrics
 """
 
-import pandas as pd
-import json
+import argparse
+import sys
 from datetime import datetime
 from pathlib import Path
 
+from fielding_trace import Tracer, traced
+
+# pandas, NumPy, openpyxl and pyarrow are imported inside the methods that
+# need them, so importing this module (or running --help) stays fast.
+
 
 class IPLFieldingAnalyzer:
     """
@@ -50,11 +55,110 @@ class IPLFieldingAnalyzer:
         'WDH': 2     # Direct Hits
     }
     
-    def __init__(self):
-        """Initialize the analyzer."""
-        self.output_dir = Path('cricket_analysis')
-        self.output_dir.mkdir(exist_ok=True)
-        print(self._banner())
+    def __init__(self, weights=None, use_cache=True, cache_max_bytes=None,
+                 output_dir='cricket_analysis', quiet=False, tracer=None, resolve_names=True):
+        """
+        Initialize the analyzer. Nothing is imported, created or printed here.
+        
+        weights: optional dict overriding some WEIGHTS, e.g. {'WDC': -4}.
+        use_cache: keep parsed workbooks under <output_dir>/cache (needs pyarrow).
+        quiet: suppress [OK]/[INFO] messages (errors are still printed).
+        tracer: a fielding_trace.Tracer to time each pipeline stage (off by default).
+        resolve_names: map spellings of a name (case, spacing, punctuation) to one
+            Player_ID through the alias table at <output_dir>/players.json. Near
+            matches ('Axer Patel'/'Axar Patel') are only suggested until confirmed
+            with `aliases --add`.
+        """
+        unknown = [key for key in (weights or {}) if key not in self.WEIGHTS]
+        if unknown:
+            raise KeyError(f"Unknown weight(s): {', '.join(unknown)}. Expected: {', '.join(self.WEIGHTS)}")
+        self.weights = {**self.WEIGHTS, **(weights or {})}
+        self.output_dir = Path(output_dir)
+        self.use_cache = use_cache
+        self.cache_max_bytes = cache_max_bytes
+        self.quiet = quiet
+        self.tracer = tracer or Tracer()
+        self.resolve_names = resolve_names
+        self.leaderboard = None
+        self.form_windows = None
+        self.event_tallies = None
+        self._engine = None
+        self._cache = None
+        self._store = None
+        self._registry = None
+    
+    @property
+    def engine(self):
+        """ScoringEngine for the current weights (NumPy is imported on first use)."""
+        if self._engine is None:
+            from fielding_scoring import ScoringEngine
+            self._engine = ScoringEngine(self.weights)
+        return self._engine
+    
+    @property
+    def cache(self):
+        """Parsed-workbook cache, or None when disabled or pyarrow is missing."""
+        if self._cache is None and self.use_cache:
+            import pandas as pd
+            from fielding_cache import ARROW_AVAILABLE, DEFAULT_MAX_BYTES, ParsedFrameCache
+            from fielding_schema import SCHEMA_VERSION
+            if not ARROW_AVAILABLE:
+                self.use_cache = False
+                return None
+            # Cached frames are _parse_excel's output: a new schema or pandas parses afresh.
+            self._cache = ParsedFrameCache(self.output_dir / 'cache',
+                                           self.cache_max_bytes or DEFAULT_MAX_BYTES,
+                                           version=f'schema-{SCHEMA_VERSION} pandas-{pd.__version__}')
+        return self._cache
+    
+    @property
+    def store(self):
+        """SQLite results store at <output_dir>/results.sqlite (opened on first use)."""
+        if self._store is None:
+            from fielding_store import ResultsStore
+            self._store = ResultsStore(self.output_dir / 'results.sqlite')
+        return self._store
+    
+    @property
+    def registry(self):
+        """Player alias table at <output_dir>/players.json (loaded on first use)."""
+        if self._registry is None:
+            from fielding_names import PlayerRegistry
+            self._registry = PlayerRegistry.load(self.output_dir / 'players.json')
+        return self._registry
+    
+    @traced('resolve_names')
+    def attach_player_ids(self, df):
+        """Add Player_ID and canonical Player_Name to df (in place) and persist new aliases."""
+        if not self.resolve_names or 'Player_Name' not in df.columns or df.empty:
+            return df
+        registry = self.registry
+        suggested = len(registry.suggestions)
+        registry.attach_ids(df)
+        registry.save()
+        for key in list(registry.suggestions)[suggested:]:
+            name, similar = registry.names[registry.aliases[key][0]], registry.names[registry.suggestions[key]]
+            self._log(f"[INFO] '{name}' looks like '{similar}' but is kept separate; if they are one player, "
+                      f"run: aliases --add \"{name}={similar}\"")
+        return df
+    
+    def _consolidate(self, ranking):
+        """Merge ranking rows whose names resolve to the same player."""
+        if not self.resolve_names or ranking is None or ranking.empty:
+            return ranking
+        from fielding_stream import player_totals, rank_players
+        
+        return rank_players(player_totals(self.attach_player_ids(ranking)))
+    
+    def _log(self, message):
+        """Print a progress message unless running quietly."""
+        if not self.quiet:
+            print(message)
+    
+    def _output_file(self, name):
+        """Return a path in the output folder, creating the folder on first write."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / name
     
     def _banner(self):
         """Return application banner."""
@@ -67,8 +171,12 @@ class IPLFieldingAnalyzer:
 ╚════════════════════════════════════════════════════════════════════════════╝
 """
     
+    @traced('sample_data')
     def create_sample_data(self):
         """Create sample IPL fielding data matching the Excel format."""
+        import pandas as pd
+        from fielding_schema import enforce_schema
+        
         # Sample Performance Matrix data
         performance_data = {
             'Player_Name': ['Risee russouw', 'Phil Salt', 'Yash Dhull', 'Axer Patel', 'Lalit yadav', 'Aman Khan', 'Kuldeep yadav'],
@@ -83,57 +191,185 @@ class IPLFieldingAnalyzer:
             'RS': [3, -1, 3, 0, -2, 1, 4]     # Runs Saved
         }
         
-        df = pd.DataFrame(performance_data)
+        df = enforce_schema(pd.DataFrame(performance_data))
         
         # Calculate Performance Score
-        df['PS'] = (
-            df['CP'] * self.WEIGHTS['WCP'] +
-            df['GT'] * self.WEIGHTS['WGT'] +
-            df['C'] * self.WEIGHTS['WC'] +
-            df['DC'] * self.WEIGHTS['WDC'] +
-            df['ST'] * self.WEIGHTS['WST'] +
-            df['RO'] * self.WEIGHTS['WRO'] +
-            df['MRO'] * self.WEIGHTS['WMRO'] +
-            df['DH'] * self.WEIGHTS['WDH'] +
-            df['RS']
-        )
+        return self.score(df)
+    
+    @traced('load_excel')
+    def load_from_excel(self, filepath, sheet_name=0):
+        """
+        Load fielding data from Excel file (scored if it has the metric columns).
+        
+        Parsed sheets are cached by content hash, so warm runs skip Excel parsing.
+        """
+        from fielding_schema import is_performance_matrix
+        
+        try:
+            if self.cache is not None:
+                df = self.cache.load(filepath, sheet_name, self._parse_excel)
+            else:
+                df = self._parse_excel(filepath, sheet_name)
+            self._log(f"[OK] Loaded {len(df)} records from {filepath}")
+        except Exception as e:
+            print(f"[ERROR] Could not load Excel file: {e}")
+            return None
         
+        if is_performance_matrix(df):
+            self.attach_player_ids(df)
+            self.score(df)
         return df
     
-    def load_from_excel(self, filepath):
-        """Load fielding data from Excel file."""
+    @staticmethod
+    def _parse_excel(filepath, sheet_name):
+        """
+        Read one sheet and coerce it to the fielding schema if it is a Performance Matrix.
+        
+        Its output is cached: bump fielding_schema.SCHEMA_VERSION when this changes.
+        """
+        import pandas as pd
+        from fielding_schema import enforce_schema, is_performance_matrix
+        
+        df = pd.read_excel(filepath, sheet_name=sheet_name)
+        if is_performance_matrix(df):
+            enforce_schema(df)
+        return df
+    
+    @traced('load')
+    def load(self, filepath):
+        """Load and score an .xlsx, .csv or .parquet file."""
+        suffix = Path(filepath).suffix.lower()
+        if suffix in ('.xlsx', '.xlsm', '.xls'):
+            return self.load_from_excel(filepath)
+        
+        import pandas as pd
+        from fielding_schema import enforce_schema
+        
         try:
-            df = pd.read_excel(filepath)
-            print(f"[OK] Loaded {len(df)} records from {filepath}")
-            return df
+            if suffix == '.csv':
+                df = pd.read_csv(filepath)
+            elif suffix == '.parquet':
+                df = pd.read_parquet(filepath)
+            else:
+                raise ValueError(f"unsupported file type '{suffix}'")
+            enforce_schema(df)
         except Exception as e:
-            print(f"[ERROR] Could not load Excel file: {e}")
+            print(f"[ERROR] Could not load {filepath}: {e}")
+            return None
+        
+        self._log(f"[OK] Loaded {len(df)} records from {filepath}")
+        self.attach_player_ids(df)
+        return self.score(df)
+    
+    @traced('load_streaming')
+    def load_streaming(self, filepath, batch_size=None, sheet_name=None):
+        """
+        Score a large .xlsx/.csv/.parquet file in batches and return per-player totals.
+        
+        Memory stays bounded by batch_size; the ranking matches
+        aggregate_players(load_from_excel(filepath)).
+        """
+        from fielding_stream import BATCH_ROWS, stream_rankings
+        
+        try:
+            ranking, running = stream_rankings(filepath, self.engine, batch_size or BATCH_ROWS, sheet_name)
+        except Exception as e:
+            print(f"[ERROR] Could not stream {filepath}: {e}")
             return None
+        
+        self._log(f"[OK] Streamed {running.rows} records in {running.batches} batches "
+              f"({len(ranking)} players) from {filepath}")
+        return self._consolidate(ranking)
+    
+    @traced('load_events')
+    def load_events(self, filepath, sheet_name=0):
+        """
+        Build and score the Performance Matrix from a ball-by-ball event log.
+        
+        Starts a fresh tally; use append_events() to add later events.
+        """
+        from fielding_events import EventTallies, read_events
+        
+        try:
+            events = read_events(filepath, sheet_name)
+            self.event_tallies = EventTallies().add(events)
+        except Exception as e:
+            print(f"[ERROR] Could not load events from {filepath}: {e}")
+            return None
+        
+        self._log(f"[OK] Tallied {self.event_tallies.events} events "
+                  f"({len(self.event_tallies.players)} players) from {filepath}")
+        return self._scored_tallies()
+    
+    @traced('append_events')
+    def append_events(self, events):
+        """Add a frame of new events to the running tally and return the rescored matrix."""
+        from fielding_events import EventTallies
+        
+        if self.event_tallies is None:
+            self.event_tallies = EventTallies()
+        self.event_tallies.add(events)
+        return self._scored_tallies()
+    
+    def _scored_tallies(self):
+        from fielding_schema import enforce_schema
+        
+        df = self.event_tallies.to_frame()
+        enforce_schema(df)
+        self.attach_player_ids(df)
+        return self.score(df)
+    
+    @traced('aggregate')
+    def aggregate_players(self, df):
+        """Total each player's metrics and PS across all rows, ranked by PS."""
+        from fielding_stream import player_totals, rank_players
+        
+        if 'PS' not in df.columns:
+            self.score(df)
+        return rank_players(player_totals(df))
+    
+    @traced('analyze_directory')
+    def analyze_directory(self, directory, workers=None, compare_serial=False):
+        """
+        Score every match sheet under a directory in parallel and merge one season ranking.
+        
+        workers defaults to the available cores; compare_serial re-runs the
+        batch in one process to report the speedup.
+        """
+        from fielding_batch import analyze_directory
+        
+        report = analyze_directory(directory, self.weights, workers, compare_serial)
+        self._log(report.summary())
+        self._log(f"[OK] Ranked {len(report.ranking)} players from {directory}")
+        return self._consolidate(report.ranking)
+    
+    @traced('score')
+    def score(self, df, overrides=None):
+        """
+        Set the PS column of a frame in one vectorized pass.
+        
+        overrides: optional dict of weights for this call only, e.g. {'WDC': -4}.
+        """
+        engine = self.engine.with_overrides(**overrides) if overrides else self.engine
+        df['PS'] = engine.score(df)
+        return df
     
     def calculate_performance_score(self, row):
-        """Calculate PS for a single player."""
-        ps = (
-            row['CP'] * self.WEIGHTS['WCP'] +
-            row['GT'] * self.WEIGHTS['WGT'] +
-            row['C'] * self.WEIGHTS['WC'] +
-            row['DC'] * self.WEIGHTS['WDC'] +
-            row['ST'] * self.WEIGHTS['WST'] +
-            row['RO'] * self.WEIGHTS['WRO'] +
-            row['MRO'] * self.WEIGHTS['WMRO'] +
-            row['DH'] * self.WEIGHTS['WDH'] +
-            row['RS']
-        )
-        return ps
-    
-    def analyze_players(self, df):
-        """Analyze and rank players by performance score."""
+        """Calculate PS for a single player (use score() for whole frames)."""
+        return self.engine.score_row(row)
+    
+    @traced('analyze_players')
+    def analyze_players(self, df, verbose=True):
+        """Analyze and rank players by performance score (verbose prints each player)."""
+        # Sort by Performance Score
+        df_sorted = df.sort_values('PS', ascending=False).reset_index(drop=True)
+        if not verbose:
+            return df_sorted
+        
         print("\n" + "=" * 80)
         print("IPL FIELDING PERFORMANCE ANALYSIS")
         print("=" * 80 + "\n")
         
-        # Sort by Performance Score
-        df_sorted = df.sort_values('PS', ascending=False).reset_index(drop=True)
-        
         # Display results
         for idx, row in df_sorted.iterrows():
             print(f"{idx + 1}. {row['Player_Name']}")
@@ -142,131 +378,480 @@ class IPLFieldingAnalyzer:
             print(f"   ST={row['ST']}, RO={row['RO']}, MRO={row['MRO']}, DH={row['DH']}, RS={row['RS']:+.0f}")
             
             # Show calculation
-            calc = (f"   PS = ({row['CP']}×1) + ({row['GT']}×1) + ({row['C']}×1) + "
-                   f"({row['DC']}×-3) + ({row['ST']}×3) + ({row['RO']}×3) + "
-                   f"({row['MRO']}×-2) + ({row['DH']}×2) + {row['RS']:+.0f}")
+            w = self.weights
+            calc = (f"   PS = ({row['CP']}×{w['WCP']}) + ({row['GT']}×{w['WGT']}) + ({row['C']}×{w['WC']}) + "
+                   f"({row['DC']}×{w['WDC']}) + ({row['ST']}×{w['WST']}) + ({row['RO']}×{w['WRO']}) + "
+                   f"({row['MRO']}×{w['WMRO']}) + ({row['DH']}×{w['WDH']}) + {row['RS']:+.0f}")
             print(calc)
             print(f"   PS = {row['PS']:.0f}\n")
         
         return df_sorted
     
-    def export_results(self, df, filename='ipl_fielding_analysis'):
-        """Export results to Excel and JSON."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    @traced('leaderboard')
+    def build_leaderboard(self, df):
+        """Start an incremental leaderboard from a season's scored rows."""
+        from fielding_leaderboard import Leaderboard
         
-        # Export to Excel
-        excel_file = self.output_dir / f'{filename}_{timestamp}.xlsx'
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Performance Analysis', index=False)
-            
-            # Add weights sheet
-            weights_df = pd.DataFrame([
-                {'Metric': 'Clean Picks (CP)', 'Weight': self.WEIGHTS['WCP']},
-                {'Metric': 'Good Throws (GT)', 'Weight': self.WEIGHTS['WGT']},
-                {'Metric': 'Catches (C)', 'Weight': self.WEIGHTS['WC']},
-                {'Metric': 'Dropped Catches (DC)', 'Weight': self.WEIGHTS['WDC']},
-                {'Metric': 'Stumpings (ST)', 'Weight': self.WEIGHTS['WST']},
-                {'Metric': 'Run Outs (RO)', 'Weight': self.WEIGHTS['WRO']},
-                {'Metric': 'Missed Run Outs (MRO)', 'Weight': self.WEIGHTS['WMRO']},
-                {'Metric': 'Direct Hits (DH)', 'Weight': self.WEIGHTS['WDH']}
-            ])
-            weights_df.to_excel(writer, sheet_name='Weights', index=False)
-        
-        print(f"[OK] Results exported to: {excel_file}")
-        
-        # Export to JSON
-        json_file = self.output_dir / f'{filename}_{timestamp}.json'
-        results = {
-            'analysis_date': datetime.now().isoformat(),
-            'weights': self.WEIGHTS,
-            'players': df.to_dict('records')
-        }
+        self.leaderboard = Leaderboard()
+        return self.update_leaderboard(df)
+    
+    def update_leaderboard(self, match_df):
+        """Add one match's rows to the leaderboard without re-ranking the season."""
+        if self.leaderboard is None:
+            return self.build_leaderboard(match_df)
+        if 'PS' not in match_df.columns:
+            self.score(match_df)
+        if 'Player_ID' not in match_df.columns:
+            # Registers the names, so lookups by another spelling (/rank) find them.
+            self.attach_player_ids(match_df)
+        self.leaderboard.apply_match(match_df)
+        return self.leaderboard
+    
+    def serve(self, season_df=None, host=None, port=None, batch_delay=None):
+        """
+        Run the local HTTP scoring service until interrupted (see fielding_server).
+        
+        season_df seeds the leaderboard behind /top and /rank.
+        """
+        from fielding_server import DEFAULT_BATCH_DELAY, DEFAULT_HOST, DEFAULT_PORT, run_server
+        
+        if season_df is not None:
+            self.build_leaderboard(season_df)
+        host = host or DEFAULT_HOST
+        
+        def ready(bound_port):
+            print(f"[OK] Serving {len(self.leaderboard or ())} players on http://{host}:{bound_port}",
+                  flush=True)
         
-        with open(json_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        return run_server(self, host, DEFAULT_PORT if port is None else port,
+                          DEFAULT_BATCH_DELAY if batch_delay is None else batch_delay, ready)
+    
+    def rolling_form(self, events, window=5, match_col='Match_No'):
+        """
+        Per-player PS over their last `window` matches and season-to-date, one row per match.
+        
+        events must be in chronological order; PS is scored if missing.
+        """
+        from fielding_windows import expanding_sums, match_totals, rolling_sums
+        
+        if 'PS' not in events.columns:
+            self.score(events)
+        return expanding_sums(rolling_sums(match_totals(events, match_col=match_col), window))
+    
+    def tumbling_form(self, events, size=5, match_col='Match_No'):
+        """Per-player PS in consecutive blocks of `size` matches."""
+        from fielding_windows import match_totals, tumbling_sums
+        
+        if 'PS' not in events.columns:
+            self.score(events)
+        return tumbling_sums(match_totals(events, match_col=match_col), size)
+    
+    def breakdown(self, events, by='Venue'):
+        """Per-player PS split by a column such as 'Season' or 'Venue'."""
+        from fielding_windows import breakdown
+        
+        if 'PS' not in events.columns:
+            self.score(events)
+        return breakdown(events, by)
+    
+    def update_form(self, new_events, window=5, match_col='Match_No'):
+        """
+        Extend rolling_form() with newly appended matches and return only their rows.
+        
+        The first call starts tracking; later calls reuse the kept window state.
+        """
+        from fielding_windows import RollingWindows
         
-        print(f"[OK] Results exported to: {json_file}")
+        if self.form_windows is None or self.form_windows.size != window:
+            self.form_windows = RollingWindows(window, match_col=match_col)
+        if 'PS' not in new_events.columns:
+            self.score(new_events)
+        return self.form_windows.extend(new_events)
     
-    def generate_report(self, df, filename='ipl_fielding_report'):
-        """Generate text report."""
+    @traced('sweep')
+    def weight_sweep(self, df, configs=None, samples=1000, spread=1, top_k=10, kendall=True, seed=None):
+        """
+        Rank players under many weight configurations and report rank stability.
+        
+        configs: DataFrame with one W* column per weight (rows = configurations),
+        or a {key: [values]} grid; defaults to `samples` random integer weight
+        sets within ±spread of the current weights.
+        """
+        from fielding_sweep import grid_configs, random_configs, sweep
+        
+        if configs is None:
+            configs = random_configs(self.weights, samples, spread=spread, seed=seed)
+        elif isinstance(configs, dict):
+            configs = grid_configs(self.weights, configs)
+        if df['Player_Name'].duplicated().any():
+            df = self.aggregate_players(df)
+        return sweep(df, self.weights, configs, top_k=top_k, kendall=kendall)
+    
+    @traced('export')
+    def export_results(self, df, filename='ipl_fielding_analysis', formats=('excel', 'json'),
+                       parallel=False):
+        """
+        Export results in the chosen formats.
+        
+        formats: any of 'excel', 'json', 'ndjson', 'csv', 'parquet'.
+        parallel: write several formats concurrently.
+        """
+        from fielding_export import export_frame
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = self.output_dir / f'{filename}_{timestamp}.txt'
-        
-        with open(report_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("IPL FIELDING PERFORMANCE ANALYSIS REPORT\n")
-            f.write("ShadowFox Analytics\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            f.write("PERFORMANCE SCORE FORMULA:\n")
-            f.write("-" * 80 + "\n")
-            f.write("PS = (CP×WCP) + (GT×WGT) + (C×WC) + (DC×WDC) + (ST×WST) +\n")
-            f.write("     (RO×WRO) + (MRO×WMRO) + (DH×WDH) + RS\n\n")
-            
-            f.write("WEIGHTS:\n")
-            f.write("-" * 80 + "\n")
-            for key, value in self.WEIGHTS.items():
-                f.write(f"{key}: {value:+d}\n")
-            f.write("\n")
-            
-            f.write("PLAYER RANKINGS:\n")
-            f.write("-" * 80 + "\n\n")
-            
-            for idx, row in df.iterrows():
-                f.write(f"{idx + 1}. {row['Player_Name']}\n")
-                f.write(f"   Performance Score: {row['PS']:.0f}\n")
-                f.write(f"   Catches: {row['C']}, Run Outs: {row['RO']}, Direct Hits: {row['DH']}\n")
-                f.write(f"   Runs Impact: {row['RS']:+.0f}\n\n")
-            
-            f.write("=" * 80 + "\n")
-            f.write("KEY INSIGHTS:\n")
-            f.write("-" * 80 + "\n")
-            
-            best = df.iloc[0]
-            f.write(f"• Best Performer: {best['Player_Name']} (PS: {best['PS']:.0f})\n")
-            
-            most_catches = df.loc[df['C'].idxmax()]
-            f.write(f"• Most Catches: {most_catches['Player_Name']} ({most_catches['C']:.0f} catches)\n")
-            
-            if df['RO'].max() > 0:
-                most_runouts = df.loc[df['RO'].idxmax()]
-                f.write(f"• Most Run Outs: {most_runouts['Player_Name']} ({most_runouts['RO']:.0f} run outs)\n")
-            
-            f.write("\n" + "=" * 80 + "\n")
+        base_path = self._output_file(f'{filename}_{timestamp}')
+        
+        paths = export_frame(df, self.weights, base_path, formats, parallel)
+        for path in paths.values():
+            self._log(f"[OK] Results exported to: {path}")
+        return paths
+    
+    @traced('store')
+    def record_run(self, df, source=None):
+        """Save a ranked frame as one run in the results store and return its run_id."""
+        run_id = self.store.record_run(df, self.weights, source=source)
+        self._log(f"[OK] Run {run_id} stored in: {self.store.path}")
+        return run_id
+    
+    def player_history(self, player, same_weights=False):
+        """A player's stored results across runs, oldest first (optionally only runs with these weights)."""
+        return self.store.player_history(player, self.weights if same_weights else None)
+    
+    def import_exports(self, paths):
+        """One-off import of existing JSON exports into the results store."""
+        imported = self.store.import_json_exports(paths)
+        for path, run_id in imported.items():
+            self._log(f"[OK] Imported {path} as run {run_id}" if run_id else f"[INFO] Already imported: {path}")
+        return imported
+    
+    @traced('report')
+    def generate_report(self, df, filename='ipl_fielding_report', top_n=None, page_size=None):
+        """
+        Generate text report.
+        
+        top_n: list only the best N players; page_size: paginate the rankings.
+        """
+        from fielding_report import write_report
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = self._output_file(f'{filename}_{timestamp}.txt')
+        
+        write_report(df, self.weights, report_file, top_n, page_size)
         
-        print(f"[OK] Report generated: {report_file}")
+        self._log(f"[OK] Report generated: {report_file}")
+        return report_file
+
+
+SUMMARY_COLUMNS = ['Player_Name', 'PS', 'C', 'RO', 'DH', 'RS']
+
+
+def parse_weight(text):
+    """Parse a KEY=VALUE weight override from the command line."""
+    key, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got '{text}'")
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"weight {key} must be a number, got '{value}'")
+    return key.strip().upper(), int(number) if number.is_integer() else number
 
 
-def main():
-    """Main function."""
-    analyzer = IPLFieldingAnalyzer()
+def _add_common_options(parser, defaults=True):
+    """Options accepted both before and after the subcommand name."""
+    def default(value):
+        # Subcommand copies must not overwrite values given before the subcommand.
+        return value if defaults else argparse.SUPPRESS
     
+    parser.add_argument('-q', '--quiet', action='store_true', default=default(False),
+                        help='no banner or progress messages, only results and errors')
+    parser.add_argument('-w', '--weight', action='append', type=parse_weight, default=default([]),
+                        metavar='KEY=VALUE', help='override a weight for this run, e.g. -w WDC=-4')
+    parser.add_argument('--output-dir', default=default('cricket_analysis'),
+                        help='folder for exports, reports and the cache (default: cricket_analysis)')
+    parser.add_argument('--no-cache', action='store_true', default=default(False),
+                        help='always re-parse workbooks')
+    parser.add_argument('--exact-names', action='store_true', default=default(False),
+                        help='group players by exact name instead of the alias table')
+    parser.add_argument('--trace', metavar='FILE', default=default(None),
+                        help='time every pipeline stage; write a JSON trace here and a summary to stderr')
+    parser.add_argument('--profile', metavar='DIR', default=default(None),
+                        help='also cProfile each top-level stage, nested stages included, into DIR (implies timing)')
+
+
+def build_parser():
+    """Command-line interface: score / rank / export / sweep / history / import-json / serve / aliases / demo."""
+    parser = argparse.ArgumentParser(
+        prog='ipl_fielding_analyzer',
+        description='IPL fielding Performance Score analysis (ShadowFox Analytics).'
+    )
+    _add_common_options(parser)
+    sub = parser.add_subparsers(dest='command', metavar='command')
+
+    score = sub.add_parser('score', help='add a PS column to every row of a sheet')
+    _add_common_options(score, defaults=False)
+    score.add_argument('input', help='.xlsx, .csv or .parquet Performance Matrix')
+    score.add_argument('-o', '--output', help='write scored rows here (format from extension); '
+                                              'default prints CSV to stdout')
+
+    rank = sub.add_parser('rank', help='rank players from a sheet or a directory of sheets')
+    _add_common_options(rank, defaults=False)
+    rank.add_argument('input', help='sheet, or directory of match sheets (scored in parallel)')
+    rank.add_argument('--top', type=int, help='only show the best N players')
+    rank.add_argument('--stream', action='store_true', help='read the sheet in bounded batches')
+    rank.add_argument('--events', action='store_true', help='input is a ball-by-ball event log')
+    rank.add_argument('--workers', type=int, help='processes for directory input (default: all cores)')
+    rank.add_argument('--compare-serial', action='store_true',
+                      help='for directory input, re-run the batch in one process and report the speedup')
+    rank.add_argument('-o', '--output', help='also write the ranking here (format from extension)')
+
+    export = sub.add_parser('export', help='rank players and write result files and a report')
+    _add_common_options(export, defaults=False)
+    export.add_argument('input', nargs='?', help='sheet or directory (default: built-in sample data)')
+    export.add_argument('--formats', default='excel,json',
+                        help='comma-separated: excel, json, ndjson, csv, parquet (default: %(default)s)')
+    export.add_argument('--events', action='store_true', help='input is a ball-by-ball event log')
+    export.add_argument('--parallel', action='store_true', help='write formats concurrently')
+    export.add_argument('--store', action='store_true', help='also save the run in the results store')
+    export.add_argument('--no-report', action='store_true', help='skip the text report')
+    export.add_argument('--top', type=int, help='only list the best N players in the report')
+    export.add_argument('--page-size', type=int, help='paginate the report rankings')
+
+    sweep = sub.add_parser('sweep', help='check how stable the ranking is across many weight sets')
+    _add_common_options(sweep, defaults=False)
+    sweep.add_argument('input', nargs='?', help='sheet or directory (default: built-in sample data)')
+    sweep.add_argument('--samples', type=int, default=1000,
+                       help='random weight sets to try (default: %(default)s)')
+    sweep.add_argument('--spread', type=float, default=1,
+                       help='each weight varies within ± this much (default: %(default)s)')
+    sweep.add_argument('--top', type=int, default=10, help='top-K cutoff for membership frequency')
+    sweep.add_argument('--seed', type=int, help='random seed for reproducible sweeps')
+    sweep.add_argument('--no-kendall', action='store_true', help='skip Kendall tau (faster)')
+    sweep.add_argument('-o', '--output', help='also write per-player stability here (format from extension)')
+
+    history = sub.add_parser('history', help="show a player's stored results across runs")
+    _add_common_options(history, defaults=False)
+    history.add_argument('player', help='player name as stored')
+    history.add_argument('--same-weights', action='store_true', help='only runs that used the current weights')
+
+    import_json = sub.add_parser('import-json', help='import existing JSON exports into the results store')
+    _add_common_options(import_json, defaults=False)
+    import_json.add_argument('files', nargs='+', help='JSON exports (both old and current layouts)')
+
+    serve = sub.add_parser('serve', help='run the local HTTP scoring service')
+    _add_common_options(serve, defaults=False)
+    serve.add_argument('input', nargs='?', help='season sheet or directory (default: built-in sample data)')
+    serve.add_argument('--events', action='store_true', help='input is a ball-by-ball event log')
+    serve.add_argument('--host', help='interface to bind (default: 127.0.0.1)')
+    serve.add_argument('--port', type=int, help='TCP port, 0 for any free port (default: 8765)')
+    serve.add_argument('--batch-delay', type=float,
+                       help='seconds a score request waits to be batched with others (default: 0.001)')
+
+    aliases = sub.add_parser('aliases', help='show or edit the player alias table')
+    _add_common_options(aliases, defaults=False)
+    aliases.add_argument('--add', action='append', default=[], metavar='ALIAS=NAME',
+                         help='always treat ALIAS as the player NAME (repeatable)')
+    aliases.add_argument('--player', help='only show aliases of this player')
+
+    demo = sub.add_parser('demo', help='run the sample analysis (default when no command is given)')
+    _add_common_options(demo, defaults=False)
+    demo.add_argument('--no-details', action='store_true', help="skip the per-player score breakdown")
+    return parser
+
+
+def _ranking(analyzer, args):
+    """Ranked per-player totals for a file or directory argument."""
+    if Path(args.input).is_dir():
+        return analyzer.analyze_directory(args.input, getattr(args, 'workers', None),
+                                          getattr(args, 'compare_serial', False))
+    if getattr(args, 'stream', False):
+        return analyzer.load_streaming(args.input)
+    if getattr(args, 'events', False):
+        df = analyzer.load_events(args.input)
+    else:
+        df = analyzer.load(args.input)
+    return None if df is None else analyzer.aggregate_players(df)
+
+
+def run_score(analyzer, args):
+    df = analyzer.load(args.input)
+    if df is None:
+        return 1
+    if args.output:
+        from fielding_export import write_file
+        write_file(df, analyzer.weights, args.output)
+        analyzer._log(f"[OK] Scored rows written to: {args.output}")
+    else:
+        df.to_csv(sys.stdout, index=False)
+    return 0
+
+
+def run_rank(analyzer, args):
+    ranking = _ranking(analyzer, args)
+    if ranking is None:
+        return 1
+    shown = ranking if args.top is None else ranking.head(args.top)
+    print(shown[SUMMARY_COLUMNS].to_string(index=False))
+    if args.output:
+        from fielding_export import write_file
+        write_file(ranking, analyzer.weights, args.output)
+        analyzer._log(f"[OK] Ranking written to: {args.output}")
+    return 0
+
+
+def run_export(analyzer, args):
+    if args.input:
+        ranking = _ranking(analyzer, args)
+        if ranking is None:
+            return 1
+    else:
+        ranking = analyzer.analyze_players(analyzer.create_sample_data(), verbose=False)
+    formats = tuple(fmt.strip() for fmt in args.formats.split(',') if fmt.strip())
+    analyzer.export_results(ranking, formats=formats, parallel=args.parallel)
+    if args.store:
+        analyzer.record_run(ranking)
+    if not args.no_report:
+        analyzer.generate_report(ranking, top_n=args.top, page_size=args.page_size)
+    return 0
+
+
+def run_sweep(analyzer, args):
+    if args.input:
+        ranking = _ranking(analyzer, args)
+        if ranking is None:
+            return 1
+    else:
+        ranking = analyzer.analyze_players(analyzer.create_sample_data(), verbose=False)
+    result = analyzer.weight_sweep(ranking, samples=args.samples, spread=args.spread, top_k=args.top,
+                                   kendall=not args.no_kendall, seed=args.seed)
+    print(result.summary())
+    if args.output:
+        from fielding_export import write_file
+        write_file(result.players, analyzer.weights, args.output)
+        analyzer._log(f"[OK] Sweep results written to: {args.output}")
+    return 0
+
+
+def run_history(analyzer, args):
+    history = analyzer.player_history(args.player, args.same_weights)
+    if history.empty:
+        print(f"[INFO] No stored runs for {args.player}")
+        return 1
+    print(history[['run_at', 'weights_hash', 'rank', 'PS', 'C', 'RO', 'DH', 'RS']].to_string(index=False))
+    return 0
+
+
+def run_import_json(analyzer, args):
+    try:
+        analyzer.import_exports(args.files)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Import failed: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_serve(analyzer, args):
+    if args.input:
+        ranking = _ranking(analyzer, args)
+        if ranking is None:
+            return 1
+    else:
+        ranking = analyzer.analyze_players(analyzer.create_sample_data(), verbose=False)
+    analyzer.serve(ranking, args.host, args.port, args.batch_delay)
+    return 0
+
+
+def run_aliases(analyzer, args):
+    registry = analyzer.registry
+    for pair in args.add:
+        alias, sep, name = pair.partition('=')
+        if not sep or not alias.strip() or not name.strip():
+            print(f"[ERROR] Expected ALIAS=NAME, got '{pair}'", file=sys.stderr)
+            return 2
+        player_id = registry.add_alias(alias, name)
+        analyzer._log(f"[OK] '{alias.strip()}' -> {registry.names[player_id]} (ID {player_id})")
+    registry.save()
+    table = registry.alias_table()
+    if args.player:
+        table = table[table['Player_ID'] == registry.find(args.player)]
+    if table.empty:
+        print("[INFO] The alias table is empty")
+    else:
+        print(table.to_string(index=False))
+    suggestions = registry.suggestion_table()
+    if args.player:
+        suggestions = suggestions[suggestions['Similar_ID'] == registry.find(args.player)]
+    if not suggestions.empty:
+        print("\nUnconfirmed near matches (confirm with --add ALIAS=NAME):")
+        print(suggestions.to_string(index=False))
+    return 0
+
+
+def run_demo(analyzer, args):
+    """The original walkthrough: sample data, per-player breakdown, exports."""
     # Create sample data
-    print("[INFO] Creating sample IPL fielding data...")
+    analyzer._log("[INFO] Creating sample IPL fielding data...")
     df = analyzer.create_sample_data()
     
     # Save sample data
-    sample_file = analyzer.output_dir / 'sample_ipl_data.xlsx'
+    sample_file = analyzer._output_file('sample_ipl_data.xlsx')
     df.to_excel(sample_file, index=False)
-    print(f"[OK] Sample data saved to: {sample_file}\n")
+    analyzer._log(f"[OK] Sample data saved to: {sample_file}\n")
     
     # Analyze players
-    df_analyzed = analyzer.analyze_players(df)
+    details = not (analyzer.quiet or getattr(args, 'no_details', False))
+    df_analyzed = analyzer.analyze_players(df, verbose=details)
     
     # Display summary table
     print("=" * 80)
     print("SUMMARY TABLE")
     print("=" * 80)
-    print(df_analyzed[['Player_Name', 'PS', 'C', 'RO', 'DH', 'RS']].to_string(index=False))
+    print(df_analyzed[SUMMARY_COLUMNS].to_string(index=False))
     print("=" * 80 + "\n")
     
     # Export results
     analyzer.export_results(df_analyzed)
     analyzer.generate_report(df_analyzed)
     
-    print("\n[OK] Analysis complete!")
+    analyzer._log("\n[OK] Analysis complete!")
+    return 0
+
+
+COMMANDS = {
+    'score': run_score,
+    'rank': run_rank,
+    'export': run_export,
+    'sweep': run_sweep,
+    'history': run_history,
+    'import-json': run_import_json,
+    'serve': run_serve,
+    'aliases': run_aliases,
+    'demo': run_demo
+}
+
+
+def main(argv=None):
+    """Main function: parse the command line and run one subcommand."""
+    args = build_parser().parse_args(argv)
+    tracer = Tracer(enabled=bool(args.trace), profile_dir=args.profile)
+    try:
+        analyzer = IPLFieldingAnalyzer(dict(args.weight), use_cache=not args.no_cache,
+                                       output_dir=args.output_dir, quiet=args.quiet, tracer=tracer,
+                                       resolve_names=not args.exact_names)
+    except KeyError as e:
+        print(f"[ERROR] {e.args[0]}", file=sys.stderr)
+        return 2
+    
+    if not args.quiet:
+        print(analyzer._banner())
+    try:
+        return COMMANDS[args.command or 'demo'](analyzer, args)
+    finally:
+        if tracer.enabled:
+            print(tracer.summary(), file=sys.stderr)
+            if args.trace:
+                tracer.write_json(args.trace)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
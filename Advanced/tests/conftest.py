@@ -0,0 +1,12 @@
+"""
+Shared setup for the fielding analyzer tests.
+
+Run from the Advanced/ folder (or the repository root):
+    python -m pytest -q Advanced/tests
+"""
+
+import sys
+from pathlib import Path
+
+# Make the analyzer modules in Advanced/ importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
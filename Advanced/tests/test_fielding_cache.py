@@ -0,0 +1,90 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import fielding_cache  # noqa: E402
+from fielding_cache import ParsedFrameCache, coerce_for_arrow  # noqa: E402
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'match.csv'
+    path.write_text('Player_Name,CP\nAxar Patel,2\nPhil Salt,1\n')
+    return path
+
+
+def parse(filepath, sheet_name):
+    df = pd.read_csv(filepath)
+    # A column mixing text and numbers, as read_excel returns one.
+    df['Note'] = pd.Series(['x', 3][:len(df)], dtype=object)
+    return df
+
+
+@pytest.fixture
+def digests(monkeypatch):
+    """Counts how often the cache hashes a source file."""
+    calls = []
+    real = fielding_cache.file_digest
+
+    def counting(filepath):
+        calls.append(filepath)
+        return real(filepath)
+    monkeypatch.setattr(fielding_cache, 'file_digest', counting)
+    return calls
+
+
+def test_warm_load_equals_cold_load(tmp_path, source):
+    cache = ParsedFrameCache(tmp_path / 'cache')
+    cold = cache.load(source, 0, parse)
+    warm = cache.load(source, 0, parse)
+    assert (cache.misses, cache.hits) == (1, 1)
+    pd.testing.assert_frame_equal(cold, warm, check_dtype=False)
+    # Mixed cells come back as strings either way.
+    assert cold['Note'].tolist() == warm['Note'].tolist() == ['x', '3']
+
+
+def test_unchanged_file_is_not_rehashed(tmp_path, source, digests):
+    cache = ParsedFrameCache(tmp_path / 'cache')
+    cache.load(source, 0, parse)
+    cache.load(source, 0, parse)
+    assert len(digests) == 1
+
+
+def test_touched_file_is_rehashed_once(tmp_path, source, digests):
+    cache = ParsedFrameCache(tmp_path / 'cache')
+    cache.load(source, 0, parse)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.load(source, 0, parse)
+    cache.load(source, 0, parse)
+    assert cache.hits == 2 and cache.misses == 1
+    # The content hash matched, so the new mtime is stored and the third load skips hashing.
+    assert len(digests) == 2
+
+
+def test_changed_file_replaces_its_entry(tmp_path, source):
+    cache = ParsedFrameCache(tmp_path / 'cache')
+    cache.load(source, 0, parse)
+    source.write_text('Player_Name,CP\nAxar Patel,5\n')
+    df = cache.load(source, 0, parse)
+    assert cache.misses == 2 and df['CP'].tolist() == [5]
+    assert len(list((tmp_path / 'cache').glob('*.arrow'))) == 1
+
+
+def test_version_change_reparses(tmp_path, source):
+    ParsedFrameCache(tmp_path / 'cache', version='a').load(source, 0, parse)
+    cache = ParsedFrameCache(tmp_path / 'cache', version='b')
+    cache.load(source, 0, parse)
+    assert cache.misses == 1
+    assert len(list((tmp_path / 'cache').glob('*.arrow'))) == 1
+
+
+def test_coerce_for_arrow_leaves_its_input_alone():
+    df = pd.DataFrame({'Note': ['x', 3, None], 1: [1, 2, 3]})
+    coerced = coerce_for_arrow(df)
+    assert df['Note'].tolist() == ['x', 3, None] and list(df.columns) == ['Note', 1]
+    assert coerced['Note'].tolist()[:2] == ['x', '3'] and pd.isna(coerced['Note'].iloc[2])
+    assert list(coerced.columns) == ['Note', '1']
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fielding_leaderboard import Leaderboard
+from fielding_scoring import METRIC_COLUMNS
+from fielding_stream import player_totals, rank_players
+
+
+def random_matches(seed, matches=30, players=40, with_ids=False):
+    """Scored match frames with small integer PS, so ties are common."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(matches):
+        rows = int(rng.integers(1, 25))
+        ids = rng.integers(0, players, rows)
+        df = pd.DataFrame({col: np.zeros(rows, dtype=np.int64) for col in METRIC_COLUMNS})
+        df.insert(0, 'Player_Name', [f'Player {i}' for i in ids])
+        if with_ids:
+            # Some rows spell the name differently; the ID says who they are.
+            df['Player_Name'] = [f'player {i}' if rng.random() < 0.3 else f'Player {i}' for i in ids]
+            df['Player_ID'] = ids.astype(np.int32)
+        df['PS'] = rng.integers(-3, 6, rows)
+        frames.append(df)
+    return frames
+
+
+@pytest.mark.parametrize('with_ids', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_ranking_equals_full_recompute(seed, with_ids):
+    frames = random_matches(seed, with_ids=with_ids)
+    board = Leaderboard()
+    for df in frames:
+        board.apply_match(df)
+    expected = rank_players(player_totals(pd.concat(frames, ignore_index=True)))
+    assert board.top(len(board)) == list(zip(expected['Player_Name'], expected['PS']))
+
+
+def test_rank_agrees_with_top():
+    board = Leaderboard()
+    for df in random_matches(7):
+        board.apply_match(df)
+    for position, (player, ps) in enumerate(board.top(len(board)), 1):
+        assert board.rank(player) == position
+        assert board.scores[player] == ps
+
+
+def test_update_moves_a_player():
+    board = Leaderboard()
+    board.update('A', 5)
+    board.update('B', 5)
+    board.update('C', 1)
+    assert board.top(3) == [('A', 5), ('B', 5), ('C', 1)]
+    board.update('C', 10)
+    assert board.rank('C') == 1 and board.rank('A') == 2
+    assert board.to_frame()['Player_Name'].tolist() == ['C', 'A', 'B']
+    with pytest.raises(KeyError):
+        board.rank('nobody')
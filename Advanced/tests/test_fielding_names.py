@@ -0,0 +1,107 @@
+import json
+
+import pandas as pd
+
+from fielding_names import PlayerRegistry, edit_distance, normalize_name
+
+
+def test_normalize_name_ignores_case_spacing_and_punctuation():
+    assert normalize_name(' Kuldeep  YADAV ') == normalize_name('kuldeep yadav')
+    assert normalize_name("M.S. D'honi") == normalize_name('MS Dhoni')
+    assert normalize_name('Jean-Paul') == 'jean paul'
+
+
+def test_edit_distance_stops_at_limit():
+    assert edit_distance('axar patel', 'axer patel', 1) == 1
+    assert edit_distance('axar patel', 'axar patel', 1) == 0
+    assert edit_distance('rohit', 'virat kohli', 1) == 2
+
+
+def test_spellings_of_one_name_share_an_id():
+    registry = PlayerRegistry()
+    player_id = registry.resolve('Axar Patel')
+    assert registry.resolve('  axar   PATEL ') == player_id
+    assert registry.names[player_id] == 'Axar Patel'
+    assert not registry.suggestions
+
+
+def test_near_homonyms_stay_separate_players():
+    registry = PlayerRegistry()
+    rohit = registry.resolve('Rohit Sharma')
+    mohit = registry.resolve('Mohit Sharma')
+    assert rohit != mohit
+    assert registry.names[mohit] == 'Mohit Sharma'
+    # The near match is only suggested, never saved as the same player.
+    assert registry.suggestions == {'mohit sharma': rohit}
+    assert registry.aliases['mohit sharma'] == [mohit, 'exact']
+    assert registry.find('Mohit Sharma') == mohit
+    assert registry.find('Rohit Sharma') == rohit
+
+
+def test_attach_ids_keeps_near_homonyms_apart():
+    df = pd.DataFrame({'Player_Name': ['Rohit Sharma', 'Mohit Sharma', 'rohit sharma'], 'PS': [1, 2, 3]})
+    PlayerRegistry().attach_ids(df)
+    assert df['Player_ID'].tolist() == [0, 1, 0]
+    assert df['Player_Name'].astype(str).tolist() == ['Rohit Sharma', 'Mohit Sharma', 'Rohit Sharma']
+
+
+def test_find_and_suggest_register_nothing():
+    registry = PlayerRegistry()
+    axar = registry.resolve('Axar Patel')
+    assert registry.find('Axer Patel') is None
+    assert registry.suggest('Axer Patel') == axar
+    assert registry.suggest('Axar Patel') is None
+    assert len(registry) == 1 and 'axer patel' not in registry.aliases
+
+
+def test_add_alias_confirms_a_suggestion():
+    registry = PlayerRegistry()
+    axar = registry.resolve('Axar Patel')
+    registry.resolve('Axer Patel')
+    assert 'axer patel' in registry.suggestions
+    assert registry.add_alias('Axer Patel', 'Axar Patel') == axar
+    assert registry.resolve('AXER PATEL') == axar
+    assert registry.aliases['axer patel'] == [axar, 'manual']
+    assert not registry.suggestions
+
+
+def test_merge_fuzzy_merges_near_matches():
+    registry = PlayerRegistry(merge_fuzzy=True)
+    axar = registry.resolve('Axar Patel')
+    assert registry.resolve('Axer Patel') == axar
+    assert registry.aliases['axer patel'] == [axar, 'fuzzy']
+    assert registry.find('Axir Patel') == axar
+
+
+def test_short_names_only_match_exactly():
+    registry = PlayerRegistry()
+    registry.resolve('Ravi')
+    registry.resolve('Ravu')
+    assert len(registry) == 2 and not registry.suggestions
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'players.json'
+    registry = PlayerRegistry(path)
+    rohit = registry.resolve('Rohit Sharma')
+    mohit = registry.resolve('Mohit Sharma')
+    registry.add_alias('Hitman', 'Rohit Sharma')
+    registry.save()
+
+    loaded = PlayerRegistry.load(path)
+    assert loaded.names == ['Rohit Sharma', 'Mohit Sharma']
+    assert loaded.resolve('hitman') == rohit
+    assert loaded.resolve('MOHIT SHARMA') == mohit
+    assert loaded.suggestions == {'mohit sharma': rohit}
+    assert not loaded.dirty
+
+
+def test_load_demotes_fuzzy_merges_from_older_files(tmp_path):
+    path = tmp_path / 'players.json'
+    path.write_text(json.dumps({'players': ['Rohit Sharma'],
+                                'aliases': {'rohit sharma': [0, 'exact'], 'mohit sharma': [0, 'fuzzy']}}))
+    registry = PlayerRegistry.load(path)
+    assert registry.dirty
+    assert registry.suggestions == {'mohit sharma': 0}
+    assert registry.resolve('Mohit Sharma') == 1
+    assert registry.names == ['Rohit Sharma', 'Mohit Sharma']
@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+
+from fielding_server import MAX_BODY_BYTES, ScoringServer, rows_to_matrix
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """Analyzer seeded with the built-in sample season, the way `serve` starts without an input."""
+    analyzer = IPLFieldingAnalyzer(output_dir=tmp_path, use_cache=False, quiet=True)
+    analyzer.build_leaderboard(analyzer.analyze_players(analyzer.create_sample_data(), verbose=False))
+    return analyzer
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = dict(line.lower().split(': ', 1) for line in lines[1:] if line)
+    body = await reader.readexactly(int(headers['content-length']))
+    return status, headers, json.loads(body)
+
+
+def exchange(server, *requests):
+    """Send raw requests on one connection; returns [(status, headers, payload), ...] until it closes."""
+    async def run():
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = []
+        try:
+            for raw in requests:
+                writer.write(raw)
+                await writer.drain()
+                response = await _read_response(reader)
+                responses.append(response)
+                if response[1]['connection'] == 'close':
+                    break
+        finally:
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+        return responses
+    return asyncio.run(run())
+
+
+def http(method, target, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b''
+    return f'{method} {target} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n'.encode() + body
+
+
+def test_score_returns_one_ps_per_row(analyzer):
+    rows = [{'CP': 2, 'GT': 1}, {'C': 1, 'DC': 1}, {}]
+    [(status, _, payload)] = exchange(ScoringServer(analyzer), http('POST', '/score', {'rows': rows}))
+    assert status == 200
+    assert payload['PS'] == analyzer.engine.score_matrix(rows_to_matrix(rows)).tolist()
+    assert payload['PS'][2] == 0
+
+
+def test_requests_share_a_keep_alive_connection(analyzer):
+    responses = exchange(ScoringServer(analyzer), http('GET', '/health'), http('GET', '/top?k=2'),
+                         http('GET', '/stats'))
+    assert [status for status, _, _ in responses] == [200, 200, 200]
+    assert all(headers['connection'] == 'keep-alive' for _, headers, _ in responses)
+    assert responses[0][2] == {'status': 'ok', 'players': len(analyzer.leaderboard)}
+    assert [p['Player_Name'] for p in responses[1][2]['players']] == \
+        [name for name, _ in analyzer.leaderboard.top(2)]
+
+
+def test_rank_finds_seeded_players_by_any_spelling(analyzer):
+    [(status, _, payload)] = exchange(ScoringServer(analyzer), http('GET', '/rank?player=axer%20%20PATEL'))
+    assert status == 200
+    assert payload['Player_Name'] == 'Axer Patel'
+    assert payload['rank'] == analyzer.leaderboard.rank('Axer Patel')
+
+
+def test_rank_near_match_is_a_suggestion(analyzer):
+    [(status, _, payload)] = exchange(ScoringServer(analyzer), http('GET', '/rank?player=Axar%20Patel'))
+    assert status == 404
+    assert payload['suggestion'] == 'Axer Patel'
+    assert analyzer.registry.find('Axar Patel') is None
+
+
+def test_match_keeps_near_homonyms_apart(analyzer):
+    rows = [{'Player_Name': 'Rohit Sharma', 'CP': 1}, {'Player_Name': 'Mohit Sharma', 'CP': 2},
+            {'Player_Name': 'rohit  sharma', 'CP': 1}]
+    players = len(analyzer.leaderboard)
+    [(status, _, payload)] = exchange(ScoringServer(analyzer), http('POST', '/match', {'rows': rows}))
+    assert status == 200
+    assert payload == {'updated': 2, 'players': players + 2}
+    ps = analyzer.engine.score_matrix(rows_to_matrix(rows)).tolist()
+    assert analyzer.leaderboard.scores['Rohit Sharma'] == ps[0] + ps[2]
+    assert analyzer.leaderboard.scores['Mohit Sharma'] == ps[1]
+
+
+def test_match_rows_need_player_name(analyzer):
+    [(status, _, payload)] = exchange(ScoringServer(analyzer), http('POST', '/match', {'rows': [{'CP': 1}]}))
+    assert status == 400 and 'Player_Name' in payload['error']
+
+
+@pytest.mark.parametrize('request_bytes, status', [
+    (http('GET', '/nowhere'), 404),
+    (http('GET', '/score'), 405),
+    (http('GET', '/top?k=ten'), 400),
+    (http('POST', '/score', {'rows': 'nope'}), 400),
+    (b'POST /score HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}', 400),
+])
+def test_client_errors_keep_the_connection(analyzer, request_bytes, status):
+    responses = exchange(ScoringServer(analyzer), request_bytes, http('GET', '/health'))
+    assert [s for s, _, _ in responses] == [status, 200]
+
+
+@pytest.mark.parametrize('length', ['abc', '-5', '²'])
+def test_invalid_content_length_closes_the_connection(analyzer, length):
+    raw = f'POST /score HTTP/1.1\r\nContent-Length: {length}\r\n\r\n'.encode()
+    [(status, headers, payload)] = exchange(ScoringServer(analyzer), raw, http('GET', '/health'))
+    assert status == 400 and headers['connection'] == 'close'
+    assert payload['error'] == 'invalid Content-Length'
+
+
+def test_oversized_body_gets_413(analyzer):
+    raw = f'POST /score HTTP/1.1\r\nContent-Length: {MAX_BODY_BYTES + 1}\r\n\r\n'.encode()
+    [(status, headers, _)] = exchange(ScoringServer(analyzer), raw)
+    assert status == 413 and headers['connection'] == 'close'
+
+
+def test_oversized_headers_get_431(analyzer):
+    raw = b'GET /health HTTP/1.1\r\nX-Padding: ' + b'a' * 2**17 + b'\r\n\r\n'
+    [(status, headers, payload)] = exchange(ScoringServer(analyzer), raw)
+    assert status == 431 and headers['connection'] == 'close'
+    assert 'too large' in payload['error']
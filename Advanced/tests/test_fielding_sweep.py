@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fielding_scoring import METRIC_COLUMNS
+from fielding_sweep import grid_configs, kendall_tau_b, random_configs, sweep, weight_matrix
+from ipl_fielding_analyzer import IPLFieldingAnalyzer
+
+
+def brute_tau_b(x, y):
+    """Kendall's tau-b by comparing every pair."""
+    concordant = discordant = x_ties = y_ties = 0
+    n = len(x)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx, dy = np.sign(x[i] - x[j]), np.sign(y[i] - y[j])
+            if dx == 0 and dy == 0:
+                continue
+            if dx == 0:
+                x_ties += 1
+            elif dy == 0:
+                y_ties += 1
+            elif dx == dy:
+                concordant += 1
+            else:
+                discordant += 1
+    denom = math.sqrt((concordant + discordant + x_ties) * (concordant + discordant + y_ties))
+    return (concordant - discordant) / denom if denom else math.nan
+
+
+def brute_ranks(scores):
+    """Competition ranks: 1 + how many scores are strictly better."""
+    return np.array([1 + int((scores > s).sum()) for s in scores])
+
+
+@pytest.mark.parametrize('n', [2, 3, 17, 64, 101])
+@pytest.mark.parametrize('values', [3, 10, 1000])
+def test_kendall_tau_b_equals_brute_force(n, values):
+    rng = np.random.default_rng(n * values)
+    baseline = rng.integers(0, values, n).astype(np.float64)
+    scores = rng.integers(0, values, (6, n)).astype(np.float64)
+    scores[0] = baseline                      # identical ranking
+    scores[1] = -baseline                     # reversed ranking
+    got = kendall_tau_b(baseline, scores)
+    expected = [brute_tau_b(baseline, row) for row in scores]
+    np.testing.assert_allclose(got, expected, equal_nan=True)
+
+
+def test_kendall_tau_b_of_constant_scores_is_nan():
+    assert np.isnan(kendall_tau_b(np.arange(5.0), np.zeros((1, 5))))[0]
+
+
+def players(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({col: rng.integers(0, 4, n) for col in METRIC_COLUMNS})
+    df.insert(0, 'Player_Name', [f'P{i}' for i in range(n)])
+    return df
+
+
+def test_sweep_statistics_equal_a_loop_over_configs():
+    df = players(30)
+    base = IPLFieldingAnalyzer.WEIGHTS
+    configs = random_configs(base, 40, spread=2, seed=1)
+    result = sweep(df, base, configs, top_k=5)
+
+    X = df[list(METRIC_COLUMNS)].to_numpy(dtype=np.float64)
+    W = weight_matrix(configs)
+    base_scores = X @ weight_matrix(pd.DataFrame([base]))[:, 0]
+    ranks = np.array([brute_ranks(X @ W[:, c]) for c in range(W.shape[1])])
+    expected = pd.DataFrame({
+        'Player_Name': df['Player_Name'],
+        'Baseline_Rank': brute_ranks(base_scores),
+        'Mean_Rank': ranks.mean(axis=0),
+        'Std_Rank': ranks.std(axis=0),
+        'Best_Rank': ranks.min(axis=0),
+        'Worst_Rank': ranks.max(axis=0),
+        'Top5_Freq': (ranks <= 5).mean(axis=0),
+    }).set_index('Player_Name')
+    got = result.players.set_index('Player_Name').loc[expected.index, expected.columns]
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    np.testing.assert_allclose(result.configs['Kendall_Tau'],
+                               [brute_tau_b(base_scores, X @ W[:, c]) for c in range(W.shape[1])])
+    assert result.players['Baseline_Rank'].is_monotonic_increasing
+
+
+def test_sweep_result_does_not_depend_on_chunking():
+    df = players(50, seed=3)
+    base = IPLFieldingAnalyzer.WEIGHTS
+    configs = grid_configs(base, {'WDC': [-2, -3, -4], 'WDH': [1, 2, 3], 'WC': [1, 2]})
+    whole = sweep(df, base, configs)
+    chunked = sweep(df, base, configs, budget_bytes=1)
+    pd.testing.assert_frame_equal(whole.players, chunked.players)
+    pd.testing.assert_frame_equal(whole.configs, chunked.configs)
+    assert len(configs) == 18
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fielding_windows import RollingWindows, breakdown, expanding_sums, match_totals, rolling_sums, tumbling_sums
+
+
+def random_events(seed, matches=25, players=8, start=1):
+    """Chronological events: a few rows per (match, player), not every player in every match."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for match in range(start, start + matches):
+        for player in rng.choice(players, size=int(rng.integers(1, players + 1)), replace=False):
+            for _ in range(int(rng.integers(1, 4))):
+                rows.append((f'P{player}', match, ['Home', 'Away'][match % 2], int(rng.integers(-3, 8))))
+    return pd.DataFrame(rows, columns=['Player_Name', 'Match_No', 'Venue', 'PS'])
+
+
+def per_player_matches(events):
+    """{player: [PS of each of their matches, in order]}, computed the plain way."""
+    history = {}
+    for (player, match), ps in events.groupby(['Player_Name', 'Match_No'], sort=False)['PS'].sum().items():
+        history.setdefault(player, []).append(ps)
+    return history
+
+
+def expected_windows(events, size):
+    rows = []
+    for player, values in per_player_matches(events).items():
+        for i in range(len(values)):
+            rows.append((player, i + 1, values[i], sum(values[max(0, i + 1 - size):i + 1]), sum(values[:i + 1])))
+    return rows
+
+
+@pytest.mark.parametrize('size', [1, 3, 5, 40])
+@pytest.mark.parametrize('seed', range(3))
+def test_rolling_and_expanding_equal_a_recompute(seed, size):
+    events = random_events(seed)
+    out = expanding_sums(rolling_sums(match_totals(events), size))
+    got = sorted(zip(out['Player_Name'], out['Match_Seq'], out['PS'], out[f'PS_last{size}'], out['PS_total']))
+    assert got == sorted(expected_windows(events, size))
+
+
+@pytest.mark.parametrize('size', [1, 4, 7])
+def test_tumbling_blocks_equal_a_recompute(size):
+    events = random_events(11)
+    out = tumbling_sums(match_totals(events), size)
+    expected = []
+    for player, values in per_player_matches(events).items():
+        for block, begin in enumerate(range(0, len(values), size), 1):
+            chunk = values[begin:begin + size]
+            expected.append((player, block, len(chunk), sum(chunk)))
+    assert sorted(zip(out['Player_Name'], out['Window'], out['Matches'], out['PS'])) == sorted(expected)
+
+
+@pytest.mark.parametrize('chunk', [1, 3, 10])
+def test_incremental_windows_equal_a_full_recompute(chunk):
+    events = random_events(5, matches=30)
+    size = 4
+    windows = RollingWindows(size=size)
+    parts = []
+    for first in range(1, 31, chunk):
+        batch = events[events['Match_No'].between(first, first + chunk - 1)]
+        parts.append(windows.extend(batch))
+    got = pd.concat(parts, ignore_index=True)
+    rows = zip(got['Player_Name'], got['Match_Seq'], got['PS'], got[f'PS_last{size}'], got['PS_total'])
+    assert sorted(rows) == sorted(expected_windows(events, size))
+
+
+def test_breakdown_ranks_players_within_each_venue():
+    events = random_events(2)
+    table = breakdown(events, 'Venue')
+    for venue, group in table.groupby('Venue', sort=False):
+        assert group['PS'].is_monotonic_decreasing
+        expected = events[events['Venue'] == venue].groupby('Player_Name')['PS'].sum()
+        assert dict(zip(group['Player_Name'], group['PS'])) == expected.to_dict()
@@ -0,0 +1,155 @@
+"""
+Cost of N accumulators per block against the same statistics written by hand.
+
+Usage:
+    python bench_accumulators.py            # 2e7 rolls per row
+    python bench_accumulators.py 1e8        # rolls per row
+
+The rolls are generated once, in blocks of dice_sim.DEFAULT_BLOCK, so
+only the statistics are timed. For N = 1..4 of FaceCounts, RunLengths,
+MeanVariance and Transitions:
+
+    accumulators  a RollStats of the first N, one pass of each per block
+    hand-written  one function per block computing the same N statistics
+                  inline, sharing the bincount between the face counts
+                  and the mean and variance
+    python        for_loop1.py style: one Python loop over the rolls
+                  keeping the same N statistics in local variables
+                  (timed on 1e6 rolls)
+
+Both NumPy rows are checked to give the same counts.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dice_accumulators import (FACES, MAX_RUN, FaceCounts, MeanVariance, RollStats,  # noqa: E402
+                               RunLengths, Transitions)
+from dice_sim import DEFAULT_BLOCK  # noqa: E402
+
+ACCUMULATORS = (('counts', FaceCounts), ('runs', RunLengths), ('moments', MeanVariance),
+                ('transitions', Transitions))
+PYTHON_ROLLS = 10**6
+
+
+def accumulators(blocks, n):
+    stats = RollStats(**{name: cls() for name, cls in ACCUMULATORS[:n]})
+    for rolls in blocks:
+        stats.update(rolls)
+    return stats.finish()
+
+
+def hand_written(blocks, n, max_run=MAX_RUN):
+    counts = np.zeros(FACES + 1, dtype=np.int64)
+    runs = np.zeros((FACES, max_run + 1), dtype=np.int64)
+    long_total = np.zeros(FACES, dtype=np.int64)
+    matrix = np.zeros(FACES * FACES + FACES + 1, dtype=np.int64)
+    open_face = open_length = last = 0
+    for rolls in blocks:
+        size = len(rolls)
+        counts += np.bincount(rolls, minlength=FACES + 1)
+        if n >= 2:
+            new_run = np.empty(size, dtype=bool)
+            new_run[0] = True
+            np.not_equal(rolls[1:], rolls[:-1], out=new_run[1:])
+            starts = np.flatnonzero(new_run)
+            faces = rolls[starts]
+            lengths = np.diff(starts, append=size)
+            if faces[0] == open_face:
+                lengths[0] += open_length
+            elif open_face:
+                runs[open_face - 1, min(open_length, max_run)] += 1
+            open_face, open_length = int(faces[-1]), int(lengths[-1])
+            faces, lengths = faces[:-1], lengths[:-1]
+            if lengths.size and lengths.max() >= max_run:
+                long = lengths >= max_run
+                np.add.at(long_total, faces[long] - 1, lengths[long])
+            index = np.minimum(lengths, max_run, out=lengths)
+            index += np.multiply(faces, max_run + 1, dtype=np.int64)
+            index -= max_run + 1
+            runs += np.bincount(index, minlength=runs.size).reshape(runs.shape)
+        if n >= 4:
+            if last:
+                matrix[last * FACES + rolls[0]] += 1
+            index = rolls[:-1] * np.uint8(FACES)
+            index += rolls[1:]
+            matrix += np.bincount(index, minlength=matrix.size)
+            last = int(rolls[-1])
+    if open_face:
+        runs[open_face - 1, min(open_length, max_run)] += 1
+    faces = np.arange(FACES + 1)
+    return counts[1:], runs, int(counts @ faces), int(counts @ (faces * faces)), \
+        matrix[FACES + 1:].reshape(FACES, FACES)
+
+
+def python_loop(rolls, n):
+    counts = [0] * (FACES + 1)
+    runs = {}
+    total = squares = 0
+    matrix = [[0] * (FACES + 1) for _ in range(FACES + 1)]
+    previous_roll = None
+    run_length = 0
+    for roll in rolls:
+        counts[roll] += 1
+        if n >= 2:
+            if roll == previous_roll:
+                run_length += 1
+            else:
+                if previous_roll is not None:
+                    key = (previous_roll, min(run_length, MAX_RUN))
+                    runs[key] = runs.get(key, 0) + 1
+                run_length = 1
+        if n >= 3:
+            total += roll
+            squares += roll * roll
+        if n >= 4 and previous_roll is not None:
+            matrix[previous_roll][roll] += 1
+        previous_roll = roll
+    return counts, runs, total, squares, matrix
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    rolls = int(float(sys.argv[1])) if len(sys.argv) > 1 else 2 * 10**7
+    rng = np.random.default_rng(0)
+    blocks = [rng.integers(1, FACES + 1, size=min(DEFAULT_BLOCK, rolls - done), dtype=np.uint8)
+              for done in range(0, rolls, DEFAULT_BLOCK)]
+    python_rolls = rng.integers(1, FACES + 1, size=PYTHON_ROLLS, dtype=np.uint8).tolist()
+
+    rows = []
+    for n in range(1, len(ACCUMULATORS) + 1):
+        framework_secs, stats = timed(accumulators, blocks, n)
+        hand_secs, (counts, runs, total, squares, matrix) = timed(hand_written, blocks, n)
+        if 'counts' in stats:
+            assert (stats['counts'].counts == counts).all()
+        if 'runs' in stats:
+            assert (stats['runs'].runs == runs).all()
+        if 'moments' in stats:
+            assert (stats['moments'].total, stats['moments'].squares) == (total, squares)
+        if 'transitions' in stats:
+            assert (stats['transitions'].matrix == matrix).all()
+        python_secs, _ = timed(python_loop, python_rolls, n)
+        rows.append((str(n), ', '.join(name for name, _ in ACCUMULATORS[:n]),
+                     f'{framework_secs / rolls * 1e9:.2f}', f'{hand_secs / rolls * 1e9:.2f}',
+                     f'{(framework_secs / hand_secs - 1) * 100:+.0f}%', f'{python_secs / PYTHON_ROLLS * 1e9:.0f}'))
+
+    headers = ['N', 'statistics', 'accumulators ns/roll', 'hand-written ns/roll', 'overhead', 'python ns/roll']
+    widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(headers)]
+    print(f'{rolls:,} rolls in blocks of {DEFAULT_BLOCK:,}')
+    print('  '.join(h.rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(v.rjust(w) for v, w in zip(row, widths)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Rolls per second: for_loop1.py's Python loop vs dice_sim.py's NumPy blocks.
+
+Usage:
+    python bench_dice.py                # 1e8 NumPy rolls per row
+    python bench_dice.py 1e9            # rolls per NumPy row
+
+    python      random.randint per roll, counting 6s, 1s and two 6s in a
+                row as for_loop1.py does (without printing); 1e6 rolls
+    numpy       dice_sim.simulate at several block sizes, one worker
+    workers     dice_sim.simulate with the default block and 1, 2, 4
+                processes (only faster with as many free cores)
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dice_sim import DEFAULT_BLOCK, simulate  # noqa: E402
+
+PYTHON_ROLLS = 10**6
+BLOCKS = (2**10, 2**12, 2**14, 2**16, 2**18, 2**20)
+WORKERS = (1, 2, 4)
+
+
+def python_loop(rolls):
+    count_6 = count_1 = two_6s_in_a_row = 0
+    previous_roll = None
+    for _ in range(rolls):
+        roll = random.randint(1, 6)
+        if roll == 6:
+            count_6 += 1
+        if roll == 1:
+            count_1 += 1
+        if roll == 6 and previous_roll == 6:
+            two_6s_in_a_row += 1
+        previous_roll = roll
+    return count_6, count_1, two_6s_in_a_row
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    rolls = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**8
+    random.seed(0)
+    rows = [('python', 'randint', '1', PYTHON_ROLLS, timed(python_loop, PYTHON_ROLLS))]
+    for block in BLOCKS:
+        rows.append(('numpy', f'{block:,}', '1', rolls, timed(simulate, rolls, 0, 1, block)))
+    for workers in WORKERS[1:]:
+        rows.append(('workers', f'{DEFAULT_BLOCK:,}', str(workers), rolls,
+                     timed(simulate, rolls, 0, workers, DEFAULT_BLOCK)))
+
+    base = rows[0][3] / rows[0][4]
+    table = [(name, block, workers, f'{n:,}', f'{secs:.2f}', f'{n / secs / 1e6:,.1f}', f'{n / secs / base:,.0f}x')
+             for name, block, workers, n, secs in rows]
+    headers = ['method', 'block', 'workers', 'rolls', 'seconds', 'M rolls/s', 'vs python']
+    widths = [max(len(h), *(len(r[i]) for r in table)) for i, h in enumerate(headers)]
+    print(f'{os.cpu_count()} CPU(s)')
+    print('  '.join(h.rjust(w) for h, w in zip(headers, widths)))
+    for row in table:
+        print('  '.join(v.rjust(w) for v, w in zip(row, widths)))
+
+
+if __name__ == '__main__':
+    main()
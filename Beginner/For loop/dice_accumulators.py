@@ -0,0 +1,286 @@
+"""
+Streaming accumulators for dice rolls: each statistic is its own object.
+
+for_loop1.py keeps its statistics as counters inside the roll loop, so a
+new metric means editing the loop. Here every statistic is an
+Accumulator that consumes blocks of rolls (uint8 arrays of faces 1-6) in
+one pass and keeps a fixed amount of state however many rolls it sees:
+
+    FaceCounts      rolls of each face
+    RunLengths      run-length histogram, pairs and longest streak per face
+    MeanVariance    mean and variance of the faces
+    Transitions     6x6 counts of each face followed by each face
+
+The protocol is update(rolls) for each block of a sequence, finish() at
+its end (closing state carried across blocks, like an open run), and
+merge(other) to add another finished sequence, e.g. another worker's
+stream or an earlier run. All state is integer counts, so merged results
+are exactly those of one accumulator that saw every sequence.
+
+RollStats runs a named set of accumulators over the same blocks:
+
+    stats = RollStats(counts=FaceCounts(), moves=Transitions())
+    for block in blocks:
+        stats.update(block)
+    stats.finish()
+    stats['moves'].matrix
+
+A new statistic is a subclass of Accumulator implementing update(),
+merge() and, when it carries state across blocks, finish().
+"""
+
+import numpy as np
+
+FACES = 6
+MAX_RUN = 32
+
+
+class Accumulator:
+    """One statistic over sequences of rolls, fed block by block."""
+
+    def update(self, rolls):
+        """Add a block of rolls (uint8 faces 1-6) continuing the current sequence."""
+        raise NotImplementedError
+
+    def finish(self):
+        """End the current sequence. Returns self."""
+        return self
+
+    def merge(self, other):
+        """Add another finished sequence's statistic. Returns self."""
+        raise NotImplementedError
+
+    def _check_merge(self, other, *config):
+        if type(other) is not type(self):
+            raise TypeError(f'cannot merge {type(other).__name__} into {type(self).__name__}')
+        for name in config:
+            if getattr(other, name) != getattr(self, name):
+                raise ValueError(f'cannot merge {type(self).__name__} with different {name}')
+
+
+class FaceCounts(Accumulator):
+    """Rolls of each face: counts[f] for face f + 1."""
+
+    def __init__(self):
+        self.counts = np.zeros(FACES, dtype=np.int64)
+
+    def update(self, rolls):
+        self.counts += np.bincount(rolls, minlength=FACES + 1)[1:]
+
+    def merge(self, other):
+        self._check_merge(other)
+        self.counts += other.counts
+        return self
+
+
+class RunLengths(Accumulator):
+    """
+    Runs of each face: a run is a maximal stretch of one face (6 6 6 is one
+    run of length 3). Run starts are where a roll differs from the one
+    before it; the run still open at the end of a block is carried into
+    the next one, so block boundaries never split a run.
+    """
+
+    def __init__(self, max_run=MAX_RUN):
+        self.max_run = max_run
+        # runs[f, k]: closed runs of face f + 1 with length k (k == max_run: max_run or longer)
+        self.runs = np.zeros((FACES, max_run + 1), dtype=np.int64)
+        self.long_total = np.zeros(FACES, dtype=np.int64)
+        self.long_max = np.zeros(FACES, dtype=np.int64)
+        # The run still open at the end of the last block: (face, length); face 0 when nothing is open.
+        self.open_face = 0
+        self.open_length = 0
+
+    def update(self, rolls):
+        n = len(rolls)
+        if not n:
+            return
+        new_run = np.empty(n, dtype=bool)
+        new_run[0] = True
+        np.not_equal(rolls[1:], rolls[:-1], out=new_run[1:])
+        starts = np.flatnonzero(new_run)
+        # Runs of this block: faces and lengths; the last one is left open.
+        faces = rolls[starts]
+        lengths = np.diff(starts, append=n)
+        if faces[0] == self.open_face:
+            lengths[0] += self.open_length
+        elif self.open_face:
+            self._close(np.array([self.open_face], dtype=np.uint8), np.array([self.open_length]))
+        self.open_face, self.open_length = int(faces[-1]), int(lengths[-1])
+        self._close(faces[:-1], lengths[:-1])
+
+    def _close(self, faces, lengths):
+        """Count closed runs; lengths is overwritten."""
+        if lengths.size and lengths.max() >= self.max_run:
+            long = lengths >= self.max_run
+            for face, length in zip(faces[long].tolist(), lengths[long].tolist()):
+                self.long_total[face - 1] += length
+                self.long_max[face - 1] = max(self.long_max[face - 1], length)
+        # Histogram cell of each run: (face - 1) * (max_run + 1) + min(length, max_run).
+        index = np.minimum(lengths, self.max_run, out=lengths)
+        index += np.multiply(faces, self.max_run + 1, dtype=np.int64)
+        index -= self.max_run + 1
+        self.runs += np.bincount(index, minlength=self.runs.size).reshape(self.runs.shape)
+
+    def finish(self):
+        if self.open_face:
+            self._close(np.array([self.open_face], dtype=np.uint8), np.array([self.open_length]))
+            self.open_face = self.open_length = 0
+        return self
+
+    def merge(self, other):
+        self._check_merge(other, 'max_run')
+        if self.open_face or other.open_face:
+            raise ValueError('finish() both sequences before merging them')
+        self.runs += other.runs
+        self.long_total += other.long_total
+        self.long_max = np.maximum(self.long_max, other.long_max)
+        return self
+
+    @property
+    def faces(self):
+        """Rolls of each face (every roll belongs to exactly one run)."""
+        counts = self.runs[:, :self.max_run] @ np.arange(self.max_run) + self.long_total
+        if self.open_face:
+            counts[self.open_face - 1] += self.open_length
+        return counts
+
+    def pairs(self, face):
+        """Overlapping pairs of `face` rolled twice in a row (666 holds two)."""
+        lengths = np.arange(self.max_run)
+        runs = self.runs[face - 1]
+        short = int(np.dot(runs[:self.max_run], np.maximum(lengths - 1, 0)))
+        return short + int(self.long_total[face - 1]) - int(runs[self.max_run])
+
+    def longest(self, face):
+        """Longest run of `face`."""
+        if self.long_max[face - 1]:
+            return int(self.long_max[face - 1])
+        nonzero = np.flatnonzero(self.runs[face - 1])
+        return int(nonzero[-1]) if nonzero.size else 0
+
+    def histogram(self):
+        """{length: runs of that length, all faces}; the last key counts runs of max_run or longer."""
+        totals = self.runs.sum(axis=0)
+        return {k: int(totals[k]) for k in range(1, self.max_run + 1) if totals[k]}
+
+
+class MeanVariance(Accumulator):
+    """
+    Mean and variance of the faces, kept as exact integer sums of x and x**2
+    (a float running mean such as Welford's would make merged results
+    depend on the merge order).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.squares = 0
+
+    def update(self, rolls):
+        counts = np.bincount(rolls, minlength=FACES + 1)
+        faces = np.arange(len(counts))
+        self.count += len(rolls)
+        self.total += int(counts @ faces)
+        self.squares += int(counts @ (faces * faces))
+
+    def merge(self, other):
+        self._check_merge(other)
+        self.count += other.count
+        self.total += other.total
+        self.squares += other.squares
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator)."""
+        if self.count < 2:
+            return float('nan')
+        return (self.squares * self.count - self.total * self.total) / (self.count * (self.count - 1))
+
+
+class Transitions(Accumulator):
+    """Consecutive face pairs: matrix[a, b] counts face a + 1 followed by face b + 1."""
+
+    def __init__(self):
+        self.matrix = np.zeros((FACES, FACES), dtype=np.int64)
+        # Last face of the previous block (0 at the start of a sequence).
+        self.last = 0
+
+    def update(self, rolls):
+        if not len(rolls):
+            return
+        if self.last:
+            self.matrix[self.last - 1, rolls[0] - 1] += 1
+        # a * FACES + b is at most 42 and fits uint8; cells start at 1 * FACES + 1.
+        index = rolls[:-1] * np.uint8(FACES)
+        index += rolls[1:]
+        counts = np.bincount(index, minlength=FACES * FACES + FACES + 1)[FACES + 1:]
+        self.matrix += counts.reshape(FACES, FACES)
+        self.last = int(rolls[-1])
+
+    def finish(self):
+        self.last = 0
+        return self
+
+    def merge(self, other):
+        self._check_merge(other)
+        if self.last or other.last:
+            raise ValueError('finish() both sequences before merging them')
+        self.matrix += other.matrix
+        return self
+
+    def probabilities(self):
+        """Row-normalized matrix: P(next face | face)."""
+        totals = self.matrix.sum(axis=1, keepdims=True)
+        return self.matrix / np.maximum(totals, 1)
+
+
+class RollStats:
+    """Named accumulators fed the same blocks; rolls and sequences are counted here."""
+
+    def __init__(self, **accumulators):
+        self.accumulators = accumulators
+        self.rolls = 0
+        self.sequences = 0
+        self._open = False
+
+    def __getitem__(self, name):
+        return self.accumulators[name]
+
+    def __contains__(self, name):
+        return name in self.accumulators
+
+    def update(self, rolls):
+        """Feed a block of rolls (uint8 faces 1-6) to every accumulator."""
+        if not len(rolls):
+            return
+        self.rolls += len(rolls)
+        self._open = True
+        for accumulator in self.accumulators.values():
+            accumulator.update(rolls)
+
+    def finish(self):
+        """End the sequence in every accumulator. Returns self."""
+        for accumulator in self.accumulators.values():
+            accumulator.finish()
+        if self._open:
+            self.sequences += 1
+            self._open = False
+        return self
+
+    def merge(self, other):
+        """Add another finished RollStats with the same accumulators. Returns self."""
+        if self._open or other._open:
+            raise ValueError('finish() both sequences before merging them')
+        if other.accumulators.keys() != self.accumulators.keys():
+            raise ValueError('cannot merge statistics with different accumulators')
+        for name, accumulator in self.accumulators.items():
+            accumulator.merge(other.accumulators[name])
+        self.rolls += other.rolls
+        self.sequences += other.sequences
+        return self
@@ -0,0 +1,249 @@
+"""
+Vectorized dice Monte Carlo: face counts and run statistics over billions of rolls.
+
+for_loop1.py rolls one die 20 times with random.randint, counting 6s, 1s
+and "two 6s in a row". Here rolls are generated in NumPy blocks from a
+seeded Generator and summarized with array operations:
+
+    runs                a run is a maximal stretch of one face (6 6 6 is
+                        one run of length 3); run starts are where a roll
+                        differs from the one before it, run lengths the
+                        gaps between starts
+    run histogram       runs[face, length], lengths from max_run up in the
+                        last column (their exact total and maximum are
+                        kept separately)
+    two 6s in a row     overlapping pairs, as in for_loop1.py: a run of
+                        k sixes holds k - 1 of them
+    longest streak      per face
+    face counts         run lengths summed per face
+
+The run still open at the end of a block is carried into the next one,
+so block boundaries never split a run. With workers > 1, each process
+rolls its own stream from SeedSequence(seed).spawn(); streams are
+independent sequences and their statistics are merged. A seed gives the
+same results for the same block size and worker count (the Generator
+draws a block's rolls differently from the same rolls in smaller blocks).
+
+The statistics are accumulators from dice_accumulators.py; `extra` adds
+more of them (mean and variance, the face transition matrix, or your own)
+to the same pass over the rolls.
+
+    stats = simulate(10**9, seed=1, workers=4, extra={'moves': Transitions()})
+    stats.faces, stats.pairs(6), stats.longest(6), stats['moves'].matrix
+    for row in check(stats): print(row)
+
+    python dice_sim.py --rolls 1e9 --workers 4 --seed 1 --extra moments transitions
+"""
+
+import argparse
+import copy
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from dice_accumulators import FACES, MAX_RUN, FaceCounts, MeanVariance, RollStats, RunLengths, Transitions
+
+# Rolls per block: small enough that the per-run int64 temporaries stay in the CPU caches.
+DEFAULT_BLOCK = 2**14
+
+# Accumulators --extra can add to the default run statistics.
+EXTRA = {'counts': FaceCounts, 'moments': MeanVariance, 'transitions': Transitions}
+
+# |z| above this fails an analytic check.
+Z_LIMIT = 5.0
+
+
+class DiceStats(RollStats):
+    """
+    Face counts and run statistics of one or more independent roll
+    sequences, plus any `extra` accumulators ({name: Accumulator}).
+    """
+
+    def __init__(self, max_run=MAX_RUN, extra=None):
+        super().__init__(runs=RunLengths(max_run), **(extra or {}))
+
+    @property
+    def max_run(self):
+        return self['runs'].max_run
+
+    @property
+    def faces(self):
+        """Rolls of each face (derived from the runs)."""
+        return self['runs'].faces
+
+    def pairs(self, face):
+        """Overlapping pairs of `face` rolled twice in a row (666 holds two)."""
+        return self['runs'].pairs(face)
+
+    def longest(self, face):
+        """Longest run of `face`."""
+        return self['runs'].longest(face)
+
+    def run_histogram(self):
+        """{length: runs of that length, all faces}; the last key counts runs of max_run or longer."""
+        return self['runs'].histogram()
+
+
+def roll_stream(rolls, seed, block=DEFAULT_BLOCK, stats=None):
+    """
+    Fill stats (a fresh DiceStats by default) with one sequence of `rolls`
+    rolls from np.random.default_rng(seed) (an int or SeedSequence).
+    """
+    rng = np.random.default_rng(seed)
+    stats = DiceStats() if stats is None else stats
+    done = 0
+    while done < rolls:
+        n = min(block, rolls - done)
+        stats.update(rng.integers(1, FACES + 1, size=n, dtype=np.uint8))
+        done += n
+    return stats.finish()
+
+
+def simulate(rolls, seed=None, workers=1, block=DEFAULT_BLOCK, max_run=MAX_RUN, extra=None):
+    """
+    DiceStats of `rolls` rolls split over `workers` independent streams (one
+    process each). extra: {name: empty Accumulator}, copied for each stream.
+    """
+    rolls = int(rolls)
+    streams = np.random.SeedSequence(seed).spawn(workers)
+    shares = [rolls // workers + (i < rolls % workers) for i in range(workers)]
+    empty = DiceStats(max_run, copy.deepcopy(extra))
+    if workers == 1:
+        return roll_stream(rolls, streams[0], block, empty)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(roll_stream, shares, streams, [block] * workers, [empty] * workers))
+    total = results[0]
+    for result in results[1:]:
+        total.merge(result)
+    return total
+
+
+def expected_runs(n, length, p=1 / FACES):
+    """Expected runs of one face of exactly `length` in a sequence of n rolls."""
+    if length > n:
+        return 0.0
+    if length == n:
+        return p ** n
+    q = 1 - p
+    return (n - length - 1) * q * q * p ** length + 2 * q * p ** length
+
+
+def check(stats):
+    """
+    Rows (statistic, observed, expected, z, ok) comparing stats with the
+    analytic expectations. Face counts and pairs of 6s use their exact
+    variance; run counts use a Poisson approximation (var = mean), and the
+    longest run of 6s is compared with the log(n q) / log(1/p) rule of thumb.
+    Extra MeanVariance and Transitions accumulators add rows for the mean,
+    the variance and the transition count furthest from its expectation.
+    """
+    n, m = stats.rolls, stats.sequences
+    p = 1 / FACES
+    rows = []
+
+    for face in range(1, FACES + 1):
+        mean, var = n * p, n * p * (1 - p)
+        rows.append((f'rolls of {face}', int(stats.faces[face - 1]), mean, _z(stats.faces[face - 1], mean, var)))
+
+    mean, var = pair_moments(n, m, same=True)
+    rows.append(('two 6s in a row', stats.pairs(6), mean, _z(stats.pairs(6), mean, var)))
+
+    histogram = stats.run_histogram()
+    seq_rolls = n / max(m, 1)
+    for length in range(1, 6):
+        mean = FACES * m * expected_runs(seq_rolls, length)
+        observed = histogram.get(length, 0)
+        rows.append((f'runs of length {length}', observed, mean, _z(observed, mean, mean)))
+
+    longest = stats.longest(6)
+    rule = math.log(seq_rolls * (1 - p)) / math.log(1 / p) if seq_rolls > 1 else 1.0
+    rows.append(('longest run of 6s', longest, rule, None))
+
+    for accumulator in stats.accumulators.values():
+        if isinstance(accumulator, MeanVariance):
+            # A fair die: mean 7/2, variance 35/12, fourth central moment 707/48.
+            variance, fourth = 35 / 12, 707 / 48
+            rows.append(('mean face', accumulator.mean, 3.5, _z(accumulator.mean, 3.5, variance / n)))
+            rows.append(('face variance', accumulator.variance, variance,
+                         _z(accumulator.variance, variance, (fourth - variance ** 2) / n)))
+        elif isinstance(accumulator, Transitions):
+            worst = None
+            for (a, b), observed in np.ndenumerate(accumulator.matrix):
+                mean, var = pair_moments(n, m, same=a == b)
+                z = _z(observed, mean, var)
+                if worst is None or abs(z) > abs(worst[3]):
+                    worst = (f'{a + 1}->{b + 1} (worst of 36)', int(observed), mean, z)
+            rows.append(worst)
+    return [(name, observed, expected, z, z is None or abs(z) <= Z_LIMIT) for name, observed, expected, z in rows]
+
+
+def pair_moments(n, m, same):
+    """
+    Mean and variance of the count of one ordered face pair (a, b) at
+    consecutive rolls, over m independent sequences of n rolls in total.
+    I_i = [x_i = a and x_i+1 = b] has P = 1/36; neighbours overlap only when
+    a == b (P(I_i I_i+1) = 1/216), others are independent.
+    """
+    p = 1 / FACES
+    pair, overlap = p * p, p ** 3 if same else 0.0
+    mean = (n - m) * pair
+    var = (n - m) * pair * (1 - pair) + 2 * max(n - 2 * m, 0) * (overlap - pair * pair)
+    return mean, var
+
+
+def _z(observed, mean, var):
+    return (float(observed) - mean) / math.sqrt(var) if var > 0 else 0.0
+
+
+def _number(x):
+    if isinstance(x, float) and abs(x) < 100:
+        return f'{x:.4f}'
+    return f'{x:,.1f}' if isinstance(x, float) else f'{x:,}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Roll dice in NumPy blocks and check the statistics.')
+    parser.add_argument('--rolls', type=float, default=1e8, help='number of rolls (1e9 is fine)')
+    parser.add_argument('--seed', type=int, help='seed for reproducible runs')
+    parser.add_argument('--workers', type=int, default=1, help='processes, each with its own seed stream')
+    parser.add_argument('--block', type=int, default=DEFAULT_BLOCK, help=f'rolls per block (default: {DEFAULT_BLOCK})')
+    parser.add_argument('--extra', nargs='+', default=[], choices=sorted(EXTRA),
+                        help='more accumulators to run over the same rolls')
+    args = parser.parse_args(argv)
+
+    extra = {name: EXTRA[name]() for name in args.extra}
+    start = time.perf_counter()
+    stats = simulate(args.rolls, args.seed, args.workers, args.block, extra=extra)
+    secs = time.perf_counter() - start
+
+    print(f"Rolls: {stats.rolls:,} in {secs:.2f}s ({stats.rolls / secs / 1e6:,.1f}M rolls/s)")
+    for face in range(1, FACES + 1):
+        print(f"Number of times rolled a {face}: {stats.faces[face - 1]:,}")
+    print(f"Number of times rolled two 6s in a row: {stats.pairs(6):,}")
+    print(f"Longest streak of 6s: {stats.longest(6)}")
+    print("\nRun lengths (all faces):")
+    for length, count in stats.run_histogram().items():
+        print(f"  {length:>2}{'+' if length == stats.max_run else ' '} {count:,}")
+    if 'counts' in stats:
+        print(f"\nFace counts: {', '.join(f'{count:,}' for count in stats['counts'].counts)}")
+    if 'moments' in stats:
+        print(f"\nMean face: {stats['moments'].mean:.6f}, variance: {stats['moments'].variance:.6f}")
+    if 'transitions' in stats:
+        print("\nP(next face | face):")
+        print('      ' + ''.join(f'{b:>8}' for b in range(1, FACES + 1)))
+        for a, row in enumerate(stats['transitions'].probabilities(), 1):
+            print(f'  {a:>2}  ' + ''.join(f'{q:>8.4f}' for q in row))
+
+    print("\nAnalytic checks:")
+    rows = check(stats)
+    for name, observed, expected, z, ok in rows:
+        score = f'z = {z:+.2f}' if z is not None else '(rule of thumb)'
+        print(f"  {'OK  ' if ok else 'FAIL'} {name:<20} {_number(observed):>16} expected {_number(expected):>18}  {score}")
+    if not all(ok for *_, ok in rows):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
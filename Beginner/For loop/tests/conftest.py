@@ -0,0 +1,12 @@
+"""
+Shared setup for the dice tests.
+
+Run from the For loop folder (or the repository root):
+    python -m pytest -q "Beginner/For loop/tests"
+"""
+
+import sys
+from pathlib import Path
+
+# Make the dice modules importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,114 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from dice_accumulators import FACES, FaceCounts, MeanVariance, RollStats, RunLengths, Transitions
+
+
+def sequence(seed, n=5000):
+    """Random rolls with some long runs spliced in, so the max_run bucket is used."""
+    rng = np.random.default_rng(seed)
+    rolls = rng.integers(1, FACES + 1, n, dtype=np.uint8)
+    for start in rng.integers(0, n - 40, 5) if n > 40 else ():
+        rolls[start:start + int(rng.integers(5, 40))] = rng.integers(1, FACES + 1)
+    return rolls
+
+
+def blocks(rolls, seed):
+    """rolls cut at random points (empty and one-roll blocks included)."""
+    rng = np.random.default_rng(seed)
+    cuts = sorted(rng.integers(0, len(rolls) + 1, 12).tolist() + [0, 0, min(1, len(rolls)), len(rolls)])
+    return [rolls[a:b] for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def brute_runs(sequences):
+    """[(face, length)] of every run, runs never spanning two sequences."""
+    return [(face, len(list(group))) for rolls in sequences for face, group in itertools.groupby(rolls.tolist())]
+
+
+def feed(make, sequences, seed=0):
+    """Each sequence in random blocks into its own make() accumulator; returns them all merged."""
+    merged = make()
+    for i, rolls in enumerate(sequences):
+        part = make()
+        for block in blocks(rolls, seed + i):
+            part.update(block)
+        merged.merge(part.finish())
+    return merged
+
+
+SEQUENCES = [[sequence(1)], [sequence(2), sequence(3, 700), np.array([4], dtype=np.uint8)]]
+
+
+@pytest.mark.parametrize('sequences', SEQUENCES)
+def test_face_counts(sequences):
+    counts = feed(FaceCounts, sequences).counts
+    everything = np.concatenate(sequences).tolist()
+    assert counts.tolist() == [everything.count(face) for face in range(1, FACES + 1)]
+
+
+@pytest.mark.parametrize('max_run', [4, 32])
+@pytest.mark.parametrize('sequences', SEQUENCES)
+def test_run_lengths(sequences, max_run):
+    runs = feed(lambda: RunLengths(max_run), sequences)
+    expected = brute_runs(sequences)
+    histogram = {}
+    for _, length in expected:
+        histogram[min(length, max_run)] = histogram.get(min(length, max_run), 0) + 1
+    assert runs.histogram() == histogram
+    everything = np.concatenate(sequences).tolist()
+    assert runs.faces.tolist() == [everything.count(face) for face in range(1, FACES + 1)]
+    for face in range(1, FACES + 1):
+        lengths = [length for f, length in expected if f == face]
+        assert runs.longest(face) == max(lengths, default=0)
+        assert runs.pairs(face) == sum(length - 1 for length in lengths)
+
+
+@pytest.mark.parametrize('sequences', SEQUENCES)
+def test_mean_and_variance(sequences):
+    moments = feed(MeanVariance, sequences)
+    everything = np.concatenate(sequences).astype(np.float64)
+    assert moments.count == len(everything)
+    assert moments.mean == pytest.approx(everything.mean())
+    assert moments.variance == pytest.approx(everything.var(ddof=1))
+
+
+@pytest.mark.parametrize('sequences', SEQUENCES)
+def test_transitions(sequences):
+    matrix = feed(Transitions, sequences).matrix
+    expected = np.zeros((FACES, FACES), dtype=np.int64)
+    for rolls in sequences:
+        for a, b in zip(rolls[:-1].tolist(), rolls[1:].tolist()):
+            expected[a - 1, b - 1] += 1
+    assert (matrix == expected).all()
+    assert matrix.sum() == sum(len(rolls) - 1 for rolls in sequences)
+
+
+def test_roll_stats_feeds_every_accumulator_and_merges():
+    first, second = sequence(8), sequence(9, 1000)
+    stats = RollStats(counts=FaceCounts(), runs=RunLengths())
+    for block in blocks(first, 0):
+        stats.update(block)
+    stats.finish()
+    other = RollStats(counts=FaceCounts(), runs=RunLengths())
+    other.update(second)
+    stats.merge(other.finish())
+    assert (stats.rolls, stats.sequences) == (len(first) + len(second), 2)
+    assert stats['counts'].counts.sum() == stats.rolls
+    assert sum(stats['runs'].histogram().values()) == len(brute_runs([first, second]))
+    assert 'runs' in stats and 'moments' not in stats
+
+
+def test_merging_needs_finished_sequences_of_the_same_kind():
+    runs = RunLengths()
+    runs.update(sequence(1, 10))
+    with pytest.raises(ValueError):
+        runs.merge(RunLengths())
+    with pytest.raises(ValueError):
+        RunLengths(4).merge(RunLengths(8))
+    with pytest.raises(TypeError):
+        FaceCounts().merge(Transitions())
+    stats = RollStats(counts=FaceCounts())
+    with pytest.raises(ValueError):
+        stats.merge(RollStats(runs=RunLengths()))
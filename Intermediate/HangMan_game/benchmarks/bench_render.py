@@ -0,0 +1,138 @@
+"""
+Per-guess render latency of the Hangman window: retained-mode board vs full redraws.
+
+Usage:
+    python bench_render.py              # 2,000 games per renderer
+    python bench_render.py 10000        # games per renderer
+
+Needs an X display. Without DISPLAY set it starts Xvfb itself when it is
+installed (or run it under xvfb-run). Both renderers play the same words
+with the same guesses (letters in English frequency order until the game
+ends); sounds and the game-over dialog are switched off.
+
+    retained   quiz_game.HangmanGame: board items created once, parts shown
+               and hidden by tag, widget options applied in one idle callback
+    immediate  the previous drawing: canvas.delete('all') and a full redraw
+               on every wrong guess, each widget option configured at once
+
+Latency is measured from guess_letter() until update_idletasks() returns,
+i.e. until Tk has applied the changes and redrawn.
+"""
+
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hangman_engine import LETTER_ORDER  # noqa: E402
+from quiz_game import HangmanGame  # noqa: E402
+
+DEFAULT_GAMES = 2_000
+
+
+class ImmediateGame(HangmanGame):
+    """HangmanGame with the drawing and widget updates it had before the retained-mode board."""
+
+    def create_board(self):
+        pass
+
+    def draw_hangman(self, stage):
+        self.canvas.delete('all')
+        self.canvas.create_line(50, 380, 300, 380, width=4, fill='#2C3E50')
+        self.canvas.create_line(100, 380, 100, 80, width=4, fill='#2C3E50')
+        self.canvas.create_line(100, 80, 250, 80, width=4, fill='#2C3E50')
+        self.canvas.create_line(100, 120, 140, 80, width=3, fill='#2C3E50')
+        self.canvas.create_line(250, 80, 250, 120, width=3, fill='#2C3E50')
+        for kind, x1, y1, x2, y2, _ in self.hangman_parts[:stage]:
+            if kind == 'oval':
+                self.canvas.create_oval(x1, y1, x2, y2, width=3, outline='#2C3E50')
+            else:
+                self.canvas.create_line(x1, y1, x2, y2, width=3, fill='#2C3E50')
+
+    def set_options(self, widget, **options):
+        widget.configure(**options)
+
+
+def start_display():
+    """Start Xvfb when there is no display; returns its process (or None)."""
+    if os.environ.get('DISPLAY'):
+        return None
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        sys.exit('bench_render.py needs an X display: set DISPLAY, run it under xvfb-run or install Xvfb')
+    number = next(n for n in range(99, 199) if not Path(f'/tmp/.X11-unix/X{n}').exists())
+    proc = subprocess.Popen([xvfb, f':{number}', '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while not Path(f'/tmp/.X11-unix/X{number}').exists():
+        if proc.poll() is not None or time.monotonic() > deadline:
+            sys.exit('Xvfb did not start')
+        time.sleep(0.05)
+    os.environ['DISPLAY'] = f':{number}'
+    return proc
+
+
+def run(game_class, games, seed=0):
+    """(per-guess latencies in ms, mean canvas items, canvas items created, seconds)."""
+    import tkinter as tk
+
+    root = tk.Tk()
+    try:
+        random.seed(seed)
+        game = game_class(root)
+        game.play_sound_async = lambda sound_type: None
+        game._show_game_over_dialog = lambda won: None
+        root.update()
+        latencies = []
+        items = []
+        start = time.perf_counter()
+        for _ in range(games):
+            game.new_game()
+            root.update_idletasks()
+            for letter in LETTER_ORDER:
+                if not game.game_active:
+                    break
+                t0 = time.perf_counter()
+                game.guess_letter(letter)
+                root.update_idletasks()
+                latencies.append((time.perf_counter() - t0) * 1000)
+                items.append(len(game.canvas.find_all()))
+        secs = time.perf_counter() - start
+        # Item ids are never reused, so the highest id counts every item ever created.
+        created = max(game.canvas.find_all(), default=0)
+        return latencies, statistics.fmean(items), created, secs
+    finally:
+        root.destroy()
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_GAMES
+    display = start_display()
+    rows = []
+    try:
+        for name, game_class in (('immediate', ImmediateGame), ('retained', HangmanGame)):
+            latencies, items, created, secs = run(game_class, games)
+            cuts = statistics.quantiles(latencies, n=100)
+            rows.append((name, f'{len(latencies):,}', f'{statistics.median(latencies):.3f}', f'{cuts[94]:.3f}',
+                         f'{cuts[98]:.3f}', f'{max(latencies):.2f}', f'{items:.1f}', f'{created:,}',
+                         f'{games / secs:,.0f}'))
+    finally:
+        if display is not None:
+            display.terminate()
+
+    headers = ['renderer', 'guesses', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms', 'items', 'items created', 'games/s']
+    widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(headers)]
+    print(f'{games:,} games per renderer')
+    print('  '.join(h.rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(str(v).rjust(w) for v, w in zip(row, widths)))
+
+
+if __name__ == '__main__':
+    main()
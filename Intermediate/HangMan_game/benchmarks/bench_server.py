@@ -0,0 +1,145 @@
+"""
+Load test for the Hangman server: concurrent sessions, guess latency, memory per session.
+
+Usage:
+    python bench_server.py                      # 5,000 sessions, 3 games each, 1 s between guesses
+    python bench_server.py 10000 1 0            # sessions, games per session, think time in ms
+    python bench_server.py 2000 3 1000 words.idx # ... and a word file or compiled index
+
+Starts hangman_server.py on a free port (logging results to a temporary
+file), then:
+    1. opens every session and starts a game in it, and reads the
+       server's RSS from STATS before and after: the difference divided by
+       the session count is the memory per idle session (socket buffers,
+       stream objects, Session and HangmanRound);
+    2. has all sessions play their games at once, guessing letters in
+       English frequency order with a think time between guesses (0.5 to
+       1.5 times the given one, so sessions do not move in lockstep), and
+       times every GUESS round trip.
+Client and server share the machine, so latencies include the client's
+own scheduling of thousands of tasks. With no think time every session
+always has a guess in flight, and latency is simply sessions / guesses
+per second.
+"""
+
+import asyncio
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hangman_engine import DEFAULT_WORDS_FILE, LETTER_ORDER  # noqa: E402
+from hangman_server import raise_fd_limit  # noqa: E402
+
+SERVER = Path(__file__).resolve().parent.parent / 'hangman_server.py'
+
+# Connections being opened at once (keeps the listen backlog from overflowing).
+CONNECT_CONCURRENCY = 256
+
+
+def start_server(words, log_path):
+    proc = subprocess.Popen([sys.executable, str(SERVER), '--port', '0', '--words', str(words),
+                             '--log', str(log_path), '--seed', '0'], stdout=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        if line.startswith('[OK] Serving'):
+            return proc, int(line.rsplit(':', 1)[1])
+    raise RuntimeError('server did not start')
+
+
+async def command(reader, writer, line):
+    writer.write(line.encode() + b'\n')
+    await writer.drain()
+    reply = await reader.readline()
+    if not reply or reply.startswith(b'ERR'):
+        raise RuntimeError(f'{line!r} -> {reply!r}')
+    return reply.decode().split()
+
+
+async def stats(port):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    fields = await command(reader, writer, 'STATS')
+    writer.close()
+    return {key: int(value) for key, value in (field.split('=') for field in fields[1:])}
+
+
+async def open_session(port, gate):
+    async with gate:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        await command(reader, writer, 'NEW')
+        return reader, writer
+
+
+async def play(reader, writer, games, think, latencies, outcomes):
+    for game in range(games):
+        if game:
+            await command(reader, writer, 'NEW')
+        for letter in LETTER_ORDER:
+            if think:
+                await asyncio.sleep(think * random.uniform(0.5, 1.5))
+            start = time.perf_counter()
+            reply = await command(reader, writer, f'GUESS {letter}')
+            latencies.append(time.perf_counter() - start)
+            if reply[0] in ('WON', 'LOST'):
+                outcomes[reply[0]] += 1
+                break
+    writer.write(b'QUIT\n')
+    await writer.drain()
+    await reader.readline()
+    writer.close()
+
+
+async def load_test(port, sessions, games, think):
+    before = await stats(port)
+    gate = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    start = time.perf_counter()
+    streams = await asyncio.gather(*(open_session(port, gate) for _ in range(sessions)))
+    connect_secs = time.perf_counter() - start
+    idle = await stats(port)
+
+    latencies = []
+    outcomes = {'WON': 0, 'LOST': 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(play(reader, writer, games, think, latencies, outcomes) for reader, writer in streams))
+    play_secs = time.perf_counter() - start
+    after = await stats(port)
+    return before, idle, after, connect_secs, play_secs, latencies, outcomes
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    games = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    think = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 1.0
+    words = sys.argv[4] if len(sys.argv) > 4 else DEFAULT_WORDS_FILE
+    raise_fd_limit()
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / 'results.tsv'
+        proc, port = start_server(words, log_path)
+        try:
+            before, idle, after, connect_secs, play_secs, latencies, outcomes = asyncio.run(
+                load_test(port, sessions, games, think))
+        finally:
+            proc.terminate()
+            proc.wait()
+        logged = sum(1 for _ in open(log_path))
+
+    cuts = statistics.quantiles(latencies, n=100)
+    per_session = (idle['rss_kb'] - before['rss_kb']) / sessions
+    print(f'sessions opened      {idle["sessions"] - before["sessions"]:,} of {sessions:,} '
+          f'in {connect_secs:.2f}s (peak {after["peak_sessions"]:,})')
+    print(f'memory per session   {per_session:.1f} KiB (server RSS {before["rss_kb"] / 1024:.1f} -> '
+          f'{idle["rss_kb"] / 1024:.1f} MiB)')
+    print(f'games                {after["games"]:,} ({outcomes["WON"]:,} won, {outcomes["LOST"]:,} lost), '
+          f'{logged:,} logged, {after["log_dropped"]:,} log entries dropped')
+    print(f'guesses              {len(latencies):,} in {play_secs:.2f}s = {len(latencies) / play_secs:,.0f}/s')
+    print(f'guess latency ms     p50 {cuts[49] * 1000:.2f}  p95 {cuts[94] * 1000:.2f}  '
+          f'p99 {cuts[98] * 1000:.2f}  max {max(latencies) * 1000:.2f}')
+
+
+if __name__ == '__main__':
+    main()
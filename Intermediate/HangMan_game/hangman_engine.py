@@ -0,0 +1,343 @@
+"""
+Hangman rules without any UI, plus a precompiled word index and a solver.
+
+WordIndex groups the words by length. Each length bucket numbers its
+words 0..n-1 and stores one bitmask per (position, letter) pair: bit i is
+set when word i has that letter at that position. A set of candidate
+words is an int bitmask too, so narrowing it after a guess is a handful
+of big-int ANDs instead of a rescan of every word (the complements of the
+masks are kept too, so no big int is ever inverted during a game):
+
+    hit at positions P   keep words with the letter at each p in P and
+                         without it at every other position
+    miss                 drop every word containing the letter
+
+The index loads plain dictionaries (one word per line, optionally
+WORD<TAB>hint; words with characters outside A-Z are skipped) and can be
+saved in compiled form, so a dictionary of hundreds of thousands of
+words is indexed once and then loaded in a fraction of the time.
+
+    index = WordIndex.from_file('words.txt')
+    game = HangmanRound(*index.random_entry(random.Random(1)))
+    Solver(index).play(game)
+    game.won, game.wrong_guesses
+"""
+
+import math
+import pickle
+import random
+import string
+from pathlib import Path
+
+ALPHABET = string.ascii_uppercase
+MAX_WRONG = 6
+
+# Word list shipped with the game.
+DEFAULT_WORDS_FILE = Path(__file__).with_name('words.txt')
+
+# English letter frequency order; breaks ties between equally good guesses.
+LETTER_ORDER = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+# Compiled index files start with _MAGIC; INDEX_VERSION is bumped whenever their layout changes.
+INDEX_VERSION = 1
+_MAGIC = b'HANGIDX\n'
+
+_LETTER = {letter: i for i, letter in enumerate(ALPHABET)}
+
+
+def load_words(path):
+    """(WORD, hint) pairs from a word file; blank lines and '#' comments are skipped."""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            word, _, hint = line.partition('\t')
+            yield word.strip(), hint.strip()
+
+
+def _bitmask(indices, count):
+    """int with the given bit indices set (built as bytes: OR-ing 1 << i into a big int is quadratic)."""
+    bits = bytearray((count + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def iter_bits(mask):
+    """Indices of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class WordIndex:
+    """
+    Immutable index of a word list: per-length buckets with letter-position
+    bitmasks (see the module docstring). Safe to share between games.
+    """
+
+    def __init__(self, entries):
+        hints = {}
+        for word, hint in entries:
+            word = word.upper()
+            if word.isascii() and word.isalpha() and word not in hints:
+                hints[word] = hint
+        self.hints = hints
+        buckets = {}
+        for word in hints:
+            buckets.setdefault(len(word), []).append(word)
+        self.words = {length: tuple(words) for length, words in sorted(buckets.items())}
+        self._positions = {}
+        self._contains = {}
+        for length, words in self.words.items():
+            self._compile(length, words)
+        self._derive()
+
+    def _compile(self, length, words):
+        hits = [[[] for _ in ALPHABET] for _ in range(length)]
+        for i, word in enumerate(words):
+            for position, letter in enumerate(word):
+                hits[position][_LETTER[letter]].append(i)
+        count = len(words)
+        positions = [[_bitmask(indices, count) for indices in by_letter] for by_letter in hits]
+        contains = [0] * len(ALPHABET)
+        for by_letter in positions:
+            for i, mask in enumerate(by_letter):
+                contains[i] |= mask
+        self._positions[length] = positions
+        self._contains[length] = contains
+
+    def _derive(self):
+        # Complements within each bucket: ~mask would be a negative int, much slower to AND with.
+        self._absent = {}
+        self._not_at = {}
+        for length, contains in self._contains.items():
+            every = self.all_words(length)
+            self._absent[length] = [every ^ mask for mask in contains]
+            self._not_at[length] = [[every ^ mask for mask in by_letter] for by_letter in self._positions[length]]
+
+    @classmethod
+    def from_file(cls, path):
+        """Index of a word file, or of a compiled index written by save()."""
+        with open(path, 'rb') as f:
+            compiled = f.read(len(_MAGIC)) == _MAGIC
+        return cls.load(path) if compiled else cls(load_words(path))
+
+    def save(self, path):
+        """Write the compiled index; load() reads it back without re-indexing."""
+        with open(path, 'wb') as f:
+            f.write(_MAGIC)
+            pickle.dump((INDEX_VERSION, self.hints, self.words, self._positions, self._contains), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save() (uses pickle: only load files you created)."""
+        with open(path, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f'{path} is not a compiled word index')
+            version, hints, words, positions, contains = pickle.load(f)
+        if version != INDEX_VERSION:
+            raise ValueError(f'{path} was compiled by another version; rebuild it from the word list')
+        index = cls.__new__(cls)
+        index.hints, index.words, index._positions, index._contains = hints, words, positions, contains
+        index._derive()
+        return index
+
+    def __len__(self):
+        return len(self.hints)
+
+    def lengths(self):
+        return list(self.words)
+
+    def random_entry(self, rng=random, length=None):
+        """(word, hint) chosen uniformly from all words, or from words of one length."""
+        if length is not None:
+            word = rng.choice(self.words[length])
+            return word, self.hints[word]
+        # Walk the buckets rather than build a list of every word.
+        n = rng.randrange(len(self.hints))
+        for words in self.words.values():
+            if n < len(words):
+                return words[n], self.hints[words[n]]
+            n -= len(words)
+
+    def all_words(self, length):
+        """Candidate mask of every word of this length."""
+        return (1 << len(self.words.get(length, ()))) - 1
+
+    def narrow(self, length, mask, letter, positions):
+        """Candidates left after letter was found at exactly these positions (none: a miss)."""
+        i = _LETTER[letter]
+        if not positions:
+            return mask & self._absent[length][i]
+        at, not_at = self._positions[length], self._not_at[length]
+        for position in range(length):
+            mask &= at[position][i] if position in positions else not_at[position][i]
+        return mask
+
+    def outcomes(self, length, mask, letter):
+        """
+        Sizes of the candidate sets a guess of letter can leave: the misses,
+        then one set per distinct positions the letter is found at.
+        """
+        i = _LETTER[letter]
+        sizes = []
+        miss = mask & self._absent[length][i]
+        if miss:
+            sizes.append(miss.bit_count())
+        groups = [mask & self._contains[length][i]]
+        if not groups[0]:
+            return sizes
+        at, not_at = self._positions[length], self._not_at[length]
+        # Split the hits position by position; empty halves are dropped, so there are never more groups than
+        # words. A single word cannot be split further and is counted as soon as it is alone.
+        for position in range(length):
+            if not groups:
+                break
+            if not mask & at[position][i]:
+                continue
+            split = []
+            for group in groups:
+                for half in (group & at[position][i], group & not_at[position][i]):
+                    if half & (half - 1):
+                        split.append(half)
+                    elif half:
+                        sizes.append(1)
+            groups = split
+        sizes.extend(group.bit_count() for group in groups)
+        return sizes
+
+    def letter_counts(self, length, mask, skip=()):
+        """{letter: number of candidates containing it} for letters (not in skip) found in any candidate."""
+        contains = self._contains[length]
+        counts = {}
+        for letter in ALPHABET:
+            if letter not in skip:
+                found = mask & contains[_LETTER[letter]]
+                if found:
+                    counts[letter] = found.bit_count()
+        return counts
+
+    def candidates(self, length, mask):
+        """The words in a candidate mask."""
+        words = self.words[length]
+        return [words[i] for i in iter_bits(mask)]
+
+
+class HangmanRound:
+    """One game's state and rules; the Tk game and the simulator both play through this."""
+
+    __slots__ = ('word', 'hint', 'max_wrong', 'guessed', 'wrong_guesses', '_positions', '_missing')
+
+    def __init__(self, word, hint='', max_wrong=MAX_WRONG):
+        self.word = word
+        self.hint = hint
+        self.max_wrong = max_wrong
+        self.guessed = set()
+        self.wrong_guesses = 0
+        self._positions = {}
+        for position, letter in enumerate(word):
+            self._positions.setdefault(letter, []).append(position)
+        # Letters still hidden; the game is won when none are left.
+        self._missing = set(self._positions)
+
+    @property
+    def won(self):
+        return not self._missing
+
+    @property
+    def lost(self):
+        return self.wrong_guesses >= self.max_wrong
+
+    @property
+    def over(self):
+        return self.won or self.lost
+
+    def guess(self, letter):
+        """
+        Positions of letter in the word (an empty tuple for a wrong guess),
+        or None when it was already guessed or the game is over.
+        """
+        letter = letter.upper()
+        if letter not in _LETTER:
+            raise ValueError(f'not a letter: {letter!r}')
+        if letter in self.guessed or self.over:
+            return None
+        self.guessed.add(letter)
+        positions = self._positions.get(letter)
+        if positions is None:
+            self.wrong_guesses += 1
+            return ()
+        self._missing.discard(letter)
+        return tuple(positions)
+
+    def masked(self, hidden='_', sep=' '):
+        """The word with unguessed letters hidden, letters separated by sep."""
+        return sep.join(letter if letter in self.guessed else hidden for letter in self.word)
+
+
+class Solver:
+    """
+    Guesses the unguessed letter with the most expected information: the
+    one whose outcomes (a miss, or a hit at each possible set of positions)
+    split the remaining candidates most evenly, by entropy. Ties go to the
+    letter in more candidates, then to frequency order. This is optimal one
+    guess ahead, not over the whole game tree: it does not search further
+    guesses or weigh a miss's cost in lives.
+
+    The candidates follow from what the player can see (the revealed
+    pattern and the letters tried), so choices are memoized on that: games
+    that reach a position seen before cost a dict lookup per guess. One
+    Solver plays any number of games against its index.
+    """
+
+    def __init__(self, index, memo_size=200_000):
+        self.index = index
+        self.memo_size = memo_size
+        self._memo = {}
+
+    def best_letter(self, length, mask, guessed):
+        """The unguessed letter with the most expected information (frequency order if no candidate is left)."""
+        counts = self.index.letter_counts(length, mask, guessed) if mask else {}
+        letter, best = None, None
+        for candidate in LETTER_ORDER:
+            if candidate not in guessed and candidate in counts:
+                # Expected information is log2(n) - sum(k * log2(k)) / n over outcome sizes k,
+                # so the lowest sum is the most information.
+                spread = sum(k * math.log2(k) for k in self.index.outcomes(length, mask, candidate))
+                score = (spread, -counts[candidate])
+                if best is None or score < best:
+                    letter, best = candidate, score
+        if letter is None:
+            # The word is not in the index.
+            letter = next(c for c in LETTER_ORDER if c not in guessed)
+        return letter
+
+    def play(self, game):
+        """Guess until the game is over; returns the game."""
+        length = len(game.word)
+        mask = self.index.all_words(length)
+        pattern = ['_'] * length
+        # The position as the player sees it: revealed letters, then wrong guesses in order.
+        key = ''.join(pattern) + '|'
+        # Same module: read the round's fields directly instead of through the properties.
+        while game._missing and game.wrong_guesses < game.max_wrong:
+            letter = self._memo.get(key)
+            if letter is None:
+                letter = self.best_letter(length, mask, game.guessed)
+                if len(self._memo) >= self.memo_size:
+                    self._memo.clear()
+                self._memo[key] = letter
+            positions = game.guess(letter)
+            if positions:
+                for position in positions:
+                    pattern[position] = letter
+                key = ''.join(pattern) + key[length:]
+            else:
+                key += letter
+            if mask:
+                mask = self.index.narrow(length, mask, letter, positions)
+        return game
@@ -0,0 +1,61 @@
+"""
+Fire-and-forget side effects (beeps, result logging) on a fixed set of threads.
+
+Starting a thread per event lets a burst of events pile up any number of
+threads. EventPool has `workers` threads and a backlog of at most
+`backlog` events; when the backlog is full, new events are dropped and
+counted rather than queued without limit or blocking the caller (the Tk
+loop or the server's event loop).
+
+    sounds = EventPool(workers=1, backlog=8)
+    sounds.submit(winsound.Beep, 800, 100)
+    sounds.close()
+"""
+
+import queue
+import threading
+
+
+class EventPool:
+    """Runs submitted calls on `workers` daemon threads, in submission order per thread."""
+
+    def __init__(self, workers=1, backlog=64, name='events'):
+        self._queue = queue.Queue(backlog)
+        self.submitted = 0
+        self.dropped = 0
+        self.failed = 0
+        self._threads = [threading.Thread(target=self._run, name=f'{name}-{i}', daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args):
+        """Queue fn(*args); returns False (and counts a drop) when the backlog is full."""
+        try:
+            self._queue.put_nowait((fn, args))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                fn, args = item
+                fn(*args)
+            except Exception:
+                self.failed += 1
+            finally:
+                self._queue.task_done()
+
+    def close(self, wait=True):
+        """Stop the workers after the queued events; wait=True blocks until they are done."""
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
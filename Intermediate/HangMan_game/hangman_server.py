@@ -0,0 +1,252 @@
+"""
+Multi-player Hangman server on asyncio (standard library only).
+
+Every TCP connection is one player session; all sessions draw their words
+from one shared, read-only WordIndex, and each session's state is a small
+__slots__ object. The protocol is one command per line and one reply
+line per command:
+
+    NEW [length]     GAME <pattern> <wrong>/<max> <hint>
+    GUESS <letter>   HIT|MISS|REPEAT <pattern> <wrong>/<max>
+                     WON|LOST <word> <wrong>/<max>      when the guess ends the game
+    STATE            STATE <pattern> <wrong>/<max> <letters guessed>
+    STATS            STATS sessions=... peak_sessions=... games=... won=... guesses=... rss_kb=...
+    QUIT             BYE, then the server closes the connection
+    (anything else)  ERR <message>
+
+The pattern shows hidden letters as '_' (e.g. P_TH_N). Finished games are
+appended to the --log file by an EventPool worker, so a slow disk never
+stalls the event loop and a burst of results cannot start extra threads.
+
+    python hangman_server.py --port 7777 --words /usr/share/dict/words
+    printf 'NEW\\nGUESS E\\nQUIT\\n' | nc 127.0.0.1 7777
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from hangman_engine import DEFAULT_WORDS_FILE, MAX_WRONG, HangmanRound, WordIndex
+from hangman_events import EventPool
+
+# resource (file limits, peak RSS) only exists on Unix.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 7777
+
+# Finished games waiting to be logged; beyond this, results are dropped (and counted) rather than queued.
+LOG_BACKLOG = 10_000
+
+MAX_LINE_BYTES = 1024
+
+# Soft limit raise_fd_limit() asks for at most: macOS refuses an unlimited soft limit.
+MAX_OPEN_FILES = 65536
+
+# ru_maxrss is in bytes on macOS and in KiB on Linux and the BSDs.
+MAXRSS_PER_KB = 2**10 if sys.platform == 'darwin' else 1
+
+
+def rss_kb():
+    """Current resident set size in KiB (peak RSS where /proc is not available, 0 without either)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // MAXRSS_PER_KB
+
+
+def raise_fd_limit():
+    """
+    Allow up to MAX_OPEN_FILES open sockets if the hard limit permits; returns
+    the soft limit in effect (None where there are no such limits).
+    """
+    if resource is None:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = MAX_OPEN_FILES if hard == resource.RLIM_INFINITY else min(hard, MAX_OPEN_FILES)
+    if soft == resource.RLIM_INFINITY or soft >= target:
+        return soft
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError):
+        return soft
+    return target
+
+
+class CommandError(Exception):
+    """A bad command; sent back to the client as an ERR line."""
+
+
+class Session:
+    """One connection's state; __slots__ keeps thousands of sessions small."""
+
+    __slots__ = ('id', 'round', 'games', 'won')
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.round = None
+        self.games = 0
+        self.won = 0
+
+
+def status_line(game):
+    return f"{game.masked(sep='')} {game.wrong_guesses}/{game.max_wrong}"
+
+
+class HangmanServer:
+    """Serves Hangman sessions against one shared WordIndex."""
+
+    def __init__(self, index, max_wrong=MAX_WRONG, log_path=None, seed=None):
+        self.index = index
+        self.max_wrong = max_wrong
+        self.rng = random.Random(seed)
+        self.commands = {'NEW': self._new, 'GUESS': self._guess, 'STATE': self._state, 'STATS': self._stats}
+        self.sessions = 0
+        self.peak_sessions = 0
+        self.games = 0
+        self.wins = 0
+        self.guesses = 0
+        self._next_id = 0
+        self._log = open(log_path, 'a', encoding='utf-8', buffering=1) if log_path else None
+        self.events = EventPool(workers=1, backlog=LOG_BACKLOG, name='results') if log_path else None
+
+    def respond(self, session, line):
+        """Reply line (without newline) to one command line."""
+        name, _, argument = line.strip().partition(' ')
+        command = self.commands.get(name.upper())
+        if command is None:
+            return f'ERR unknown command {name!r}' if name else 'ERR empty command'
+        try:
+            return command(session, argument.strip())
+        except CommandError as e:
+            return f'ERR {e}'
+
+    def _new(self, session, argument):
+        length = None
+        if argument:
+            # isdigit() alone accepts digits such as '²' that int() rejects.
+            if not (argument.isascii() and argument.isdigit()) or int(argument) not in self.index.words:
+                raise CommandError(f'no words of length {argument}')
+            length = int(argument)
+        session.round = HangmanRound(*self.index.random_entry(self.rng, length), max_wrong=self.max_wrong)
+        return f'GAME {status_line(session.round)} {session.round.hint}'.rstrip()
+
+    def _guess(self, session, argument):
+        game = session.round
+        if game is None or game.over:
+            raise CommandError('no game in progress: send NEW')
+        if len(argument) != 1 or not argument.isascii() or not argument.isalpha():
+            raise CommandError('GUESS takes one letter')
+        positions = game.guess(argument)
+        self.guesses += 1
+        if positions is None:
+            return f'REPEAT {status_line(game)}'
+        if game.over:
+            self._finish(session)
+            return f"{'WON' if game.won else 'LOST'} {game.word} {game.wrong_guesses}/{game.max_wrong}"
+        return f"{'HIT' if positions else 'MISS'} {status_line(game)}"
+
+    def _state(self, session, argument):
+        game = session.round
+        if game is None:
+            raise CommandError('no game yet: send NEW')
+        return f"STATE {status_line(game)} {''.join(sorted(game.guessed)) or '-'}"
+
+    def _stats(self, session, argument):
+        dropped = self.events.dropped if self.events else 0
+        return (f'STATS sessions={self.sessions} peak_sessions={self.peak_sessions} games={self.games} '
+                f'won={self.wins} guesses={self.guesses} log_dropped={dropped} rss_kb={rss_kb()}')
+
+    def _finish(self, session):
+        game = session.round
+        session.games += 1
+        session.won += game.won
+        self.games += 1
+        self.wins += game.won
+        if self.events is not None:
+            self.events.submit(self._write_result, f'{time.time():.3f}\t{session.id}\t{game.word}\t'
+                                                   f"{'won' if game.won else 'lost'}\t{game.wrong_guesses}\n")
+
+    def _write_result(self, line):
+        # Runs on the EventPool thread; the log is line-buffered.
+        self._log.write(line)
+
+    async def handle(self, reader, writer):
+        """Serve one session until the client sends QUIT or disconnects."""
+        self._next_id += 1
+        session = Session(self._next_id)
+        self.sessions += 1
+        self.peak_sessions = max(self.peak_sessions, self.sessions)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b'ERR line too long\n')
+                    break
+                if not line:
+                    break
+                text = line.decode('utf-8', 'replace')
+                if text.strip().upper() == 'QUIT':
+                    writer.write(b'BYE\n')
+                    break
+                writer.write((self.respond(session, text) + '\n').encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """Run until cancelled; ready(port) is called once the socket is listening."""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE_BYTES, backlog=4096)
+        async with server:
+            if ready:
+                ready(server.sockets[0].getsockname()[1])
+            await server.serve_forever()
+
+    def close(self):
+        """Finish logging queued results."""
+        if self.events is not None:
+            self.events.close()
+            self._log.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve Hangman sessions over a line protocol.')
+    parser.add_argument('--words', default=str(DEFAULT_WORDS_FILE), help='word file or compiled index')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'0 picks a free port (default: {DEFAULT_PORT})')
+    parser.add_argument('--log', metavar='FILE', help='append finished games to FILE (tab-separated)')
+    parser.add_argument('--seed', type=int, help='seed for word choice')
+    args = parser.parse_args(argv)
+
+    raise_fd_limit()
+    server = HangmanServer(WordIndex.from_file(args.words), log_path=args.log, seed=args.seed)
+
+    def ready(port):
+        print(f'[OK] Serving {len(server.index):,} words on {args.host}:{port}', flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Headless Hangman simulator: the solver plays random words from an index.
+
+    python hangman_sim.py                                   # 100k games, the game's word list
+    python hangman_sim.py --words /usr/share/dict/words --games 1000000 --workers 4
+    python hangman_sim.py --words /usr/share/dict/words --compile words.idx   # index once
+    python hangman_sim.py --words words.idx --games 1000000
+
+Reports games/sec, the win rate and guesses per game. Each worker process
+loads the index once and plays its share of the games with its own seed,
+so the run doubles as a CPU-bound load generator for the engine.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hangman_engine import DEFAULT_WORDS_FILE, HangmanRound, Solver, WordIndex
+
+DEFAULT_GAMES = 100_000
+
+
+def play_games(index, games, seed, length=None):
+    """Stats of `games` solver games on words drawn with random.Random(seed)."""
+    rng = random.Random(seed)
+    solver = Solver(index)
+    won = wrong = guesses = 0
+    for _ in range(games):
+        game = solver.play(HangmanRound(*index.random_entry(rng, length)))
+        won += game.won
+        wrong += game.wrong_guesses
+        guesses += len(game.guessed)
+    return {'games': games, 'won': won, 'wrong_guesses': wrong, 'guesses': guesses}
+
+
+def _worker(words, games, seed, length):
+    return play_games(WordIndex.from_file(words), games, seed, length)
+
+
+def simulate(words, games, workers=1, seed=0, length=None, index=None):
+    """Stats summed over workers; worker i plays its share of games with seed + i (index: words, loaded)."""
+    if workers == 1:
+        return play_games(index or WordIndex.from_file(words), games, seed, length)
+    shares = [games // workers + (i < games % workers) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_worker, [words] * workers, shares, range(seed, seed + workers),
+                                [length] * workers))
+    return {key: sum(result[key] for result in results) for key in results[0]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play Hangman games headless with the solver.')
+    parser.add_argument('--words', default=str(DEFAULT_WORDS_FILE),
+                        help='word file (WORD or WORD<TAB>hint per line) or an index written by --compile')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES)
+    parser.add_argument('--workers', type=int, default=1, help=f'processes (this machine has {os.cpu_count()})')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--length', type=int, help='only play words of this length')
+    parser.add_argument('--compile', metavar='FILE', help='write the compiled index to FILE and exit')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = WordIndex.from_file(args.words)
+    print(f'[INFO] {len(index):,} words in {len(index.lengths())} lengths, '
+          f'indexed in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+    if args.compile:
+        index.save(args.compile)
+        print(f'[OK] Compiled index written to {args.compile}', file=sys.stderr)
+        return
+    if args.length is not None and args.length not in index.words:
+        parser.error(f'no words of length {args.length}')
+
+    start = time.perf_counter()
+    stats = simulate(args.words, args.games, args.workers, args.seed, args.length, index)
+    secs = time.perf_counter() - start
+    games = stats['games']
+    print(f"games        {games:,}")
+    print(f"won          {stats['won'] / games:.2%}")
+    print(f"wrong/game   {stats['wrong_guesses'] / games:.2f}")
+    print(f"guesses/game {stats['guesses'] / games:.2f}")
+    print(f"seconds      {secs:.2f}")
+    print(f"games/s      {games / secs:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
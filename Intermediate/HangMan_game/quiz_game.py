@@ -1,8 +1,11 @@
 import tkinter as tk
 from tkinter import messagebox
+import argparse
 import random
 import sys
-import threading
+
+from hangman_engine import DEFAULT_WORDS_FILE, MAX_WRONG, HangmanRound, WordIndex
+from hangman_events import EventPool
 
 # Try to import winsound for Windows
 try:
@@ -11,8 +14,11 @@ try:
 except ImportError:
     SOUND_AVAILABLE = False
 
+# Beeps allowed to wait for the sound thread; more are dropped
+SOUND_BACKLOG = 4
+
 class HangmanGame:
-    def __init__(self, root):
+    def __init__(self, root, index=None):
         self.root = root
         self.root.title("Hangman Game")
         self.root.geometry("1000x700")
@@ -21,83 +27,37 @@ class HangmanGame:
         # Create gradient background effect
         self.root.configure(bg='#6B7FCC')
         
-        # Optimized word list - removed duplicate
-        self.word_list = [
-            ('RAINBOW', 'Colorful light display in sky during rain'),
-            ('PYTHON', 'A popular programming language'),
-            ('COMPUTER', 'Electronic device for processing data'),
-            ('KEYBOARD', 'Input device with keys'),
-            ('ELEPHANT', 'Largest land animal with trunk'),
-            ('MOUNTAIN', 'Large natural elevation of earth'),
-            ('OCEAN', 'Vast body of salt water'),
-            ('BUTTERFLY', 'Insect with colorful wings'),
-            ('GUITAR', 'String musical instrument'),
-            ('CAMERA', 'Device for taking photographs'),
-            ('LIBRARY', 'Place with many books'),
-            ('PIZZA', 'Italian dish with cheese and toppings'),
-            ('CASTLE', 'Large fortified building'),
-            ('ROCKET', 'Vehicle for space travel'),
-            ('DIAMOND', 'Precious gemstone'),
-            ('SANDWICH', 'Food made between two slices of bread'),
-            ('TELEPHONE', 'Device used for voice communication'),
-            ('BICYCLE', 'Two-wheeled vehicle powered by pedaling'),
-            ('CHOCOLATE', 'Sweet treat made from cocoa beans'),
-            ('UMBRELLA', 'Portable shelter from rain or sun'),
-            ('AIRPLANE', 'Flying vehicle with wings and engines'),
-            ('VOLCANO', 'Mountain that can erupt with lava'),
-            ('PENGUIN', 'Black and white bird that cannot fly'),
-            ('TREASURE', 'Valuable collection of precious items'),
-            ('TORNADO', 'Spinning column of air and debris'),
-            ('DINOSAUR', 'Extinct prehistoric reptile'),
-            ('SPACESHIP', 'Vehicle designed for space travel'),
-            ('WATERFALL', 'Water flowing over a cliff or rocks'),
-            ('LIGHTHOUSE', 'Tower with bright light to guide ships'),
-            ('SNOWFLAKE', 'Unique ice crystal that falls from sky'),
-            ('JELLYFISH', 'Transparent sea creature with tentacles'),
-            ('KANGAROO', 'Hopping marsupial from Australia'),
-            ('FIREWORKS', 'Explosive displays of colored lights'),
-            ('TELESCOPE', 'Instrument for viewing distant objects'),
-            ('CROCODILE', 'Large reptile with powerful jaws'),
-            ('HURRICANE', 'Powerful rotating storm system'),
-            ('MUSHROOM', 'Fungus that grows from the ground'),
-            ('PEACOCK', 'Colorful bird with magnificent tail feathers'),
-            ('SUBMARINE', 'Underwater vessel for ocean exploration'),
-            ('DRAGONFLY', 'Insect with four transparent wings'),
-            ('SUNFLOWER', 'Tall yellow flower that follows the sun'),
-            ('BASKETBALL', 'Sport played with orange ball and hoops'),
-            ('STRAWBERRY', 'Red berry with seeds on the outside'),
-            ('HELICOPTER', 'Aircraft with rotating blades overhead'),
-            ('PINEAPPLE', 'Tropical fruit with spiky exterior'),
-            ('WATERMELON', 'Large green fruit with red flesh inside'),
-            ('SAXOPHONE', 'Brass wind instrument with curved shape'),
-            ('CHAMELEON', 'Lizard that changes color for camouflage'),
-            ('BLIZZARD', 'Severe snowstorm with strong winds')
-        ]
-        
-        self.word = ''
-        self.hint = ''
-        self.guessed_letters = set()
-        self.wrong_guesses = 0
-        self.max_wrong = 6
+        # Words and hints come from a word file, indexed by length
+        self.index = index if index is not None else WordIndex.from_file(DEFAULT_WORDS_FILE)
+        self.round = None
+        self.max_wrong = MAX_WRONG
         self.game_active = True
         
-        # Pre-calculate hangman drawing coordinates
+        # Pre-calculate hangman drawing coordinates (the tag names each part's canvas item)
         self.hangman_parts = [
-            ('oval', 220, 120, 280, 180),  # Head
-            ('line', 250, 180, 250, 280),  # Body
-            ('line', 250, 210, 210, 250),  # Left arm
-            ('line', 250, 210, 290, 250),  # Right arm
-            ('line', 250, 280, 220, 340),  # Left leg
-            ('line', 250, 280, 280, 340),  # Right leg
+            ('oval', 220, 120, 280, 180, 'head'),
+            ('line', 250, 180, 250, 280, 'body'),
+            ('line', 250, 210, 210, 250, 'left_arm'),
+            ('line', 250, 210, 290, 250, 'right_arm'),
+            ('line', 250, 280, 220, 340, 'left_leg'),
+            ('line', 250, 280, 280, 340, 'right_leg'),
         ]
+        self.stage = 0
+        
+        # One thread plays the beeps in order, instead of a new thread per beep
+        self.sounds = EventPool(workers=1, backlog=SOUND_BACKLOG, name='sounds')
+        
+        # Widget options waiting for the next idle cycle: widget -> {option: value}
+        self._pending = {}
+        self._flush_scheduled = False
         
         self.setup_ui()
         self.new_game()
     
     def play_sound_async(self, sound_type):
-        """Play sound in a separate thread to avoid blocking UI"""
+        """Play sound on the sound worker to avoid blocking UI (dropped if too many are waiting)"""
         if SOUND_AVAILABLE and sys.platform == 'win32':
-            threading.Thread(target=self._play_sound, args=(sound_type,), daemon=True).start()
+            self.sounds.submit(self._play_sound, sound_type)
         else:
             self.root.bell()
     
@@ -135,6 +95,7 @@ class HangmanGame:
         self.canvas = tk.Canvas(left_frame, width=350, height=400, 
                                bg='white', highlightthickness=0)
         self.canvas.pack()
+        self.create_board()
         
         tk.Label(left_frame, text="HANGMAN GAME", 
                 font=('Arial', 18, 'bold'), bg='white', 
@@ -191,37 +152,57 @@ class HangmanGame:
         if not self.game_active:
             return
         
+        # Repeated letters are ignored by the engine
         letter = event.char.upper()
-        if letter in self.letter_buttons and self.letter_buttons[letter]['state'] == 'normal':
+        if letter in self.letter_buttons:
             self.guess_letter(letter)
     
-    def draw_hangman(self, stage):
-        """Optimized drawing - only update what changed"""
-        self.canvas.delete('all')
-        
+    def create_board(self):
+        """Create the gallows and every hangman part once; parts start hidden"""
         # Draw gallows - static parts
-        self.canvas.create_line(50, 380, 300, 380, width=4, fill='#2C3E50')
-        self.canvas.create_line(100, 380, 100, 80, width=4, fill='#2C3E50')
-        self.canvas.create_line(100, 80, 250, 80, width=4, fill='#2C3E50')
-        self.canvas.create_line(100, 120, 140, 80, width=3, fill='#2C3E50')
-        self.canvas.create_line(250, 80, 250, 120, width=3, fill='#2C3E50')
-        
-        # Draw hangman parts based on stage
-        for i in range(min(stage, len(self.hangman_parts))):
-            part = self.hangman_parts[i]
-            if part[0] == 'oval':
-                self.canvas.create_oval(part[1], part[2], part[3], part[4], 
-                                       width=3, outline='#2C3E50')
+        self.canvas.create_line(50, 380, 300, 380, width=4, fill='#2C3E50', tags='gallows')
+        self.canvas.create_line(100, 380, 100, 80, width=4, fill='#2C3E50', tags='gallows')
+        self.canvas.create_line(100, 80, 250, 80, width=4, fill='#2C3E50', tags='gallows')
+        self.canvas.create_line(100, 120, 140, 80, width=3, fill='#2C3E50', tags='gallows')
+        self.canvas.create_line(250, 80, 250, 120, width=3, fill='#2C3E50', tags='gallows')
+        
+        for kind, x1, y1, x2, y2, tag in self.hangman_parts:
+            if kind == 'oval':
+                self.canvas.create_oval(x1, y1, x2, y2, width=3, outline='#2C3E50',
+                                        state='hidden', tags=('part', tag))
             else:  # line
-                self.canvas.create_line(part[1], part[2], part[3], part[4], 
-                                       width=3, fill='#2C3E50')
+                self.canvas.create_line(x1, y1, x2, y2, width=3, fill='#2C3E50',
+                                        state='hidden', tags=('part', tag))
+        self.stage = 0
+    
+    def draw_hangman(self, stage):
+        """Show the first `stage` parts - only the parts whose visibility changed are touched"""
+        stage = min(stage, len(self.hangman_parts))
+        if stage == self.stage:
+            return
+        state = 'normal' if stage > self.stage else 'hidden'
+        for part in self.hangman_parts[min(stage, self.stage):max(stage, self.stage)]:
+            self.canvas.itemconfigure(part[-1], state=state)
+        self.stage = stage
+    
+    def set_options(self, widget, **options):
+        """Queue widget options; everything queued during one guess is applied in a single idle callback"""
+        self._pending.setdefault(widget, {}).update(options)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush)
+    
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        for widget, options in pending.items():
+            # Skip options that already have the queued value
+            changed = {name: value for name, value in options.items() if str(widget.cget(name)) != str(value)}
+            if changed:
+                widget.configure(**changed)
     
     def new_game(self):
-        word_data = random.choice(self.word_list)
-        self.word = word_data[0]
-        self.hint = word_data[1]
-        self.guessed_letters.clear()
-        self.wrong_guesses = 0
+        self.round = HangmanRound(*self.index.random_entry(random), max_wrong=self.max_wrong)
         self.game_active = True
         
         # Reset canvas
@@ -229,30 +210,33 @@ class HangmanGame:
         
         # Reset letter buttons efficiently
         for btn in self.letter_buttons.values():
-            btn.config(state='normal', bg='#6B7FCC')
+            self.set_options(btn, state='normal', bg='#6B7FCC')
         
         # Update displays
         self.update_word_display()
-        self.hint_label.config(text=f"Hint: {self.hint}")
-        self.counter_label.config(text=f"Incorrect: 0/{self.max_wrong}")
+        self.set_options(self.hint_label, text=f"Hint: {self.round.hint}" if self.round.hint else "")
+        self.set_options(self.counter_label, text=f"Incorrect: 0/{self.max_wrong}")
     
     def guess_letter(self, letter):
-        if not self.game_active or letter in self.guessed_letters:
+        if not self.game_active:
+            return
+        
+        # The engine applies the rules; None means the letter was already tried
+        positions = self.round.guess(letter)
+        if positions is None:
             return
         
         # Play click sound asynchronously
         self.play_sound_async('click')
         
-        self.guessed_letters.add(letter)
-        self.letter_buttons[letter].config(state='disabled', bg='#95A5D8')
+        self.set_options(self.letter_buttons[letter], state='disabled', bg='#95A5D8')
         
-        if letter not in self.word:
+        if not positions:
             self.play_sound_async('wrong')
-            self.wrong_guesses += 1
-            self.draw_hangman(self.wrong_guesses)
-            self.counter_label.config(text=f"Incorrect: {self.wrong_guesses}/{self.max_wrong}")
+            self.draw_hangman(self.round.wrong_guesses)
+            self.set_options(self.counter_label, text=f"Incorrect: {self.round.wrong_guesses}/{self.max_wrong}")
             
-            if self.wrong_guesses >= self.max_wrong:
+            if self.round.lost:
                 self.game_over(False)
                 return
         else:
@@ -260,22 +244,20 @@ class HangmanGame:
         
         self.update_word_display()
         
-        # Check if won - optimized check
-        if all(c in self.guessed_letters for c in self.word):
+        # Won once no letter of the word is hidden (tracked by the engine, no rescan)
+        if self.round.won:
             self.game_over(True)
     
     def update_word_display(self):
         """Optimized word display update"""
-        display = ' '.join(letter if letter in self.guessed_letters else '_' 
-                          for letter in self.word)
-        self.word_label.config(text=display)
+        self.set_options(self.word_label, text=self.round.masked())
     
     def game_over(self, won):
         self.game_active = False
         
         # Disable all buttons at once
         for btn in self.letter_buttons.values():
-            btn.config(state='disabled')
+            self.set_options(btn, state='disabled')
         
         if won:
             self.play_sound_async('win')
@@ -288,10 +270,10 @@ class HangmanGame:
         """Show game over dialog after sound completes"""
         if won:
             result = messagebox.askyesno("🎉 Congratulations!", 
-                              f"You won! The word was: {self.word}\n\nPlay again?")
+                              f"You won! The word was: {self.round.word}\n\nPlay again?")
         else:
             result = messagebox.askyesno("💀 Game Over", 
-                              f"You lost! The word was: {self.word}\n\nPlay again?")
+                              f"You lost! The word was: {self.round.word}\n\nPlay again?")
         
         if result:
             self.new_game()
@@ -299,6 +281,10 @@ class HangmanGame:
             self.root.quit()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Hangman.")
+    parser.add_argument("words", nargs="?", default=str(DEFAULT_WORDS_FILE),
+                        help="word file (WORD or WORD<TAB>hint per line) or a compiled index")
+    args = parser.parse_args()
     root = tk.Tk()
-    game = HangmanGame(root)
+    game = HangmanGame(root, WordIndex.from_file(args.words))
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Shared setup for the Hangman tests.
+
+Run from the HangMan_game folder (or the repository root):
+    python -m pytest -q Intermediate/HangMan_game/tests
+"""
+
+import sys
+from pathlib import Path
+
+# Make the game modules importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
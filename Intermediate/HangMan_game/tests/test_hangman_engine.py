@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+from hangman_engine import ALPHABET, DEFAULT_WORDS_FILE, HangmanRound, Solver, WordIndex
+
+WORDS = ['PYTHON', 'PISTON', 'BUTTON', 'COTTON', 'MITTEN', 'KITTEN', 'BANANA', 'CABANA', 'HANGMAN',
+         'LETTER', 'BETTER', 'SETTER', 'APPLE', 'AMPLE', 'MAPLE', 'CAT', 'COT', 'CUT']
+
+
+@pytest.fixture(scope='module')
+def index():
+    return WordIndex((word, f'hint for {word}') for word in WORDS)
+
+
+def brute_candidates(length, guesses):
+    """Words consistent with (letter, positions) guesses, by checking each word."""
+    def consistent(word):
+        return all(tuple(i for i, c in enumerate(word) if c == letter) == tuple(positions)
+                   for letter, positions in guesses)
+    return [word for word in WORDS if len(word) == length and consistent(word)]
+
+
+def test_index_skips_bad_and_duplicate_words():
+    index = WordIndex([('cat', 'first'), ('CAT', 'second'), ('café', ''), ('x-ray', ''), ('Dog', '')])
+    assert len(index) == 2
+    assert index.hints == {'CAT': 'first', 'DOG': ''}
+    assert index.lengths() == [3]
+
+
+@pytest.mark.parametrize('secret', WORDS)
+def test_narrow_equals_checking_every_word(index, secret):
+    length = len(secret)
+    mask = index.all_words(length)
+    guesses = []
+    for letter in 'ETAONBCMPS':
+        positions = tuple(i for i, c in enumerate(secret) if c == letter)
+        guesses.append((letter, positions))
+        mask = index.narrow(length, mask, letter, positions)
+        assert index.candidates(length, mask) == brute_candidates(length, guesses)
+    assert secret in index.candidates(length, mask)
+
+
+@pytest.mark.parametrize('length', [3, 5, 6, 7])
+def test_outcomes_partition_the_candidates(index, length):
+    mask = index.all_words(length)
+    words = index.candidates(length, mask)
+    counts = index.letter_counts(length, mask)
+    for letter in ALPHABET:
+        groups = {}
+        for word in words:
+            key = tuple(i for i, c in enumerate(word) if c == letter)
+            groups[key] = groups.get(key, 0) + 1
+        assert sorted(index.outcomes(length, mask, letter)) == sorted(groups.values())
+        assert counts.get(letter, 0) == sum(n for key, n in groups.items() if key)
+
+
+def test_round_rules():
+    game = HangmanRound('BANANA', max_wrong=2)
+    assert game.guess('a') == (1, 3, 5)
+    assert game.guess('A') is None                 # repeat
+    assert game.guess('Z') == ()
+    assert game.masked(sep='') == '_A_A_A'
+    assert game.guess('N') == (2, 4)
+    assert not game.over
+    assert game.guess('B') == (0,)
+    assert game.won and game.over and game.wrong_guesses == 1
+    assert game.guess('Q') is None                 # game over
+    with pytest.raises(ValueError):
+        HangmanRound('CAT').guess('1')
+
+
+def test_round_is_lost_after_max_wrong():
+    game = HangmanRound('CAT', max_wrong=2)
+    game.guess('X')
+    game.guess('Y')
+    assert game.lost and not game.won
+
+
+def test_solver_wins_every_game_on_the_bundled_words():
+    index = WordIndex.from_file(DEFAULT_WORDS_FILE)
+    solver = Solver(index)
+    for words in index.words.values():
+        for word in words:
+            game = solver.play(HangmanRound(word))
+            assert game.won, word
+            assert game.wrong_guesses < game.max_wrong
+
+
+def test_solver_guesses_are_memoized_per_position(index):
+    solver = Solver(index)
+    first = solver.play(HangmanRound('KITTEN'))
+    memo = dict(solver._memo)
+    second = solver.play(HangmanRound('KITTEN'))
+    assert first.guessed == second.guessed and solver._memo == memo
+
+
+def test_solver_prefers_the_most_informative_letter():
+    # Every word has A, so A tells nothing; B, C, D, E each single out one word.
+    index = WordIndex((word, '') for word in ['AB', 'AC', 'AD', 'AE'])
+    solver = Solver(index)
+    assert solver.best_letter(2, index.all_words(2), set()) != 'A'
+    # With one candidate left, a letter of that word is guessed.
+    mask = index.narrow(2, index.all_words(2), 'B', (1,))
+    assert solver.best_letter(2, mask, {'B'}) == 'A'
+
+
+def test_solver_plays_words_missing_from_its_index(index):
+    game = Solver(index).play(HangmanRound('ZEBRA', max_wrong=26))
+    assert game.won
+
+
+def test_compiled_index_round_trip(tmp_path, index):
+    path = tmp_path / 'words.idx'
+    index.save(path)
+    loaded = WordIndex.from_file(path)
+    assert loaded.words == index.words and loaded.hints == index.hints
+    mask = loaded.narrow(6, loaded.all_words(6), 'T', (2, 3))
+    assert loaded.candidates(6, mask) == brute_candidates(6, [('T', (2, 3))])
+    with pytest.raises(ValueError):
+        WordIndex.load(DEFAULT_WORDS_FILE)
+
+
+def test_random_entry_reaches_every_word(index):
+    rng = random.Random(3)
+    seen = {index.random_entry(rng)[0] for _ in range(2000)}
+    assert seen == set(WORDS)
+    assert {index.random_entry(rng, length=3)[0] for _ in range(200)} == {'CAT', 'COT', 'CUT'}
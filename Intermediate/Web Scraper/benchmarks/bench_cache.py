@@ -0,0 +1,81 @@
+"""
+HTTP cache: what repeat crawls of a slowly changing site cost.
+
+Usage:
+    python bench_cache.py                 # 10k-page site, 20 ms per response
+    python bench_cache.py 2000 50         # pages, latency in ms
+
+Crawls the local site five times at concurrency 16:
+    no cache     - every page downloaded and parsed
+    cold cache   - same, plus storing every page
+    revalidate   - the site moved to a new revision with CHURN percent of
+                   pages changed; cached pages are stale, so each one is a
+                   conditional GET (304 for unchanged pages)
+    fresh        - the server now sends max-age, so nothing is requested
+and reports requests sent, bytes received (gzip on the wire), hit rate,
+bytes saved (decoded bodies not downloaded) and parses skipped for each.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from common import free_port, parse_sizes, print_table, start_site, stop_site, timed
+from crawler import Crawler
+from http_cache import HTTPCache
+
+CONCURRENCY = 16
+CHURN = 10
+MAX_AGE = 3600
+
+
+def run_crawl(seed, cache):
+    crawler = Crawler(concurrency=CONCURRENCY, delay=0, cache=cache)
+    stats = asyncio.run(crawler.crawl(f'{seed}/page/0'))
+    if crawler.errors:
+        raise RuntimeError(f'crawl errors: {list(crawler.errors.items())[:3]}')
+    return stats
+
+
+def main():
+    pages, latency_ms = parse_sizes([10_000, 20])
+    pages = int(pages)
+    scenarios = [
+        ('no cache', dict(revision=0), False),
+        ('cold cache', dict(revision=0), True),
+        (f'revalidate ({CHURN}% changed)', dict(revision=1, churn=CHURN, max_age=MAX_AGE), True),
+        ('fresh (max-age)', dict(revision=1, churn=CHURN, max_age=MAX_AGE), True)
+    ]
+
+    # The cache is keyed by URL, so every restart of the site keeps one port.
+    port = free_port()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / 'http.sqlite'
+        for name, site_options, use_cache in scenarios:
+            proc, seed = start_site(pages, latency_ms / 1000, port=port, **site_options)
+            cache = HTTPCache(cache_path) if use_cache else None
+            try:
+                stats, secs = timed(run_crawl, seed, cache)
+            finally:
+                stop_site(proc)
+            if stats['fetched'] != pages:
+                raise RuntimeError(f"{name}: crawled {stats['fetched']} of {pages} pages")
+            c = cache.stats() if cache else {}
+            rows.append((name, f'{secs:.1f}', f"{pages / secs:,.0f}", f"{stats['requests']:,}",
+                         f"{stats['bytes_received'] / 2**20:,.1f}",
+                         f"{c['hit_rate']:.1%}" if cache else '-',
+                         f"{c['bytes_saved'] / 2**20:,.1f}" if cache else '-',
+                         f"{c['parses_skipped']:,}" if cache else '-'))
+            if cache:
+                disk = c['stored_bytes']
+                cache.close()
+
+    print(f'{pages:,}-page local site, {latency_ms:g} ms per response, concurrency {CONCURRENCY}; '
+          f'cache holds {disk / 2**20:,.1f} MiB compressed')
+    print_table(['crawl', 'seconds', 'pages/s', 'requests', 'MiB received', 'hit rate', 'MiB saved',
+                 'parses skipped'], rows)
+
+
+if __name__ == '__main__':
+    main()
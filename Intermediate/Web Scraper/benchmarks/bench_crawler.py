@@ -0,0 +1,88 @@
+"""
+Crawl throughput: asyncio crawler vs the sequential requests + BeautifulSoup loop.
+
+Usage:
+    python bench_crawler.py                 # 10k-page site, 20 ms per response
+    python bench_crawler.py 2000 50         # pages, latency in ms
+
+The sequential baseline is web_scraper.py's approach turned into a loop:
+requests.get (a new connection per page) and BeautifulSoup, following
+links breadth-first with the same normalization and robots rules. It and
+the one-worker crawler are run on the first SEQUENTIAL_PAGES pages only;
+the concurrent crawls fetch the whole site, and each run checks that
+every page was reached exactly once.
+"""
+
+import asyncio
+from collections import deque
+from urllib.robotparser import RobotFileParser
+
+import requests
+from bs4 import BeautifulSoup
+
+from common import parse_sizes, print_table, start_site, stop_site, timed
+from crawler import USER_AGENT, Crawler, normalize_url
+
+SEQUENTIAL_PAGES = 500
+CONCURRENCY = (1, 4, 16, 64)
+
+
+def sequential_crawl(seed, max_pages):
+    """BFS with one blocking requests.get per page; returns pages fetched."""
+    robots = RobotFileParser(f'{seed}/robots.txt')
+    robots.read()
+    host = seed.split('/')[2]
+    queue = deque([normalize_url(f'{seed}/page/0')])
+    seen = set(queue)
+    fetched = 0
+    while queue and fetched < max_pages:
+        url = queue.popleft()
+        if not robots.can_fetch(USER_AGENT, url):
+            continue
+        response = requests.get(url, headers={'User-Agent': USER_AGENT})
+        fetched += 1
+        soup = BeautifulSoup(response.text, 'html.parser')
+        for link in soup.find_all('a', href=True):
+            target = normalize_url(link['href'], url)
+            if target and target.split('/')[2] == host and target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return fetched
+
+
+def async_crawl(seed, concurrency, max_pages):
+    crawler = Crawler(concurrency=concurrency, delay=0, max_pages=max_pages)
+    stats = asyncio.run(crawler.crawl(f'{seed}/page/0'))
+    urls = [page.url for page in crawler.pages]
+    if len(urls) != len(set(urls)) or crawler.errors:
+        raise RuntimeError(f'duplicate fetches or errors: {list(crawler.errors.items())[:3]}')
+    return stats
+
+
+def main():
+    pages, latency_ms = parse_sizes([10_000, 20])
+    pages = int(pages)
+    proc, seed = start_site(pages, latency_ms / 1000)
+    rows = []
+    try:
+        fetched, secs = timed(sequential_crawl, seed, min(pages, SEQUENTIAL_PAGES))
+        baseline = fetched / secs
+        rows.append(('sequential requests + bs4', 1, f'{fetched:,}', fetched, f'{secs:.1f}', f'{baseline:,.1f}',
+                     '1.0x'))
+        for concurrency in CONCURRENCY:
+            limit = min(pages, SEQUENTIAL_PAGES) if concurrency == 1 else None
+            stats, secs = timed(async_crawl, seed, concurrency, limit)
+            if limit is None and stats['fetched'] != pages:
+                raise RuntimeError(f"crawled {stats['fetched']} of {pages} pages")
+            rate = stats['fetched'] / secs
+            rows.append(('asyncio crawler', concurrency, f"{stats['fetched']:,}", stats['connections'],
+                         f'{secs:.1f}', f'{rate:,.1f}', f'{rate / baseline:.1f}x'))
+    finally:
+        stop_site(proc)
+
+    print(f'{pages:,}-page local site, {latency_ms:g} ms per response')
+    print_table(['crawler', 'concurrency', 'pages', 'connections', 'seconds', 'pages/s', 'vs sequential'], rows)
+
+
+if __name__ == '__main__':
+    main()
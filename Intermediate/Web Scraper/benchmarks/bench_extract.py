@@ -0,0 +1,101 @@
+"""
+Extraction cost: BeautifulSoup tree vs the streaming parser on large pages.
+
+Usage:
+    python bench_extract.py                 # 1, 5 and 20 MB fixture pages
+    python bench_extract.py 2 50            # page sizes in MB
+
+Each fixture is a generated page with nested sections, inline markup,
+paragraphs and links. Every mode runs in a fresh process and reports CPU
+seconds and peak RSS above the process's footprint with the page already
+in memory:
+    bs4             body decoded to one str, BeautifulSoup tree, then title,
+                    links and paragraphs read from it (web_scraper.py's path)
+    stream          the same three fields, bytes fed in 64 KiB chunks
+    stream title    title only; parsing stops at </title>
+    stream 20 links title and the first 20 links, then stops
+The bs4 and stream results are checked to be identical.
+"""
+
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import print_table
+from extract import Extraction
+
+MODES = {
+    'bs4': dict(parser='bs4', paragraphs=True),
+    'stream': dict(parser='stream', paragraphs=True),
+    'stream title': dict(parser='stream', links=False),
+    'stream 20 links': dict(parser='stream', limit=20)
+}
+
+
+def make_fixture(path, megabytes):
+    """Write a page of about `megabytes` MB; returns its size in bytes."""
+    section = ''.join(
+        f'<p class="text">Over {k}: a <b>diving</b> stop at <i>point</i>, then a throw to the '
+        f'keeper&#39;s end &amp; a <a href="/matches/{k}">run out</a> review.</p>\n'
+        for k in range(20)
+    )
+    block = (f'<section class="match"><h2>Innings</h2><div class="summary"><ul>'
+             f'<li><a href="/players/1">Player</a></li><li>Catch</li></ul></div>\n{section}</section>\n')
+    repeats = max(1, int(megabytes * 2**20 / len(block)))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Fielding report</title></head>\n'
+                '<body><nav><a href="/">Home</a> <a href="/teams">Teams</a></nav>\n')
+        for _ in range(repeats):
+            f.write(block)
+        f.write('</body></html>\n')
+    return path.stat().st_size
+
+
+def _child(path, options, queue):
+    body = Path(path).read_bytes()
+    extraction = Extraction(**options)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu = time.process_time()
+    fields = extraction.from_bytes(body)
+    cpu = time.process_time() - cpu
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((fields, cpu, (peak - baseline) / 1024))
+
+
+def run_mode(path, options):
+    """(fields, CPU seconds, peak MB above baseline) from a fresh process."""
+    queue = mp.Queue()
+    proc = mp.Process(target=_child, args=(str(path), options, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1, 5, 20]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for megabytes in sizes:
+            path = Path(tmp) / f'page_{megabytes:g}mb.html'
+            size = make_fixture(path, megabytes)
+            results = {}
+            for name, options in MODES.items():
+                fields, cpu, peak = results[name] = run_mode(path, options)
+                rows.append((f'{size / 2**20:.1f}', name, f'{cpu:.2f}', f'{peak:,.0f}',
+                             f"{len(fields.get('links', [])):,}", f"{len(fields.get('paragraphs', [])):,}"))
+            if results['bs4'][0] != results['stream'][0]:
+                raise RuntimeError(f'{path.name}: bs4 and stream extraction differ')
+            bs4_cpu, bs4_peak = results['bs4'][1:]
+            stream_cpu, stream_peak = results['stream'][1:]
+            rows.append(('', 'stream vs bs4', f'{bs4_cpu / stream_cpu:.1f}x less',
+                         f'{bs4_peak / max(stream_peak, 1):.0f}x less', '', ''))
+
+    print_table(['page MB', 'mode', 'CPU s', 'peak MB', 'links', 'paragraphs'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Output pipeline throughput and memory: records/s per sink, bounded vs unbounded queueing.
+
+Usage:
+    python bench_pipeline.py                # 1M link records
+    python bench_pipeline.py 200000         # record count
+
+Records are LINK_FIELDS rows like a crawl produces: page-relative hrefs
+(about 10% of them repeats of an earlier link from the same page) that
+the pipeline resolves, normalizes and de-duplicates. Every run is in a
+fresh process and reports wall seconds, records/s, output size and peak
+RSS above the process's footprint before the run:
+
+    no sink         resolve + dedup only, the cost every sink shares
+    <sink>          add() from a synchronous loop, batches of 10k
+    async bounded   put() from a producer faster than the sink (SQLite),
+                    max_pending 50k: the producer waits for the writer
+    async unbounded the same with max_pending above the record count, as
+                    if batches were queued without limit
+"""
+
+import asyncio
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from common import parse_sizes, print_table
+from pipeline import RECORD_TYPES, Pipeline, open_sink
+
+LINKS_PER_PAGE = 20
+SINK_SUFFIXES = ('.ndjson', '.csv', '.sqlite', '.parquet')
+
+
+def make_records(count):
+    """count LINK_FIELDS records, LINKS_PER_PAGE per page, every tenth a repeat of the page's previous link."""
+    for n in range(count):
+        page, k = divmod(n, LINKS_PER_PAGE)
+        target = page * 7 + k - (k % 10 == 9)
+        yield {'source': f'https://example.com/section/{page % 50}/page/{page}',
+               'url': f'../../section/{target % 50}/page/{target}?ref=nav#top'}
+
+
+def sync_run(path, count):
+    sinks = [open_sink(path)] if path else []
+    pipeline = Pipeline(sinks, **RECORD_TYPES['links'])
+    for record in make_records(count):
+        pipeline.add(record)
+    pipeline.close()
+    return pipeline.stats()
+
+
+def async_run(path, count, max_pending):
+    async def produce():
+        pipeline = Pipeline([open_sink(path)], max_pending=max_pending, **RECORD_TYPES['links'])
+        for record in make_records(count):
+            await pipeline.put(record)
+        await pipeline.aclose()
+        return pipeline.stats()
+    return asyncio.run(produce())
+
+
+def _child(target, args, queue):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    stats = target(*args)
+    secs = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((stats, secs, (peak - baseline) / 1024))
+
+
+def isolated(target, *args):
+    """(stats, seconds, peak MB above baseline) of target(*args) in a fresh process."""
+    queue = mp.Queue()
+    proc = mp.Process(target=_child, args=(target, args, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    count = int(parse_sizes([1_000_000])[0])
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [('no sink', sync_run, None, ())]
+        runs += [(suffix.lstrip('.'), sync_run, Path(tmp) / f'sync{suffix}', ()) for suffix in SINK_SUFFIXES]
+        runs += [('async bounded', async_run, Path(tmp) / 'bounded.sqlite', (50_000,)),
+                 ('async unbounded', async_run, Path(tmp) / 'unbounded.sqlite', (count + 1,))]
+        for name, target, path, extra in runs:
+            stats, secs, peak = isolated(target, str(path) if path else None, count, *extra)
+            size = path.stat().st_size / 2**20 if path else 0
+            rows.append((name, f"{stats['written']:,}", f"{stats['duplicates']:,}", f'{secs:.1f}',
+                         f'{count / secs:,.0f}', f'{size:,.1f}' if path else '', f"{stats['max_queued']:,}",
+                         f'{peak:,.0f}'))
+
+    print(f'{count:,} link records')
+    print_table(['sink', 'written', 'duplicates', 'seconds', 'records/s', 'file MB', 'max queued', 'peak MB'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Shared helpers for the web scraper benchmarks.
+
+Each benchmark is a plain script run from this folder, e.g.:
+    python bench_crawler.py 10000 20
+"""
+
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# Make the scraper modules in the parent folder importable from here.
+sys.path.insert(0, str(HERE.parent))
+
+
+def start_site(pages, latency=0.0, **options):
+    """
+    Start local_site.py in a subprocess; returns (process, base URL).
+
+    options are passed as flags: start_site(100, max_age=60) -> --max-age 60.
+    """
+    flags = [str(part) for name, value in options.items() if value is not None
+             for part in (f"--{name.replace('_', '-')}", value)]
+    proc = subprocess.Popen(
+        [sys.executable, str(HERE / 'local_site.py'), '--pages', str(pages), '--latency', str(latency), *flags],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    line = proc.stdout.readline()
+    if not line.strip().isdigit():
+        proc.kill()
+        raise RuntimeError('local site did not start')
+    return proc, f'http://127.0.0.1:{int(line)}'
+
+
+def free_port():
+    """A currently unused localhost port (for restarting the site under the same URLs)."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def stop_site(proc):
+    proc.terminate()
+    proc.wait()
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def parse_sizes(default):
+    """Read numbers from argv, falling back to the given defaults."""
+    values = [float(arg) for arg in sys.argv[1:]]
+    return values + default[len(values):]
+
+
+def print_table(headers, rows):
+    """Print a fixed-width results table."""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = '  '.join(str(h).rjust(w) for h, w in zip(headers, widths))
+    print(line)
+    print('-' * len(line))
+    for r in rows:
+        print('  '.join(str(v).rjust(w) for v, w in zip(r, widths)))
@@ -0,0 +1,186 @@
+"""
+Stand-in website for crawler tests and benchmarks (asyncio, standard library only).
+
+Serves a generated site of N linked pages on localhost:
+
+    /page/<i>      HTML with a title, a few paragraphs and links to other
+                   pages, written the ways real sites write them (absolute,
+                   root-relative, ../ relative, with fragments, upper-case
+                   host, off-site, mailto:)
+    /private/<i>   disallowed by robots.txt
+    /robots.txt
+
+Every page is reachable from /page/0. Each response is delayed by
+`latency` seconds to stand in for the network round trip; responses are
+gzip-compressed when the client accepts it, and connections are kept
+alive.
+
+Pages carry an ETag and Last-Modified and answer conditional requests
+with 304; `max_age` adds Cache-Control: max-age. `revision` and `churn`
+model a site that changes between crawls: the first `churn` percent of
+every hundred pages have content (and validators) that depend on the
+revision, the rest never change.
+
+    python local_site.py --pages 10000 --latency 0.02     # prints the port
+"""
+
+import argparse
+import asyncio
+import gzip
+import sys
+from email.utils import formatdate, parsedate_to_datetime
+
+ROBOTS_TXT = b'User-agent: *\nDisallow: /private/\n'
+
+REASONS = {200: 'OK', 304: 'Not Modified', 404: 'Not Found'}
+
+# Last-Modified of pages at revision 0; revision r is r days later.
+EPOCH = 1_700_000_000
+
+WORDS = ('fielding catch throw boundary wicket over stumping bowler innings crease run '
+         'pitch yorker spinner keeper captain').split()
+
+
+def page_links(i, pages):
+    """Targets page i links to; i + 1 keeps every page reachable from page 0."""
+    return [(i + 1) % pages, (2 * i + 1) % pages, (7 * i + 3) % pages, (i * i + 5) % pages]
+
+
+def render_page(i, pages, host, paragraphs=5, revision=0):
+    """HTML for /page/<i>."""
+    nxt, double, seventh, square = page_links(i, pages)
+    text = ' '.join(WORDS[(i + k) % len(WORDS)] for k in range(60))
+    body = '\n'.join(f'<p>{text} ({i}.{k}.{revision})</p>' for k in range(paragraphs))
+    links = [
+        f'<a href="http://{host.upper()}/page/{nxt}">next</a>',
+        f'<a href="/page/{double}#top">double</a>',
+        f'<a href="../page/./{seventh}">seventh</a>',
+        f'<a href="page/../../page/{square}?">square</a>',
+        f'<a href="/page/{i}">self</a>',
+        f'<a href="/private/{i}">private</a>',
+        '<a href="https://example.org/">elsewhere</a>',
+        '<a href="mailto:team@example.com">mail</a>',
+        '<a>no href</a>'
+    ]
+    return (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Page {i}</title></head>\n'
+            f'<body><h1>Page {i}</h1>\n{body}\n<nav>{" ".join(links)}</nav></body></html>\n').encode()
+
+
+class LocalSite:
+    """Request handler for the generated site."""
+
+    def __init__(self, pages=10_000, latency=0.0, paragraphs=5, max_age=None, revision=0, churn=0):
+        self.pages = pages
+        self.latency = latency
+        self.paragraphs = paragraphs
+        self.max_age = max_age
+        self.revision = revision
+        self.churn = churn
+        self.requests = 0
+        self.not_modified = 0
+        self.body_bytes = 0
+
+    def page_revision(self, i):
+        """Revision page i was last changed in."""
+        return self.revision if i % 100 < self.churn else 0
+
+    def respond(self, path, host, headers):
+        """(status, extra headers, body) for a path."""
+        if path == '/robots.txt':
+            return 200, {'Content-Type': 'text/plain'}, ROBOTS_TXT
+        prefix, _, number = path.rpartition('/')
+        if not (prefix in ('/page', '/private') and number.isdigit() and int(number) < self.pages):
+            return 404, {'Content-Type': 'text/plain'}, b'not found\n'
+
+        i = int(number)
+        revision = self.page_revision(i)
+        modified = EPOCH + revision * 86_400
+        validators = {'ETag': f'"{i}-{revision}"', 'Last-Modified': formatdate(modified, usegmt=True)}
+        if self.max_age is not None:
+            validators['Cache-Control'] = f'max-age={self.max_age}'
+        if 'if-none-match' in headers:
+            unchanged = validators['ETag'] in headers['if-none-match']
+        elif 'if-modified-since' in headers:
+            try:
+                unchanged = parsedate_to_datetime(headers['if-modified-since']).timestamp() >= modified
+            except (TypeError, ValueError):
+                unchanged = False
+        else:
+            unchanged = False
+        if unchanged:
+            return 304, validators, b''
+        return 200, {'Content-Type': 'text/html; charset=utf-8', **validators}, render_page(
+            i, self.pages, host, self.paragraphs, revision)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, version = lines[0].split(' ', 2)
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, extra, body = self.respond(target.split('?', 1)[0], headers.get('host', ''), headers)
+                if body and 'gzip' in headers.get('accept-encoding', ''):
+                    body = gzip.compress(body, compresslevel=1)
+                    extra['Content-Encoding'] = 'gzip'
+                self.not_modified += status == 304
+                self.body_bytes += len(body)
+                head = (f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                        + ''.join(f'{name}: {value}\r\n' for name, value in extra.items())
+                        + f'Content-Length: {len(body)}\r\n'
+                        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n')
+                writer.write(head.encode() + (body if method != 'HEAD' else b''))
+                await writer.drain()
+                self.requests += 1
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=0, ready=None):
+        """Run until cancelled; ready(port) is called once listening."""
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        async with server:
+            if ready:
+                ready(server.sockets[0].getsockname()[1])
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a generated site for crawler tests.')
+    parser.add_argument('--pages', type=int, default=10_000)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--paragraphs', type=int, default=5)
+    parser.add_argument('--max-age', type=int, help='send Cache-Control: max-age with pages')
+    parser.add_argument('--revision', type=int, default=0, help='site revision (changes churned pages)')
+    parser.add_argument('--churn', type=int, default=0, help='percent of pages that change between revisions')
+    parser.add_argument('--port', type=int, default=0, help='0 picks a free port')
+    args = parser.parse_args()
+
+    def ready(port):
+        print(port, flush=True)
+
+    site = LocalSite(args.pages, args.latency, args.paragraphs, args.max_age, args.revision, args.churn)
+    try:
+        asyncio.run(site.serve(port=args.port, ready=ready))
+    except KeyboardInterrupt:
+        pass
+    print(f'served {site.requests} requests ({site.not_modified} not modified, {site.body_bytes:,} body bytes)',
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
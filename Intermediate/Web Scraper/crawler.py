@@ -0,0 +1,560 @@
+"""
+Concurrent site crawler on asyncio (standard library plus BeautifulSoup).
+
+Starting from seed URLs, pages are fetched, their <a href> links
+extracted and followed breadth-first:
+
+  * at most `concurrency` requests are in flight (worker tasks sharing
+    one queue),
+  * requests to one host are spaced `delay` seconds apart (a longer
+    robots.txt Crawl-delay wins),
+  * robots.txt is fetched once per host and obeyed for `user_agent`,
+  * links are normalized (scheme/host case, default port, dot segments,
+    percent-escapes, fragment dropped) and a visited set makes sure each
+    page is fetched once,
+  * with same_host, only links on the seeds' hosts are followed, plus any
+    host a seed redirects to (example.com -> www.example.com),
+  * keep-alive connections are pooled per host and reused, so a crawl of
+    one site opens about `concurrency` sockets in total.
+
+    crawler = Crawler(concurrency=16, delay=0.25, max_pages=500)
+    stats = asyncio.run(crawler.crawl(['https://shadowfox.in']))
+    for page in crawler.pages:
+        print(page.status, page.url, page.title)
+
+    python web_scraper.py https://shadowfox.in --crawl --max-pages 500
+"""
+
+import asyncio
+import re
+import ssl
+import time
+import zlib
+from dataclasses import dataclass, field
+from urllib.parse import quote, urljoin, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+USER_AGENT = 'ShadowFoxScraper/1.0'
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DELAY = 0.25
+DEFAULT_TIMEOUT = 30.0
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 32 * 2**20
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_ROBOTS_REDIRECTS = 5
+
+_ESCAPE = re.compile(r'%([0-9A-Fa-f]{2})')
+_UNRESERVED = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~')
+_PATH_SAFE = "/%:@!$&'()*+,;=~"
+_QUERY_SAFE = _PATH_SAFE + '?'
+
+
+class FetchError(Exception):
+    """A request failed before a complete response arrived."""
+
+
+def _normalize_escapes(text, safe):
+    """Upper-case percent-escapes, decode escaped unreserved characters, escape the unsafe ones."""
+    def replace(match):
+        char = chr(int(match.group(1), 16))
+        return char if char in _UNRESERVED else '%' + match.group(1).upper()
+    return quote(_ESCAPE.sub(replace, text), safe=safe)
+
+
+def _remove_dot_segments(path):
+    """RFC 3986 dot-segment removal: '/a/./b/../c' -> '/a/c'."""
+    segments = path.split('/')
+    output = []
+    for segment in segments:
+        if segment == '..':
+            if len(output) > 1:
+                output.pop()
+        elif segment != '.':
+            output.append(segment)
+    if segments[-1] in ('.', '..'):
+        output.append('')
+    return '/'.join(output)
+
+
+def normalize_url(url, base=None):
+    """
+    Canonical absolute form of url (resolved against base), or None for
+    links that cannot be crawled (mailto:, javascript:, malformed hosts).
+    """
+    url = url.strip()
+    if base is not None:
+        url = urljoin(base, url)
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = parts.hostname
+    if scheme not in DEFAULT_PORTS or not host:
+        return None
+    if ':' in host:
+        host = f'[{host}]'
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f'{host}:{port}'
+    path = _normalize_escapes(_remove_dot_segments(parts.path), _PATH_SAFE) or '/'
+    query = _normalize_escapes(parts.query, _QUERY_SAFE)
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def origin_of(url):
+    """scheme://host[:port] of a normalized URL."""
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+class Response:
+    """
+    A complete HTTP response; headers are lower-cased, body is decoded from
+    gzip/deflate and transfer_size is the body's size on the wire.
+    """
+
+    __slots__ = ('url', 'status', 'headers', 'body', 'transfer_size')
+
+    def __init__(self, url, status, headers, body, transfer_size=None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.transfer_size = len(body) if transfer_size is None else transfer_size
+
+    @property
+    def content_type(self):
+        return self.headers.get('content-type', '').split(';', 1)[0].strip().lower()
+
+    @property
+    def encoding(self):
+        match = re.search(r'charset=["\']?([\w.:-]+)', self.headers.get('content-type', ''), re.I)
+        return match.group(1) if match else 'utf-8'
+
+    @property
+    def text(self):
+        try:
+            return self.body.decode(self.encoding, errors='replace')
+        except LookupError:
+            return self.body.decode('utf-8', errors='replace')
+
+
+def _decode_body(body, encoding):
+    """Undo gzip/deflate content coding, refusing to inflate past MAX_BODY_BYTES."""
+    if encoding in ('gzip', 'x-gzip'):
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif encoding == 'deflate':
+        # Servers send either zlib-wrapped or raw deflate under this name.
+        inflater = zlib.decompressobj(zlib.MAX_WBITS if body[:1] == b'\x78' else -zlib.MAX_WBITS)
+    else:
+        return body
+    try:
+        data = inflater.decompress(body, MAX_BODY_BYTES)
+    except zlib.error as e:
+        raise FetchError(f'bad {encoding} body: {e}')
+    if inflater.unconsumed_tail:
+        raise FetchError(f'decoded body exceeds {MAX_BODY_BYTES} bytes')
+    return data
+
+
+class HTTPClient:
+    """
+    Minimal HTTP/1.1 GET client keeping idle keep-alive connections per
+    (scheme, host, port) for reuse.
+    """
+
+    def __init__(self, user_agent=USER_AGENT, timeout=DEFAULT_TIMEOUT):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self._idle = {}
+        self._ssl = None
+        self.requests = 0
+        self.connections = 0
+        self.bytes_received = 0
+
+    async def _connect(self, key):
+        """An idle pooled connection for key if one is still open, else a new one."""
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+        scheme, host, port = key
+        if scheme == 'https' and self._ssl is None:
+            self._ssl = ssl.create_default_context()
+        conn = await asyncio.open_connection(host, port, ssl=self._ssl if scheme == 'https' else None,
+                                             limit=MAX_HEADER_BYTES)
+        self.connections += 1
+        return conn, False
+
+    async def get(self, url, headers=None):
+        """GET url (redirects are returned, not followed); raises FetchError on transport failures."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            raise FetchError(f'cannot fetch {url!r}')
+        port = parts.port or DEFAULT_PORTS[scheme]
+        key = (scheme, parts.hostname, port)
+        host = parts.hostname if port == DEFAULT_PORTS[scheme] else f'{parts.hostname}:{port}'
+        target = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        lines = [f'GET {target} HTTP/1.1', f'Host: {host}', f'User-Agent: {self.user_agent}',
+                 'Accept: text/html,application/xhtml+xml,*/*;q=0.8', 'Accept-Encoding: gzip, deflate',
+                 'Connection: keep-alive']
+        lines.extend(f'{name}: {value}' for name, value in (headers or {}).items())
+        request = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+        while True:
+            try:
+                conn, reused = await asyncio.wait_for(self._connect(key), self.timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise FetchError(f'{url}: cannot connect ({type(e).__name__}: {e})')
+            try:
+                response, reusable = await asyncio.wait_for(self._exchange(conn, request, url), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                conn[1].close()
+                if reused:
+                    continue          # the server closed an idle connection; retry on a fresh one
+                raise FetchError(f'{url}: connection lost ({type(e).__name__})')
+            except asyncio.TimeoutError:
+                conn[1].close()
+                raise FetchError(f'{url}: timed out after {self.timeout}s')
+            except BaseException:
+                conn[1].close()
+                raise
+            if reusable:
+                self._idle.setdefault(key, []).append(conn)
+            else:
+                conn[1].close()
+            self.requests += 1
+            return response
+
+    async def _exchange(self, conn, request, url):
+        """Send one request and read its response; returns (response, connection reusable)."""
+        reader, writer = conn
+        writer.write(request)
+        await writer.drain()
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise FetchError(f'{url}: response headers exceed {MAX_HEADER_BYTES} bytes')
+        status_line, *lines = head.decode('latin-1').split('\r\n')
+        try:
+            version, status = status_line.split(' ', 2)[:2]
+            status = int(status)
+        except ValueError:
+            raise FetchError(f'{url}: malformed status line {status_line!r}')
+        headers = {}
+        for line in lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                name, value = name.strip().lower(), value.strip()
+                headers[name] = f'{headers[name]}, {value}' if name in headers else value
+
+        connection = headers.get('connection', '').lower()
+        reusable = 'close' not in connection if version == 'HTTP/1.1' else 'keep-alive' in connection
+        if status in (204, 304) or 100 <= status < 200:
+            body = b''
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            body = await self._read_chunked(reader, url)
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+            if length > MAX_BODY_BYTES:
+                raise FetchError(f'{url}: body of {length} bytes exceeds {MAX_BODY_BYTES}')
+            body = await reader.readexactly(length)
+        else:
+            body = await self._read_to_eof(reader, url)
+            reusable = False
+        self.bytes_received += len(head) + len(body)
+        transfer_size = len(body)
+        body = _decode_body(body, headers.get('content-encoding', '').strip().lower())
+        return Response(url, status, headers, body, transfer_size), reusable
+
+    @staticmethod
+    async def _read_chunked(reader, url):
+        chunks = []
+        size = 0
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            length = int(line.split(b';', 1)[0], 16)
+            if length == 0:
+                break
+            size += length
+            if size > MAX_BODY_BYTES:
+                raise FetchError(f'{url}: body exceeds {MAX_BODY_BYTES} bytes')
+            chunks.append(await reader.readexactly(length))
+            await reader.readexactly(2)
+        while await reader.readuntil(b'\r\n') != b'\r\n':
+            pass                      # trailers
+        return b''.join(chunks)
+
+    @staticmethod
+    async def _read_to_eof(reader, url):
+        chunks = []
+        size = 0
+        while chunk := await reader.read(2**16):
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise FetchError(f'{url}: body exceeds {MAX_BODY_BYTES} bytes')
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    async def close(self):
+        """Close every pooled connection."""
+        writers = [writer for idle in self._idle.values() for _, writer in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
+
+class RobotsCache:
+    """robots.txt rules per origin, fetched once (concurrent first lookups share one fetch)."""
+
+    def __init__(self, client, user_agent=USER_AGENT):
+        self.client = client
+        self.user_agent = user_agent
+        self._rules = {}
+
+    def rules(self, origin):
+        task = self._rules.get(origin)
+        if task is None:
+            task = self._rules[origin] = asyncio.ensure_future(self._fetch(origin))
+        return task
+
+    async def _fetch(self, origin):
+        """Parse origin's robots.txt following RFC 9309: 4xx allows all, 5xx or unreachable disallows all."""
+        parser = RobotFileParser(f'{origin}/robots.txt')
+        url = parser.url
+        try:
+            for _ in range(MAX_ROBOTS_REDIRECTS + 1):
+                response = await self.client.get(url)
+                location = response.headers.get('location')
+                if response.status not in REDIRECT_STATUSES or not location:
+                    break
+                url = normalize_url(location, url)
+                if url is None:
+                    break
+        except FetchError:
+            parser.disallow_all = True
+            return parser
+        if response.status == 200:
+            parser.parse(response.text.splitlines())
+            parser.modified()
+        elif 400 <= response.status < 500:
+            parser.allow_all = True
+        else:
+            parser.disallow_all = True
+        return parser
+
+    async def allowed(self, url):
+        return (await self.rules(origin_of(url))).can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, origin):
+        return (await self.rules(origin)).crawl_delay(self.user_agent)
+
+
+class HostThrottle:
+    """Spaces request start times per host by at least a given delay."""
+
+    def __init__(self):
+        self._next = {}
+
+    async def wait(self, host, delay):
+        if not delay:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next.get(host, now))
+        self._next[host] = slot + delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def parse_html(response):
+    """(title, hrefs) of an HTML response, parsed with BeautifulSoup as web_scraper.py does."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(response.text, 'html.parser')
+    title = soup.title.get_text(strip=True) if soup.title else None
+    return title, [a['href'] for a in soup.find_all('a', href=True)]
+
+
+def parser_name(parse):
+    """
+    Name under which a cache stores parse's results: its `key` if it has one
+    (extract.Extraction), else its module-qualified name.
+    """
+    return getattr(parse, 'key', None) or f'{parse.__module__}.{parse.__qualname__}'
+
+
+@dataclass
+class Page:
+    """One fetched URL; links are normalized, absolute and de-duplicated."""
+
+    url: str
+    status: int
+    depth: int
+    title: str = None
+    links: list = field(default_factory=list)
+    bytes: int = 0
+
+
+class Crawler:
+    """
+    Breadth-first crawler; see the module docstring.
+
+    extract(response) -> (title, hrefs) parses HTML pages (parse_html by
+    default). on_page(page), if given, receives every page instead of it
+    being kept in self.pages; it may be a coroutine function, in which case
+    the crawl waits for it (a slow consumer slows the crawl down). With an
+    http_cache.HTTPCache, fresh pages are not requested, others are
+    revalidated, and unchanged pages reuse their stored extraction.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, delay=DEFAULT_DELAY, max_pages=None, max_depth=None,
+                 same_host=True, obey_robots=True, user_agent=USER_AGENT, timeout=DEFAULT_TIMEOUT,
+                 extract=parse_html, on_page=None, cache=None):
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        self.concurrency = concurrency
+        self.delay = delay
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.same_host = same_host
+        self.obey_robots = obey_robots
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.extract = extract
+        self.on_page = on_page
+        self.cache = cache
+        self.pages = []
+        self.errors = {}
+        self.seen = set()
+        self.hosts = set()
+        self.fetched = 0
+        self.robots_blocked = 0
+        self.elapsed = 0.0
+        self.client = None
+
+    def _enqueue(self, url, depth):
+        if url is None or url in self.seen:
+            return
+        if self.max_depth is not None and depth > self.max_depth:
+            return
+        if self.same_host and urlsplit(url).netloc not in self.hosts:
+            return
+        self.seen.add(url)
+        self._queue.put_nowait((url, depth))
+
+    async def crawl(self, seeds):
+        """Crawl from seed URLs until no links are left (or max_pages); returns stats()."""
+        if isinstance(seeds, str):
+            seeds = [seeds]
+        seeds = [url for url in (normalize_url(seed) for seed in seeds) if url]
+        if not seeds:
+            raise ValueError('no crawlable seed URL')
+        self.client = HTTPClient(self.user_agent, self.timeout)
+        self._robots = RobotsCache(self.client, self.user_agent) if self.obey_robots else None
+        self._throttle = HostThrottle()
+        self._queue = asyncio.Queue()
+        self.hosts.update(urlsplit(url).netloc for url in seeds)
+        for url in seeds:
+            self._enqueue(url, 0)
+
+        start = time.perf_counter()
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            await self._queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.client.close()
+            self.elapsed = time.perf_counter() - start
+        return self.stats()
+
+    def _budget_left(self):
+        return self.max_pages is None or self.fetched < self.max_pages
+
+    async def _worker(self):
+        while True:
+            url, depth = await self._queue.get()
+            try:
+                if self._budget_left():
+                    await self._visit(url, depth)
+            except Exception as e:
+                # One bad page (network error, unparsable HTML) must not stop the crawl.
+                self.errors[url] = f'{type(e).__name__}: {e}'
+            finally:
+                self._queue.task_done()
+
+    async def _visit(self, url, depth):
+        origin = origin_of(url)
+        delay = self.delay
+        if self._robots is not None:
+            if not await self._robots.allowed(url):
+                self.robots_blocked += 1
+                return
+            delay = max(delay, await self._robots.crawl_delay(origin) or 0)
+        if not self._budget_left():
+            return
+        self.fetched += 1
+        cache = self.cache
+        entry = cache.lookup(url) if cache is not None else None
+        if entry is None or not entry.fresh:
+            await self._throttle.wait(origin, delay)
+            response = await self.client.get(url, headers=cache.validators(entry) if cache is not None else None)
+            if cache is not None:
+                entry = cache.update(url, entry, response)
+        if entry is not None:
+            # The cached entry stands in for the response; its body is only inflated if it must be parsed.
+            response = entry
+
+        page = Page(url, response.status, depth, bytes=entry.size if entry is not None else len(response.body))
+        location = response.headers.get('location')
+        if response.status in REDIRECT_STATUSES and location:
+            page.links = [target] if (target := normalize_url(location, url)) else []
+            if target and depth == 0:
+                # A seed moved (apex -> www, http -> https host): the site now lives on the target's host.
+                self.hosts.add(urlsplit(target).netloc)
+            self._enqueue(target, depth)
+        elif response.status == 200 and response.content_type in ('text/html', 'application/xhtml+xml'):
+            if entry is not None:
+                title, hrefs = cache.parsed(entry, parser_name(self.extract), self.extract)
+            else:
+                title, hrefs = self.extract(response)
+            page.title = title
+            page.links = list(dict.fromkeys(link for link in (normalize_url(href, url) for href in hrefs) if link))
+            for link in page.links:
+                self._enqueue(link, depth + 1)
+
+        if self.on_page is None:
+            self.pages.append(page)
+        else:
+            result = self.on_page(page)
+            if asyncio.iscoroutine(result):
+                await result
+
+    def stats(self):
+        client = self.client
+        return {
+            'fetched': self.fetched,
+            'errors': len(self.errors),
+            'robots_blocked': self.robots_blocked,
+            'discovered': len(self.seen),
+            'requests': client.requests if client else 0,
+            'connections': client.connections if client else 0,
+            'bytes_received': client.bytes_received if client else 0,
+            'elapsed_s': round(self.elapsed, 3),
+            'pages_per_s': round(self.fetched / self.elapsed, 1) if self.elapsed else 0.0
+        }
+
+
+def crawl(seeds, **options):
+    """Blocking convenience wrapper: (pages, stats)."""
+    crawler = Crawler(**options)
+    stats = asyncio.run(crawler.crawl(seeds))
+    return crawler.pages, stats
@@ -0,0 +1,328 @@
+"""
+Streaming field extraction for the scraper (standard library html.parser).
+
+BeautifulSoup needs the whole body decoded into one str and then builds a
+tree of every element before anything can be read from it. Here the body
+is fed to an html.parser.HTMLParser subclass chunk by chunk, through an
+incremental decoder, and only the requested fields are kept:
+
+    title       text of the first <title>
+    links       href of every <a href>
+    paragraphs  text of every <p>
+    selectors   text (or attribute, with ::attr(name)) of elements matching
+                simple CSS selectors: tag, .class, #id, [attr], [attr=value]
+                and combinations such as a.nav[href] or div#main
+
+With `limit`, list fields keep at most that many items, and once every
+requested field is complete (the title closed, each list full) parsing
+stops, so `title` alone reads only the <head> of a multi-megabyte page.
+
+    extraction = Extraction(title=True, links=True, paragraphs=True, selectors=['h2', 'img::attr(src)'])
+    fields = extraction.from_chunks(response.iter_content(2**16), encoding)
+    fields['title'], fields['links'], fields['selectors']['h2']
+
+Extraction(parser='bs4', ...) returns the same fields through BeautifulSoup.
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+
+CHUNK_BYTES = 64 * 1024
+
+# Elements that never have an end tag.
+VOID_ELEMENTS = frozenset('area base br col embed hr img input link meta param source track wbr'.split())
+
+# Start tags that implicitly close an open <p>.
+CLOSES_P = frozenset(('address article aside blockquote details div dl fieldset figcaption figure footer form '
+                      'h1 h2 h3 h4 h5 h6 header hgroup hr main menu nav ol p pre section table ul').split())
+
+PARSERS = ('stream', 'bs4')
+
+_SELECTOR = re.compile(r'(?P<tag>[A-Za-z][\w-]*|\*)?(?P<parts>(?:[.#][\w-]+|\[[^\]]+\])*)'
+                       r'(?:::attr\((?P<attr>[\w:-]+)\))?')
+_PART = re.compile(r'([.#])([\w-]+)|\[\s*([\w:-]+)\s*(?:=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]*))\s*)?\]')
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+
+def clean_text(text):
+    """Text with runs of whitespace collapsed to single spaces."""
+    return ' '.join(text.split())
+
+
+class Selector:
+    """
+    One compound CSS selector (no combinators), optionally ending in
+    ::attr(name) to take an attribute instead of the element's text.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        match = _SELECTOR.fullmatch(text.strip())
+        if match is None or not (match.group('tag') or match.group('parts')):
+            raise ValueError(f"unsupported selector {text!r}: use tag, .class, #id, [attr], [attr=value] "
+                             f"combined without spaces, optionally followed by ::attr(name)")
+        tag = match.group('tag')
+        self.tag = tag.lower() if tag and tag != '*' else None
+        self.attr = match.group('attr').lower() if match.group('attr') else None
+        self.classes = []
+        self.conditions = []
+        for dot_or_hash, name, attr, *values in _PART.findall(match.group('parts')):
+            if dot_or_hash == '.':
+                self.classes.append(name)
+            elif dot_or_hash == '#':
+                self.conditions.append(('id', name))
+            else:
+                value = next((v for v in values if v), None)
+                self.conditions.append((attr.lower(), value))
+        # ::attr() takes the attribute from the element itself, BeautifulSoup's select() does not know it.
+        self.css = text.strip().split('::', 1)[0]
+
+    def matches(self, tag, attrs):
+        """attrs: dict of the element's attributes."""
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.classes:
+            classes = (attrs.get('class') or '').split()
+            if not all(name in classes for name in self.classes):
+                return False
+        for name, value in self.conditions:
+            if name not in attrs or (value is not None and attrs[name] != value):
+                return False
+        return True
+
+
+class StreamExtractor(HTMLParser):
+    """
+    Incremental parser collecting the requested fields; feed() text as it
+    arrives and read .fields. .done turns true once every field is complete.
+    """
+
+    def __init__(self, title=True, links=True, paragraphs=False, selectors=(), limit=None):
+        super().__init__(convert_charrefs=True)
+        self.want_title = title
+        self.want_links = links
+        self.want_paragraphs = paragraphs
+        self.selectors = [s if isinstance(s, Selector) else Selector(s) for s in selectors]
+        self.limit = limit
+        self.fields = {}
+        if title:
+            self.fields['title'] = None
+        if links:
+            self.fields['links'] = []
+        if paragraphs:
+            self.fields['paragraphs'] = []
+        if self.selectors:
+            self.fields['selectors'] = {s.text: [] for s in self.selectors}
+        self.done = False
+        # Open elements: [tag, captures started by this element]. A capture
+        # is [output list (or 'title'), slot index, text pieces]; its slot is
+        # reserved at the start tag so items stay in document order.
+        self._stack = []
+        self._active = []
+
+    def _full(self, items):
+        return self.limit is not None and len(items) >= self.limit
+
+    @staticmethod
+    def _reserve(items):
+        items.append(None)
+        return [items, len(items) - 1, []]
+
+    def _check_done(self):
+        fields = self.fields
+        if self._active or (self.want_title and fields['title'] is None):
+            return
+        if self.want_links and not self._full(fields['links']):
+            return
+        if self.want_paragraphs and not self._full(fields['paragraphs']):
+            return
+        if self.selectors and not all(self._full(items) for items in fields['selectors'].values()):
+            return
+        self.done = True
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'p' or tag in CLOSES_P:
+            for i in range(len(self._stack) - 1, -1, -1):
+                if self._stack[i][0] == 'p':
+                    self._close(i)
+                    break
+        attrs = {name: value if value is not None else '' for name, value in attrs}
+        captures = []
+
+        if tag == 'a' and self.want_links and 'href' in attrs and not self._full(self.fields['links']):
+            self.fields['links'].append(attrs['href'])
+            self._check_done()
+        elif tag == 'title' and self.want_title and self.fields['title'] is None:
+            self.fields['title'] = ''
+            captures.append(['title', None, []])
+        elif tag == 'p' and self.want_paragraphs and not self._full(self.fields['paragraphs']):
+            captures.append(self._reserve(self.fields['paragraphs']))
+        for selector in self.selectors:
+            items = self.fields['selectors'][selector.text]
+            if not self._full(items) and selector.matches(tag, attrs):
+                if selector.attr is not None:
+                    if selector.attr in attrs:
+                        items.append(attrs[selector.attr])
+                        self._check_done()
+                else:
+                    captures.append(self._reserve(items))
+
+        if tag in VOID_ELEMENTS:
+            for items, slot, _ in captures:
+                items[slot] = ''
+            self._check_done()
+            return
+        self._stack.append([tag, captures])
+        self._active.extend(captures)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                self._close(i)
+                return
+
+    def _close(self, index):
+        """Close the open element at stack index (and everything opened inside it)."""
+        while len(self._stack) > index:
+            _, captures = self._stack.pop()
+            for capture in captures:
+                del self._active[next(i for i, c in enumerate(self._active) if c is capture)]
+                target, slot, pieces = capture
+                text = clean_text(''.join(pieces))
+                if target == 'title':
+                    self.fields['title'] = text
+                else:
+                    target[slot] = text
+            if captures:
+                self._check_done()
+
+    def handle_data(self, data):
+        for capture in self._active:
+            capture[2].append(data)
+
+    def finish(self):
+        """Flush the parser and close elements left open; returns the fields."""
+        self.close()
+        self._close(0)
+        return self.fields
+
+
+def _decoder(encoding):
+    """Incremental decoder for encoding (UTF-8 if the name is unknown); bad bytes become U+FFFD."""
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+
+def sniff_encoding(head, default='utf-8'):
+    """Charset declared by a <meta> tag in the first bytes of a page, else default."""
+    match = _META_CHARSET.search(head[:4096])
+    if match:
+        name = match.group(1).decode('ascii', 'replace')
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            pass
+    return default
+
+
+class Extraction:
+    """
+    Which fields to pull from a page and with which parser ('stream' or
+    'bs4'). Calling it on a crawler.Response (or http_cache.CacheEntry)
+    returns the fields dict, so it can be handed to Crawler(extract=...) or
+    HTTPCache.parsed(); `key` identifies the configuration for the cache.
+    """
+
+    def __init__(self, parser='stream', title=True, links=True, paragraphs=False, selectors=(), limit=None,
+                 stop_early=True):
+        if parser not in PARSERS:
+            raise ValueError(f"parser must be one of {', '.join(PARSERS)}")
+        self.parser = parser
+        self.title = title
+        self.links = links
+        self.paragraphs = paragraphs
+        self.selectors = [Selector(s) for s in selectors]
+        self.limit = limit
+        self.stop_early = stop_early
+        wanted = [name for name in ('title', 'links', 'paragraphs') if getattr(self, name)]
+        wanted += [s.text for s in self.selectors]
+        self.key = f"extract.{parser}({','.join(wanted)};limit={limit})"
+
+    def from_chunks(self, chunks, encoding=None):
+        """Fields of a page arriving as byte chunks; stops reading early when it can."""
+        if self.parser == 'bs4':
+            body = b''.join(chunks)
+            return self.from_text(_decoder(encoding or sniff_encoding(body)).decode(body, final=True))
+        extractor = StreamExtractor(self.title, self.links, self.paragraphs, self.selectors, self.limit)
+        decoder = None
+        for chunk in chunks:
+            if decoder is None:
+                decoder = _decoder(encoding or sniff_encoding(chunk))
+            extractor.feed(decoder.decode(chunk))
+            if self.stop_early and extractor.done:
+                return extractor.fields
+        if decoder is not None:
+            extractor.feed(decoder.decode(b'', final=True))
+        return extractor.finish()
+
+    def from_bytes(self, body, encoding=None, chunk_bytes=CHUNK_BYTES):
+        """Fields of a page held in memory, fed in chunk_bytes slices (nothing is decoded up front)."""
+        view = memoryview(body)
+        return self.from_chunks((view[i:i + chunk_bytes] for i in range(0, len(view), chunk_bytes)), encoding)
+
+    def from_text(self, text):
+        """Fields of an already decoded page."""
+        if self.parser == 'bs4':
+            return self._soup(text)
+        extractor = StreamExtractor(self.title, self.links, self.paragraphs, self.selectors, self.limit)
+        extractor.feed(text)
+        return extractor.finish()
+
+    def _soup(self, text):
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(text, 'html.parser')
+        limit = self.limit
+        fields = {}
+        if self.title:
+            fields['title'] = clean_text(soup.title.get_text()) if soup.title else None
+        if self.links:
+            fields['links'] = [a['href'] for a in soup.find_all('a', href=True, limit=limit)]
+        if self.paragraphs:
+            fields['paragraphs'] = [clean_text(p.get_text()) for p in soup.find_all('p', limit=limit)]
+        if self.selectors:
+            fields['selectors'] = {}
+            for selector in self.selectors:
+                found = soup.select(selector.css)
+                if selector.attr is not None:
+                    values = [el.get(selector.attr) for el in found if el.get(selector.attr) is not None]
+                    values = [' '.join(v) if isinstance(v, list) else v for v in values]
+                else:
+                    values = [clean_text(el.get_text()) for el in found]
+                fields['selectors'][selector.text] = values[:limit] if limit is not None else values
+        return fields
+
+    def __call__(self, response):
+        return self.from_bytes(response.body, declared_charset(response))
+
+
+def declared_charset(response):
+    """Charset from the Content-Type header, or None to sniff it from the page."""
+    match = re.search(r'charset=["\']?([\w.:-]+)', response.headers.get('content-type', ''), re.I)
+    return match.group(1) if match else None
+
+
+def stream_links(response):
+    """(title, hrefs) like crawler.parse_html, with the streaming parser; for Crawler(extract=...)."""
+    fields = _LINKS(response)
+    return fields['title'], fields['links']
+
+
+_LINKS = Extraction('stream', title=True, links=True)
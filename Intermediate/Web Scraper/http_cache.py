@@ -0,0 +1,341 @@
+"""
+Persistent HTTP cache for the scraper (SQLite file, standard library only).
+
+Bodies are stored zlib-compressed, next to their validators (ETag,
+Last-Modified), their freshness lifetime from Cache-Control max-age (or
+Expires) and the links/title already extracted from them. A page is then
+served in one of three ways:
+
+  * fresh      - within max-age: no request and no parse at all,
+  * revalidated - a conditional GET (If-None-Match / If-Modified-Since)
+                 answered 304: no body download and no parse,
+  * unchanged  - a full 200 whose body hashes the same as the cached one
+                 (servers without validators): no parse,
+
+and otherwise it is downloaded, parsed and stored. The file is bounded to
+`max_bytes` of compressed data by evicting least-recently-used entries.
+
+    cache = HTTPCache('.scraper_cache/http.sqlite')
+    entry = cache.lookup(url)
+    if entry is None or not entry.fresh:
+        response = fetch(url, headers=cache.validators(entry))
+        entry = cache.update(url, entry, response)
+    title, links = cache.parsed(entry, parser_name(parse_html), parse_html)
+    print(cache.report())
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+from crawler import Response
+
+DEFAULT_CACHE_DIR = '.scraper_cache'
+DEFAULT_MAX_BYTES = 256 * 2**20
+COMPRESS_LEVEL = 6
+
+# Response headers worth keeping with a cached body (it is stored decoded,
+# so Content-Encoding and Content-Length are not among them).
+KEPT_HEADERS = ('content-type', 'location')
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS entries (
+    url           TEXT PRIMARY KEY,
+    status        INTEGER NOT NULL,
+    headers       TEXT NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    stored_at     REAL NOT NULL,
+    max_age       REAL NOT NULL,
+    digest        TEXT NOT NULL,
+    size          INTEGER NOT NULL,
+    transfer_size INTEGER,
+    stored_bytes  INTEGER NOT NULL,
+    body          BLOB NOT NULL,
+    parser        TEXT,
+    parsed        TEXT,
+    last_used     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_used);
+"""
+
+# Columns added since the first schema: (name, declaration) for ALTER TABLE on older cache files.
+ADDED_COLUMNS = (('transfer_size', 'INTEGER'),)
+
+
+def cache_control(headers):
+    """Cache-Control directives as {name: value or True}."""
+    directives = {}
+    for part in headers.get('cache-control', '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') if value else True
+    return directives
+
+
+def freshness_lifetime(headers, now=None):
+    """
+    Seconds a response may be reused without revalidation, or None if it
+    must not be stored at all (no-store, Vary: *).
+    """
+    directives = cache_control(headers)
+    if 'no-store' in directives or headers.get('vary', '').strip() == '*':
+        return None
+    if 'no-cache' in directives:
+        return 0.0
+    try:
+        age = float(headers.get('age', 0))
+    except ValueError:
+        age = 0.0
+    if 'max-age' in directives:
+        try:
+            return max(float(directives['max-age']) - age, 0.0)
+        except ValueError:
+            return 0.0
+    if 'expires' in headers:
+        try:
+            expires = parsedate_to_datetime(headers['expires']).timestamp()
+            date = parsedate_to_datetime(headers['date']).timestamp() if 'date' in headers else now or time.time()
+        except (TypeError, ValueError):
+            return 0.0
+        return max(expires - date - age, 0.0)
+    return 0.0
+
+
+class CacheEntry:
+    """A stored response (usable where a crawler.Response is read); the body is decompressed only when asked for."""
+
+    __slots__ = ('url', 'status', 'headers', 'etag', 'last_modified', 'stored_at', 'max_age', 'digest', 'size',
+                 'transfer_size', 'parser', 'parsed', '_blob', '_body')
+
+    def __init__(self, url, status, headers, etag, last_modified, stored_at, max_age, digest, size, transfer_size,
+                 blob, parser=None, parsed=None, body=None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.max_age = max_age
+        self.digest = digest
+        self.size = size
+        # Body bytes on the wire (compressed if the server used gzip); entries from older caches lack it.
+        self.transfer_size = size if transfer_size is None else transfer_size
+        self.parser = parser
+        self.parsed = parsed
+        self._blob = blob
+        self._body = body
+
+    @property
+    def fresh(self):
+        return time.time() < self.stored_at + self.max_age
+
+    @property
+    def content_type(self):
+        return self.headers.get('content-type', '').split(';', 1)[0].strip().lower()
+
+    @property
+    def body(self):
+        if self._body is None:
+            self._body = zlib.decompress(self._blob)
+        return self._body
+
+    def to_response(self):
+        return Response(self.url, self.status, dict(self.headers), self.body)
+
+
+class HTTPCache:
+    """
+    Conditional-GET cache in one SQLite file; see the module docstring.
+
+    Counters cover this process only, so report() describes one run.
+    bytes_saved counts body bytes as they would have crossed the wire
+    (gzip-compressed when the server compressed them), not decoded bytes.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA_SQL)
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(entries)')}
+        for name, declaration in ADDED_COLUMNS:
+            if name not in columns:
+                self.conn.execute(f'ALTER TABLE entries ADD COLUMN {name} {declaration}')
+        self.total_bytes = self.conn.execute('SELECT COALESCE(SUM(stored_bytes), 0) FROM entries').fetchone()[0]
+        self.lookups = 0
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.unchanged = 0
+        self.misses = 0
+        self.evicted = 0
+        self.bytes_saved = 0
+        self.parses_skipped = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def lookup(self, url):
+        """The cached entry for url (marking it recently used), or None."""
+        self.lookups += 1
+        row = self.conn.execute(
+            'SELECT url, status, headers, etag, last_modified, stored_at, max_age, digest, size, transfer_size, '
+            'body, parser, parsed FROM entries WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self.conn:
+            self.conn.execute('UPDATE entries SET last_used = ? WHERE url = ?', (time.time(), url))
+        entry = CacheEntry(*row[:2], json.loads(row[2]), *row[3:11], row[11],
+                           json.loads(row[12]) if row[12] is not None else None)
+        if entry.fresh:
+            self.fresh_hits += 1
+            self.bytes_saved += entry.transfer_size
+        return entry
+
+    @staticmethod
+    def validators(entry):
+        """Request headers revalidating entry (empty if there is nothing to revalidate)."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def update(self, url, entry, response):
+        """
+        Fold a network response into the cache.
+
+        Returns the entry to use: the cached one (refreshed) after a 304 or
+        an identical body, a newly stored one, or None when the response is
+        not cacheable (its caller then uses the response as is).
+        """
+        now = time.time()
+        max_age = freshness_lifetime(response.headers, now)
+        if response.status == 304 and entry is not None:
+            self.revalidated += 1
+            self.bytes_saved += entry.transfer_size
+            self._refresh(entry, response.headers, now, max_age)
+            return entry
+        self.misses += 1
+        if response.status not in (200, 203, 301, 308) or max_age is None:
+            if entry is not None:
+                self._delete(url)
+            return None
+
+        body = response.body
+        digest = hashlib.sha1(body).hexdigest()
+        if entry is not None and entry.digest == digest:
+            self.unchanged += 1
+            entry._body = body
+            entry.transfer_size = response.transfer_size
+            self._refresh(entry, response.headers, now, max_age)
+            return entry
+
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        blob = zlib.compress(body, COMPRESS_LEVEL)
+        entry = CacheEntry(url, response.status, headers, response.headers.get('etag'),
+                           response.headers.get('last-modified'), now, max_age, digest, len(body),
+                           response.transfer_size, blob, body=body)
+        with self.conn:
+            old = self.conn.execute('SELECT stored_bytes FROM entries WHERE url = ?', (url,)).fetchone()
+            self.conn.execute(
+                'INSERT OR REPLACE INTO entries (url, status, headers, etag, last_modified, stored_at, max_age, '
+                'digest, size, transfer_size, stored_bytes, body, parser, parsed, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?)',
+                (url, entry.status, json.dumps(headers), entry.etag, entry.last_modified, now, max_age, digest,
+                 len(body), entry.transfer_size, len(blob), blob, now)
+            )
+            self.total_bytes += len(blob) - (old[0] if old else 0)
+            self._evict(keep=url)
+        return entry
+
+    def _refresh(self, entry, headers, now, max_age):
+        """Extend a revalidated entry's lifetime, taking any new validators."""
+        entry.stored_at = now
+        entry.max_age = max_age or 0.0
+        entry.etag = headers.get('etag', entry.etag)
+        entry.last_modified = headers.get('last-modified', entry.last_modified)
+        with self.conn:
+            self.conn.execute('UPDATE entries SET stored_at = ?, max_age = ?, etag = ?, last_modified = ?, '
+                              'transfer_size = ? WHERE url = ?',
+                              (now, entry.max_age, entry.etag, entry.last_modified, entry.transfer_size, entry.url))
+
+    def _delete(self, url):
+        with self.conn:
+            row = self.conn.execute('SELECT stored_bytes FROM entries WHERE url = ?', (url,)).fetchone()
+            if row:
+                self.conn.execute('DELETE FROM entries WHERE url = ?', (url,))
+                self.total_bytes -= row[0]
+
+    def _evict(self, keep=None):
+        """Drop least-recently-used entries until the cache fits max_bytes (inside the caller's transaction)."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        victims = []
+        for url, stored_bytes in self.conn.execute('SELECT url, stored_bytes FROM entries ORDER BY last_used'):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if url != keep:
+                victims.append((url,))
+                self.total_bytes -= stored_bytes
+        self.conn.executemany('DELETE FROM entries WHERE url = ?', victims)
+        self.evicted += len(victims)
+
+    def parsed(self, entry, parser, parse):
+        """
+        parse(response)'s result for entry, reusing the stored one when the
+        same parser (see crawler.parser_name) produced it.
+        """
+        if entry.parser == parser and entry.parsed is not None:
+            self.parses_skipped += 1
+            return entry.parsed
+        result = parse(entry.to_response())
+        entry.parser, entry.parsed = parser, result
+        with self.conn:
+            self.conn.execute('UPDATE entries SET parser = ?, parsed = ? WHERE url = ?',
+                              (parser, json.dumps(result), entry.url))
+        return result
+
+    def stats(self):
+        hits = self.fresh_hits + self.revalidated
+        return {
+            'lookups': self.lookups,
+            'fresh': self.fresh_hits,
+            'revalidated': self.revalidated,
+            'unchanged': self.unchanged,
+            'misses': self.misses - self.unchanged,
+            'hit_rate': round(hits / self.lookups, 4) if self.lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+            'parses_skipped': self.parses_skipped,
+            'evicted': self.evicted,
+            'entries': len(self),
+            'stored_bytes': self.total_bytes
+        }
+
+    def report(self):
+        """One-line summary of this run's cache use."""
+        s = self.stats()
+        return (f"[CACHE] hit rate {s['hit_rate']:.1%} of {s['lookups']} lookups "
+                f"(fresh {s['fresh']}, revalidated {s['revalidated']}, unchanged {s['unchanged']}, "
+                f"miss {s['misses']}); {s['bytes_saved'] / 1024:,.1f} KiB not downloaded, "
+                f"{s['parses_skipped']} parses skipped; {s['entries']} entries, "
+                f"{s['stored_bytes'] / 1024:,.1f} KiB on disk")
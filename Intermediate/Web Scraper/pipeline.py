@@ -0,0 +1,330 @@
+"""
+Structured scraper output: records -> absolute URLs -> dedup -> batched sinks.
+
+Each record is a flat dict with a declared set of columns (PAGE_FIELDS or
+LINK_FIELDS, or any other). On the way in, URL columns are resolved
+against their base column (a page's links against the page URL) and
+normalized, and records whose key was seen before are dropped. Records
+are then written in batches to every sink:
+
+    .ndjson / .jsonl   one JSON object per line
+    .csv               header row plus one row per record
+    .sqlite / .db      a `records` table, one transaction per batch
+    .parquet           one row group per batch (needs pyarrow)
+
+A synchronous producer calls add(); a crawler calls `await put()`, which
+hands full batches to a background writer through a queue holding at most
+`max_pending` records. When the sinks fall behind, put() waits, so the
+crawler slows down instead of buffering the whole crawl in memory.
+
+    pipeline = Pipeline([open_sink('links.parquet')], **RECORD_TYPES['links'])
+    for page in crawler.pages:
+        for record in link_records(page):
+            pipeline.add(record)
+    pipeline.close()
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from urllib.parse import urljoin
+
+from crawler import normalize_url
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_PENDING = 50_000
+
+# Resolved URLs remembered per pipeline (a page's own URL repeats on each of its links).
+RESOLVED_CACHE_SIZE = 100_000
+
+# Bytes of BLAKE2b kept per de-duplicated key.
+KEY_DIGEST_SIZE = 16
+
+# Column name -> type ('str', 'int' or 'float').
+PAGE_FIELDS = {'url': 'str', 'status': 'int', 'depth': 'int', 'title': 'str', 'link_count': 'int'}
+LINK_FIELDS = {'source': 'str', 'url': 'str'}
+
+RECORD_TYPES = {
+    'pages': dict(fields=PAGE_FIELDS, key=('url',), urls={'url': None}),
+    'links': dict(fields=LINK_FIELDS, key=('source', 'url'), urls={'source': None, 'url': 'source'})
+}
+
+SQL_TYPES = {'str': 'TEXT', 'int': 'INTEGER', 'float': 'REAL'}
+
+
+def page_records(page):
+    """The PAGE_FIELDS record of a crawler.Page, as a one-item list."""
+    return [{'url': page.url, 'status': page.status, 'depth': page.depth, 'title': page.title,
+             'link_count': len(page.links)}]
+
+
+def link_records(page):
+    """LINK_FIELDS records, one per link of a crawler.Page."""
+    return [{'source': page.url, 'url': link} for link in page.links]
+
+
+RECORD_MAKERS = {'pages': page_records, 'links': link_records}
+
+
+class NDJSONSink:
+    """One JSON object per line."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+
+    def open(self, fields):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8', newline='\n')
+
+    def write(self, records):
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        self._file.write(''.join([dumps(record) + '\n' for record in records]))
+
+    def close(self):
+        self._file.close()
+
+
+class CSVSink:
+    """CSV with a header row; missing values are empty cells."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+        self._writer = None
+
+    def open(self, fields):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(fields)
+        self._fields = list(fields)
+
+    def write(self, records):
+        fields = self._fields
+        self._writer.writerows([[record[name] for name in fields] for record in records])
+
+    def close(self):
+        self._file.close()
+
+
+class SQLiteSink:
+    """Rows appended to `table` (created if missing), one transaction per batch."""
+
+    def __init__(self, path, table='records'):
+        self.path = Path(path)
+        self.table = table
+        self.conn = None
+
+    def open(self, fields):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Batches may be written from the pipeline's writer thread.
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        columns = ', '.join(f'{name} {SQL_TYPES[kind]}' for name, kind in fields.items())
+        self.conn.execute(f'CREATE TABLE IF NOT EXISTS {self.table} ({columns})')
+        self._fields = list(fields)
+        self._insert = (f"INSERT INTO {self.table} ({', '.join(fields)}) "
+                        f"VALUES ({', '.join('?' * len(fields))})")
+
+    def write(self, records):
+        fields = self._fields
+        with self.conn:
+            self.conn.executemany(self._insert, [tuple(record[name] for name in fields) for record in records])
+
+    def close(self):
+        self.conn.close()
+
+
+class ParquetSink:
+    """Parquet file with one row group per batch (pyarrow is imported on open)."""
+
+    def __init__(self, path, compression='zstd'):
+        self.path = Path(path)
+        self.compression = compression
+        self._writer = None
+
+    def open(self, fields):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError('Parquet output needs pyarrow: pip install pyarrow')
+        types = {'str': pa.string(), 'int': pa.int64(), 'float': pa.float64()}
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in fields.items()])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+
+    def write(self, records):
+        columns = {name: [record[name] for record in records] for name in self._schema.names}
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+SINKS = {'.ndjson': NDJSONSink, '.jsonl': NDJSONSink, '.csv': CSVSink, '.sqlite': SQLiteSink, '.db': SQLiteSink,
+         '.parquet': ParquetSink}
+
+
+def open_sink(path, **options):
+    """The sink for a file, chosen by its extension."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in SINKS:
+        raise ValueError(f"unsupported output type '{suffix}' (use {', '.join(SINKS)})")
+    return SINKS[suffix](path, **options)
+
+
+def key_digest(values):
+    """
+    Digest of a record key. Values are joined by repr, which quotes strings
+    and escapes control characters, so distinct keys never encode alike
+    ('1' and 1, None and 'None', ('a', 'b') and ('a\x1fb',)).
+    """
+    encoded = '\x1f'.join(map(repr, values)).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=KEY_DIGEST_SIZE).digest()
+
+
+class Pipeline:
+    """
+    Resolves, de-duplicates and batches records into sinks; see the module
+    docstring.
+
+    fields: column -> type; records are cut down to these columns.
+    key:    columns identifying a record for de-duplication (all by default).
+    urls:   URL column -> column holding its base URL (None: already absolute);
+            values are normalized with crawler.normalize_url.
+
+    De-duplication keeps a 128-bit BLAKE2b digest of each key (see
+    key_digest), not the key itself, so memory stays small for millions of
+    records; a false duplicate would need a collision of that digest.
+    """
+
+    def __init__(self, sinks, fields, key=None, urls=None, batch_size=DEFAULT_BATCH_SIZE,
+                 max_pending=DEFAULT_MAX_PENDING):
+        self.sinks = list(sinks)
+        self.fields = dict(fields)
+        self.key = tuple(key or self.fields)
+        self.urls = dict(urls or {})
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._seen = set()
+        self._resolved = {}
+        self._batch = []
+        self._queue = None
+        self._writer = None
+        self._error = None
+        self.received = 0
+        self.duplicates = 0
+        self.written = 0
+        self.batches = 0
+        self.max_queued = 0
+        for sink in self.sinks:
+            sink.open(self.fields)
+
+    def _resolve(self, value, base):
+        resolved = self._resolved.get((value, base))
+        if resolved is None:
+            if base is None:
+                resolved = normalize_url(value) or value
+            else:
+                resolved = normalize_url(value, base) or urljoin(base, value)
+            if len(self._resolved) >= RESOLVED_CACHE_SIZE:
+                self._resolved.clear()
+            self._resolved[(value, base)] = resolved
+        return resolved
+
+    def _prepare(self, record):
+        """The record cut to the declared columns with URLs resolved, or None if it is a duplicate."""
+        self.received += 1
+        record = {name: record.get(name) for name in self.fields}
+        for name, base in self.urls.items():
+            if record[name] is not None:
+                record[name] = self._resolve(record[name], record[base] if base else None)
+        digest = key_digest([record[name] for name in self.key])
+        if digest in self._seen:
+            self.duplicates += 1
+            return None
+        self._seen.add(digest)
+        return record
+
+    def _take(self):
+        batch, self._batch = self._batch, []
+        return batch
+
+    def _write(self, batch):
+        for sink in self.sinks:
+            sink.write(batch)
+        self.written += len(batch)
+        self.batches += 1
+
+    def add(self, record):
+        """Synchronous producer: full batches are written straight away. Returns False for duplicates."""
+        record = self._prepare(record)
+        if record is None:
+            return False
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self._write(self._take())
+        return True
+
+    async def put(self, record):
+        """Async producer: full batches go to the writer task; waits while max_pending records are queued."""
+        if self._error is not None:
+            raise self._error
+        record = self._prepare(record)
+        if record is None:
+            return False
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            if self._writer is None:
+                self._queue = asyncio.Queue(maxsize=max(1, self.max_pending // self.batch_size))
+                self._writer = asyncio.create_task(self._drain())
+            await self._queue.put(self._take())
+            self.max_queued = max(self.max_queued, self._queue.qsize() * self.batch_size)
+        return True
+
+    async def _drain(self):
+        """Writer task: batches are written in a worker thread so the event loop keeps crawling."""
+        while True:
+            batch = await self._queue.get()
+            try:
+                if batch is None:
+                    return
+                if self._error is None:
+                    await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                # Keep taking batches so producers blocked on put() wake up and see the error.
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def close(self):
+        """Write the last partial batch and close the sinks."""
+        try:
+            if self._batch:
+                self._write(self._take())
+        finally:
+            for sink in self.sinks:
+                sink.close()
+
+    async def aclose(self):
+        """close() for put() producers: waits for the writer task to finish first."""
+        if self._writer is not None:
+            await self._queue.put(None)
+            await self._writer
+            self._writer = None
+        if self._error is not None:
+            for sink in self.sinks:
+                sink.close()
+            raise self._error
+        self.close()
+
+    def stats(self):
+        return {'received': self.received, 'duplicates': self.duplicates, 'written': self.written,
+                'batches': self.batches, 'max_queued': self.max_queued}
@@ -0,0 +1,12 @@
+"""
+Shared setup for the scraper tests.
+
+Run from the Web Scraper folder (or the repository root):
+    python -m pytest -q "Intermediate/Web Scraper/tests"
+"""
+
+import sys
+from pathlib import Path
+
+# Make the scraper modules importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
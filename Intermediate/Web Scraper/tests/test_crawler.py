@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+from crawler import Crawler, normalize_url, origin_of
+
+
+@pytest.mark.parametrize('url, base, expected', [
+    ('HTTP://Example.COM:80/a/./b/../c#frag', None, 'http://example.com/a/c'),
+    ('https://example.com:443', None, 'https://example.com/'),
+    ('https://example.com:8443/x', None, 'https://example.com:8443/x'),
+    ('/%7euser/%2f?q=a b', 'http://example.com/dir/page', 'http://example.com/~user/%2F?q=a%20b'),
+    ('next.html', 'http://example.com/dir/page', 'http://example.com/dir/next.html'),
+    ('mailto:someone@example.com', None, None),
+    ('javascript:void(0)', None, None),
+    ('http://example.com:notaport/', None, None),
+])
+def test_normalize_url(url, base, expected):
+    assert normalize_url(url, base) == expected
+
+
+def test_origin_of():
+    assert origin_of('https://example.com:8443/a?b') == 'https://example.com:8443'
+
+
+class Site:
+    """
+    Local HTTP servers, one per host name in routes: {host: {path: (status, headers, body)}}.
+    Each host listens on its own 127.0.0.1 port, so each is a distinct netloc to the crawler;
+    '{host}' in headers and bodies is replaced by that host's base URL.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.base = {}
+        self.requests = []
+        self._servers = []
+
+    async def __aenter__(self):
+        for host in self.routes:
+            server = await asyncio.start_server(lambda r, w, host=host: self._handle(host, r, w), '127.0.0.1', 0)
+            self._servers.append(server)
+            self.base[host] = f'http://127.0.0.1:{server.sockets[0].getsockname()[1]}'
+        return self
+
+    async def __aexit__(self, *exc):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+
+    def _fill(self, text):
+        for host, base in self.base.items():
+            text = text.replace('{%s}' % host, base)
+        return text
+
+    async def _handle(self, host, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                path = head.split(b' ', 2)[1].decode()
+                self.requests.append((host, path))
+                status, headers, body = self.routes[host].get(path, (404, {}, 'not found'))
+                body = self._fill(body).encode()
+                lines = [f'HTTP/1.1 {status} X', f'Content-Length: {len(body)}']
+                lines += [f'{name}: {self._fill(value)}' for name, value in headers.items()]
+                writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+HTML = {'Content-Type': 'text/html; charset=utf-8'}
+
+
+def page(title, *hrefs):
+    links = ''.join(f'<a href="{href}">{href}</a>' for href in hrefs)
+    return 200, HTML, f'<html><head><title>{title}</title></head><body>{links}</body></html>'
+
+
+def run_crawl(routes, seed_host, seed_path='/', **options):
+    async def run():
+        async with Site(routes) as site:
+            crawler = Crawler(concurrency=4, delay=0, obey_robots=options.pop('obey_robots', False), **options)
+            stats = await crawler.crawl(site.base[seed_host] + seed_path)
+            return crawler, stats, site
+    return asyncio.run(run())
+
+
+def fetched(crawler, site):
+    """{(host, path)} of the crawled pages."""
+    names = {base: host for host, base in site.base.items()}
+    return {(names[origin_of(p.url)], p.url[len(origin_of(p.url)):]) for p in crawler.pages}
+
+
+def test_crawl_follows_links_once_and_stays_on_host():
+    routes = {
+        'site': {'/': page('Home', '/a', '/b', '/a#top', '{other}/x'),
+                 '/a': page('A', '/', '/b'),
+                 '/b': page('B', 'c')},
+        'other': {'/x': page('Elsewhere')},
+    }
+    crawler, stats, site = run_crawl(routes, 'site')
+    assert fetched(crawler, site) == {('site', '/'), ('site', '/a'), ('site', '/b'), ('site', '/c')}
+    assert not any(host == 'other' for host, _ in site.requests)
+    assert stats['fetched'] == 4
+    assert sorted(p.title for p in crawler.pages if p.status == 200) == ['A', 'B', 'Home']
+    # One keep-alive connection per worker at most.
+    assert stats['connections'] <= 4
+
+
+def test_seed_redirect_to_another_host_is_followed():
+    # The apex -> www case: the seed host only redirects, the site lives on the target host.
+    routes = {
+        'apex': {'/': (301, {'Location': '{www}/'}, '')},
+        'www': {'/': page('Home', '/about', '{apex}/', '{other}/'),
+                '/about': page('About')},
+        'other': {'/': page('Elsewhere')},
+    }
+    crawler, stats, site = run_crawl(routes, 'apex')
+    assert fetched(crawler, site) == {('apex', '/'), ('www', '/'), ('www', '/about')}
+    assert not any(host == 'other' for host, _ in site.requests)
+    assert next(p for p in crawler.pages if p.status == 301).links == [site.base['www'] + '/']
+
+
+def test_redirect_chain_from_seed_adds_every_hop():
+    routes = {
+        'apex': {'/': (301, {'Location': '{mid}/'}, '')},
+        'mid': {'/': (302, {'Location': '{www}/home'}, '')},
+        'www': {'/home': page('Home', '/next'), '/next': page('Next')},
+    }
+    crawler, _, site = run_crawl(routes, 'apex')
+    assert ('www', '/next') in fetched(crawler, site)
+
+
+def test_redirect_off_site_from_a_link_is_not_followed():
+    routes = {
+        'site': {'/': page('Home', '/moved'),
+                 '/moved': (302, {'Location': '{other}/'}, '')},
+        'other': {'/': page('Elsewhere', '/deeper')},
+    }
+    crawler, _, site = run_crawl(routes, 'site')
+    assert fetched(crawler, site) == {('site', '/'), ('site', '/moved')}
+    assert not any(host == 'other' for host, _ in site.requests)
+
+
+def test_any_host_follows_every_link():
+    routes = {
+        'site': {'/': page('Home', '{other}/')},
+        'other': {'/': page('Elsewhere')},
+    }
+    crawler, _, site = run_crawl(routes, 'site', same_host=False)
+    assert fetched(crawler, site) == {('site', '/'), ('other', '/')}
+
+
+def test_max_pages_and_max_depth():
+    routes = {'site': {'/': page('0', '/1'), '/1': page('1', '/2'), '/2': page('2', '/3'), '/3': page('3')}}
+    crawler, _, site = run_crawl(routes, 'site', max_depth=2)
+    assert fetched(crawler, site) == {('site', '/'), ('site', '/1'), ('site', '/2')}
+    crawler, stats, site = run_crawl(routes, 'site', max_pages=2)
+    assert stats['fetched'] == 2 and len(crawler.pages) == 2
+
+
+def test_robots_txt_is_obeyed():
+    routes = {'site': {'/robots.txt': (200, {'Content-Type': 'text/plain'}, 'User-agent: *\nDisallow: /private\n'),
+                       '/': page('Home', '/private/a', '/public'),
+                       '/private/a': page('Secret'),
+                       '/public': page('Public')}}
+    crawler, stats, site = run_crawl(routes, 'site', obey_robots=True)
+    assert fetched(crawler, site) == {('site', '/'), ('site', '/public')}
+    assert stats['robots_blocked'] == 1
+    assert ('site', '/private/a') not in site.requests
@@ -1,22 +1,150 @@
-import requests
-from bs4 import BeautifulSoup
-
-# URL to scrape
-url = "https://example.com"
-
-# Send HTTP request
-response = requests.get(url)
-
-# Parse HTML content
-soup = BeautifulSoup(response.text, "html.parser")
-
-# Extract page title
-title = soup.title.text
-print("Page Title:", title)
-
-# Extract all links
-print("\nLinks on the page:")
-for link in soup.find_all("a"):
-    print(link.get("href"))
-
-
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import requests
+
+from crawler import DEFAULT_CONCURRENCY, DEFAULT_DELAY, Crawler, Page, Response, normalize_url, parse_html, parser_name
+from extract import CHUNK_BYTES, PARSERS, Extraction, declared_charset, stream_links
+from http_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, HTTPCache
+from pipeline import RECORD_MAKERS, RECORD_TYPES, Pipeline, open_sink
+
+# URL to scrape
+DEFAULT_URL = "https://example.com"
+
+
+def fetch(url, extraction, cache=None):
+    """The fields extraction asks for, using and refreshing the HTTP cache when given one."""
+    entry = cache.lookup(url) if cache is not None else None
+    if entry is None or not entry.fresh:
+        # Send HTTP request (a conditional one when a cached copy exists)
+        response = requests.get(url, headers=HTTPCache.validators(entry), stream=True)
+        if cache is None:
+            # Nothing to store: parse while downloading and stop once the fields are found
+            with response:
+                return extraction.from_chunks(response.iter_content(CHUNK_BYTES), declared_charset(response))
+        body = response.content
+        # raw.tell() counts the bytes read off the socket, before gzip/deflate decoding.
+        response = Response(url, response.status_code, {k.lower(): v for k, v in response.headers.items()},
+                            body, response.raw.tell())
+        entry = cache.update(url, entry, response)
+
+    # Parse HTML content (unless this exact body was parsed before)
+    if entry is not None:
+        return cache.parsed(entry, parser_name(extraction), extraction)
+    return extraction(response)
+
+
+def scrape(url, extraction, cache=None, pipeline=None, records="links"):
+    """Print a single page's title, links and any other requested fields, or add them to pipeline as records."""
+    url = normalize_url(url) or url
+    fields = fetch(url, extraction, cache)
+    if pipeline is not None:
+        page = Page(url, None, 0, fields.get("title"), fields.get("links", []))
+        for record in RECORD_MAKERS[records](page):
+            pipeline.add(record)
+        return
+
+    # Extract page title
+    if "title" in fields:
+        print("Page Title:", fields["title"])
+
+    # Extract all links
+    if "links" in fields:
+        print("\nLinks on the page:")
+        for link in fields["links"]:
+            print(link)
+
+    if "paragraphs" in fields:
+        print("\nParagraphs:")
+        for paragraph in fields["paragraphs"]:
+            print(paragraph)
+
+    for selector, matches in fields.get("selectors", {}).items():
+        print(f"\nMatches for {selector}:")
+        for match in matches:
+            print(match)
+
+
+def crawl(url, args, cache=None, pipeline=None):
+    """Follow links from url concurrently, printing one line per page or sending records to pipeline."""
+    def show(page):
+        print(f"{page.status}\t{page.url}\t{page.title or ''}")
+
+    async def store(page):
+        for record in make_records(page):
+            await pipeline.put(record)
+
+    async def run():
+        try:
+            return await crawler.crawl([url])
+        finally:
+            if pipeline is not None:
+                await pipeline.aclose()
+
+    make_records = RECORD_MAKERS[args.records]
+    crawler = Crawler(concurrency=args.concurrency, delay=args.delay, max_pages=args.max_pages,
+                      max_depth=args.max_depth, same_host=not args.any_host, obey_robots=not args.ignore_robots,
+                      on_page=show if pipeline is None else store, cache=cache,
+                      extract=stream_links if args.parser == "stream" else parse_html)
+    stats = asyncio.run(run())
+    for failed, error in crawler.errors.items():
+        print(f"[ERROR] {failed}: {error}", file=sys.stderr)
+    print(", ".join(f"{key}={value}" for key, value in stats.items()), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print a web page's title and links, or crawl its site.")
+    parser.add_argument("url", nargs="?", default=DEFAULT_URL, help=f"page to scrape (default: {DEFAULT_URL})")
+    parser.add_argument("--crawl", action="store_true", help="follow links across the site")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"requests in flight while crawling (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY,
+                        help=f"seconds between requests to one host (default: {DEFAULT_DELAY})")
+    parser.add_argument("--max-pages", type=int, help="stop after fetching this many pages")
+    parser.add_argument("--max-depth", type=int, help="do not follow links deeper than this")
+    parser.add_argument("--any-host", action="store_true", help="also follow links to other hosts")
+    parser.add_argument("--ignore-robots", action="store_true", help="do not fetch or obey robots.txt")
+    parser.add_argument("--parser", choices=PARSERS, default="bs4",
+                        help="bs4 builds the whole tree; stream parses incrementally, keeping only the fields asked for")
+    parser.add_argument("--paragraphs", action="store_true", help="also print the text of every <p>")
+    parser.add_argument("--select", action="append", default=[], metavar="CSS",
+                        help="also print matches of a selector such as h2.title or img::attr(src) (repeatable)")
+    parser.add_argument("--no-links", action="store_true", help="do not print links")
+    parser.add_argument("--limit", type=int,
+                        help="at most this many items per field; the stream parser stops once all are found")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="write records to FILE instead of printing (.ndjson, .csv, .sqlite or .parquet)")
+    parser.add_argument("--records", choices=RECORD_TYPES, default="links",
+                        help="links: one row per (page, absolute link); pages: one row per page (default: links)")
+    parser.add_argument("--no-cache", action="store_true", help="always download and parse from scratch")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help=f"HTTP cache location (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help=f"HTTP cache size limit in MB (default: {DEFAULT_MAX_BYTES // 2**20})")
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else HTTPCache(Path(args.cache_dir) / "http.sqlite", int(args.cache_mb * 2**20))
+    pipeline = Pipeline([open_sink(args.output)], **RECORD_TYPES[args.records]) if args.output else None
+    try:
+        if args.crawl:
+            crawl(args.url, args, cache, pipeline)
+        else:
+            extraction = Extraction(args.parser, links=not args.no_links, paragraphs=args.paragraphs,
+                                    selectors=args.select, limit=args.limit)
+            scrape(args.url, extraction, cache, pipeline, args.records)
+            if pipeline is not None:
+                pipeline.close()
+    finally:
+        if cache is not None:
+            print(cache.report(), file=sys.stderr)
+            cache.close()
+    if pipeline is not None:
+        stats = pipeline.stats()
+        print(f"[OK] {stats['written']:,} {args.records} records written to {args.output} "
+              f"({stats['duplicates']:,} duplicates dropped)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()